@@ -357,6 +357,16 @@ def _empty_signal_result(domain: str) -> dict:
     }
 
 
+async def _read_capped_body(response: httpx.Response, max_bytes: int) -> bytearray:
+    """Stream at most max_bytes of the response body into one growing buffer."""
+    raw = bytearray()
+    async for chunk in response.aiter_bytes():
+        raw += chunk[:max_bytes - len(raw)]
+        if len(raw) >= max_bytes:
+            break
+    return raw
+
+
 async def _fetch_homepage_excerpt(
     client: httpx.AsyncClient,
     domain: str,
@@ -374,19 +384,7 @@ async def _fetch_homepage_excerpt(
                 if response.status_code >= 400:
                     last_status = status_label
                     continue
-                chunks: list[bytes] = []
-                total = 0
-                async for chunk in response.aiter_bytes():
-                    if not chunk:
-                        continue
-                    remaining = max_bytes - total
-                    if remaining <= 0:
-                        break
-                    chunks.append(chunk[:remaining])
-                    total += min(len(chunk), remaining)
-                    if total >= max_bytes:
-                        break
-                raw = b"".join(chunks)
+                raw = await _read_capped_body(response, max_bytes)
                 if not raw:
                     last_status = "empty_response"
                     continue
@@ -428,19 +426,7 @@ async def _fetch_homepage_excerpt(
                     if response.status_code >= 300:
                         last_status = status_label
                         continue
-                    chunks: list[bytes] = []
-                    total = 0
-                    async for chunk in response.aiter_bytes():
-                        if not chunk:
-                            continue
-                        remaining = max_bytes - total
-                        if remaining <= 0:
-                            break
-                        chunks.append(chunk[:remaining])
-                        total += min(len(chunk), remaining)
-                        if total >= max_bytes:
-                            break
-                    raw = b"".join(chunks)
+                    raw = await _read_capped_body(response, max_bytes)
                     if not raw:
                         last_status = "empty_response_via_ip"
                         continue
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
+import os
 import random
 import re
 import time
@@ -12,9 +12,11 @@ from pathlib import Path
 from typing import Any, Optional, Callable
 from urllib.parse import urlsplit
 
+import orjson
 import polars as pl
 import pyarrow as pa
 import pyarrow.parquet as pq
+from curl_cffi import CurlHttpVersion, CurlOpt
 from curl_cffi.requests import AsyncSession
 from selectolax.parser import HTMLParser
 from sklearn.feature_extraction.text import TfidfVectorizer
@@ -32,6 +34,8 @@ DEFAULT_PHASE1_RETRY = 2
 DEFAULT_PHASE2_CONCURRENCY = 80
 DEFAULT_PHASE2_TIMEOUT = 15.0
 DEFAULT_KEYWORD_COUNT = 20
+PARQUET_ROW_GROUP_ROWS = 16384
+PROGRESS_UPDATE_INTERVAL_SECONDS = 0.1
 
 RANDOM_VIEWPORTS = [
     {"width": 1280, "height": 720},
@@ -160,14 +164,11 @@ def load_targets(input_path: Path, domain_column: Optional[str] = None) -> list[
     return list(deduped.values())
 
 
-def parse_html_fields(html: str) -> dict[str, str]:
+def parse_html_fields(html: str | bytes) -> dict[str, str]:
+    # Raw bytes go straight to the parser, which sniffs the encoding in C.
     parser = HTMLParser(html or "")
-
-    for node in parser.css("script,style,noscript,svg"):
-        try:
-            node.decompose()
-        except Exception:
-            continue
+    # Bulk-remove non-content nodes in one C-level pass before any selector runs.
+    parser.strip_tags(["script", "style", "noscript", "svg"])
 
     def _meta(selector: str) -> str:
         node = parser.css_first(selector)
@@ -199,35 +200,60 @@ def parse_html_fields(html: str) -> dict[str, str]:
 
 
 class ParquetBatchWriter:
-    def __init__(self, path: Path, schema: pa.Schema):
+    def __init__(self, path: Path, schema: pa.Schema, row_group_rows: int = PARQUET_ROW_GROUP_ROWS):
         self.path = path
         self.schema = schema
-        self.writer = pq.ParquetWriter(str(path), schema=schema, compression="zstd")
+        self.row_group_rows = max(1, int(row_group_rows))
+        self.writer = pq.ParquetWriter(
+            str(path),
+            schema=schema,
+            compression="zstd",
+            write_batch_size=4096,
+            data_page_size=1024 * 1024,
+        )
+        self._pending: list[dict] = []
 
     def write(self, rows: list[dict]):
         if not rows:
             return
-        table = pa.Table.from_pylist(rows, schema=self.schema)
-        self.writer.write_table(table)
+        # Callers hand over small batches; buffer them so each flush lands as
+        # one reasonably sized row group instead of many tiny ones.
+        self._pending.extend(rows)
+        if len(self._pending) >= self.row_group_rows:
+            self.flush()
+
+    def flush(self):
+        if not self._pending:
+            return
+        batch = pa.RecordBatch.from_pylist(self._pending, schema=self.schema)
+        self._pending = []
+        self.writer.write_batch(batch)
 
     def close(self):
-        self.writer.close()
+        try:
+            self.flush()
+        finally:
+            self.writer.close()
 
 
 def read_processed_urls(path: Path) -> set[str]:
     if not path.exists():
         return set()
     try:
-        table = pq.read_table(str(path), columns=["url"])
+        urls = pl.read_parquet(str(path), columns=["url"])["url"]
     except Exception:
         return set()
-    values = table.column("url").to_pylist()
-    return {str(v or "").strip() for v in values if str(v or "").strip()}
+    # Strip and dedupe in Rust so only distinct URLs cross into Python.
+    urls = urls.drop_nulls().str.strip_chars()
+    return set(urls.filter(urls != "").unique().to_list())
 
 
 def write_state(path: Path, payload: dict):
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    # Write-then-rename so external monitors never observe a torn state file.
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, path)
 
 
 async def fetch_with_curl(
@@ -235,11 +261,12 @@ async def fetch_with_curl(
     target: Target,
     timeout_seconds: float,
     retry_count: int,
+    user_agent: Optional[str] = None,
 ) -> dict:
     last_error = ""
     last_status = 0
     headers = {
-        "User-Agent": random.choice(UA_POOL),
+        "User-Agent": user_agent or random.choice(UA_POOL),
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         "Accept-Encoding": "gzip, deflate, br",
     }
@@ -253,7 +280,7 @@ async def fetch_with_curl(
             )
             last_status = int(response.status_code or 0)
             if 200 <= last_status < 400:
-                fields = parse_html_fields(response.text or "")
+                fields = parse_html_fields(response.content or b"")
                 return {
                     "domain": target.domain,
                     "url": target.url,
@@ -321,21 +348,35 @@ async def run_phase1_async(
     failures_writer = ParquetBatchWriter(failures_path, PARQUET_SCHEMA)
     progress = tqdm(total=len(pending), desc="Phase 1 scrape", unit="domain")
     started_at = time.time()
+    last_progress_at = 0.0
     success_count = 0
     fail_count = 0
     processed_count = 0
 
     try:
-        async with AsyncSession(impersonate="chrome124", timeout=timeout_seconds, verify=False) as session:
+        # One curl handle per concurrent slot (the session default is 10), with
+        # HTTP/2 negotiated over TLS so requests to a shared origin (CDN-hosted
+        # pages, retries) multiplex onto an existing connection.
+        async with AsyncSession(
+            impersonate="chrome124",
+            timeout=timeout_seconds,
+            verify=False,
+            max_clients=max(1, int(concurrency)),
+            http_version=CurlHttpVersion.V2TLS,
+            curl_options={CurlOpt.PIPEWAIT: 1},
+        ) as session:
             sem = asyncio.Semaphore(max(1, int(concurrency)))
+            # Roll every User-Agent up front instead of hitting the RNG per request.
+            user_agents = iter(random.choices(UA_POOL, k=len(pending)))
 
-            async def _bounded_fetch(target: Target):
+            async def _bounded_fetch(target: Target, user_agent: str):
                 async with sem:
                     return await fetch_with_curl(
                         session=session,
                         target=target,
                         timeout_seconds=timeout_seconds,
                         retry_count=retry_count,
+                        user_agent=user_agent,
                     )
 
             chunk_size = max(2000, min(10000, concurrency * 12))
@@ -343,7 +384,7 @@ async def run_phase1_async(
             batch_failures: list[dict] = []
             for start in range(0, len(pending), chunk_size):
                 chunk = pending[start:start + chunk_size]
-                tasks = [asyncio.create_task(_bounded_fetch(target)) for target in chunk]
+                tasks = [asyncio.create_task(_bounded_fetch(target, next(user_agents))) for target in chunk]
                 for future in asyncio.as_completed(tasks):
                     row = await future
                     processed_count += 1
@@ -363,22 +404,27 @@ async def run_phase1_async(
                         failures_writer.write(batch_failures)
                         batch_failures.clear()
 
-                    elapsed = max(0.001, time.time() - started_at)
-                    if progress_callback:
-                        progress_callback({
-                            "phase": "phase1",
-                            "processed": processed_count,
-                            "total": len(pending),
+                    # Throttle progress reporting; at full concurrency this
+                    # loop completes hundreds of requests per second.
+                    now = time.time()
+                    if now - last_progress_at >= PROGRESS_UPDATE_INTERVAL_SECONDS:
+                        last_progress_at = now
+                        elapsed = max(0.001, now - started_at)
+                        if progress_callback:
+                            progress_callback({
+                                "phase": "phase1",
+                                "processed": processed_count,
+                                "total": len(pending),
+                                "ok": success_count,
+                                "fail": fail_count,
+                                "ratePerSec": float(processed_count / elapsed),
+                                "done": False,
+                            })
+                        progress.set_postfix({
                             "ok": success_count,
                             "fail": fail_count,
-                            "ratePerSec": float(processed_count / elapsed),
-                            "done": False,
+                            "rate/s": f"{processed_count / elapsed:.1f}",
                         })
-                    progress.set_postfix({
-                        "ok": success_count,
-                        "fail": fail_count,
-                        "rate/s": f"{processed_count / elapsed:.1f}",
-                    })
                     if processed_count % 500 == 0:
                         write_state(state_path, {
                             "phase": "phase1",
@@ -435,7 +481,6 @@ async def run_phase2_fallback(
     timeout_seconds: float = DEFAULT_PHASE2_TIMEOUT,
     progress_callback: Optional[Callable[[dict], None]] = None,
 ):
-    phase1_rows = _records_from_parquet(phase1_path)
     failure_rows = _records_from_parquet(failures_path)
     if not failure_rows:
         if phase1_path.exists() and not merged_path.exists():
@@ -465,6 +510,7 @@ async def run_phase2_fallback(
     phase2_writer = ParquetBatchWriter(phase2_path, PARQUET_SCHEMA)
     progress = tqdm(total=len(failure_rows), desc="Phase 2 fallback", unit="domain")
     started_at = time.time()
+    last_progress_at = 0.0
     processed_count = 0
     success_count = 0
     fail_count = 0
@@ -477,7 +523,7 @@ async def run_phase2_fallback(
         )
 
         async def _worker():
-            nonlocal processed_count, success_count, fail_count
+            nonlocal processed_count, success_count, fail_count, last_progress_at
             context = await browser.new_context(
                 user_agent=random.choice(UA_POOL),
                 viewport=random.choice(RANDOM_VIEWPORTS),
@@ -551,22 +597,25 @@ async def run_phase2_fallback(
                 phase2_rows.append(row)
                 processed_count += 1
                 progress.update(1)
-                elapsed = max(0.001, time.time() - started_at)
-                if progress_callback:
-                    progress_callback({
-                        "phase": "phase2",
-                        "processed": processed_count,
-                        "total": len(failure_rows),
+                now = time.time()
+                if now - last_progress_at >= PROGRESS_UPDATE_INTERVAL_SECONDS:
+                    last_progress_at = now
+                    elapsed = max(0.001, now - started_at)
+                    if progress_callback:
+                        progress_callback({
+                            "phase": "phase2",
+                            "processed": processed_count,
+                            "total": len(failure_rows),
+                            "ok": success_count,
+                            "fail": fail_count,
+                            "ratePerSec": float(processed_count / elapsed),
+                            "done": False,
+                        })
+                    progress.set_postfix({
                         "ok": success_count,
                         "fail": fail_count,
-                        "ratePerSec": float(processed_count / elapsed),
-                        "done": False,
+                        "rate/s": f"{processed_count / elapsed:.1f}",
                     })
-                progress.set_postfix({
-                    "ok": success_count,
-                    "fail": fail_count,
-                    "rate/s": f"{processed_count / elapsed:.1f}",
-                })
                 if len(phase2_rows) >= 250:
                     phase2_writer.write(phase2_rows)
                     phase2_rows.clear()
@@ -611,24 +660,28 @@ async def run_phase2_fallback(
             "done": True,
         })
 
-    # Merge fallback successes into phase1 records.
-    phase2_all = _records_from_parquet(phase2_path)
-    success_map = {
-        str(row.get("url") or ""): row
-        for row in phase2_all
-        if str(row.get("status") or "") == "ok"
-    }
-    merged_rows = []
-    for row in phase1_rows:
-        key = str(row.get("url") or "")
-        if key in success_map and str(row.get("status") or "") != "ok":
-            merged_rows.append(success_map[key])
-        else:
-            merged_rows.append(row)
+    merge_phase_results(phase1_path, phase2_path, merged_path)
 
-    merged_writer = ParquetBatchWriter(merged_path, PARQUET_SCHEMA)
-    merged_writer.write(merged_rows)
-    merged_writer.close()
+
+def merge_phase_results(phase1_path: Path, phase2_path: Path, merged_path: Path):
+    """Replace failed phase 1 rows with their phase 2 successes, streaming in Polars."""
+    schema_cols = PARQUET_SCHEMA.names
+    successes = (
+        pl.scan_parquet(str(phase2_path))
+        .filter(pl.col("status") == "ok")
+        .unique(subset=["url"], keep="last")
+        .select([pl.col(col).alias(f"{col}__p2") for col in schema_cols])
+    )
+    replace = pl.col("url__p2").is_not_null() & (pl.col("status").fill_null("") != "ok")
+    (
+        pl.scan_parquet(str(phase1_path))
+        .join(successes, left_on="url", right_on="url__p2", how="left", coalesce=False, maintain_order="left")
+        .select([
+            pl.when(replace).then(pl.col(f"{col}__p2")).otherwise(pl.col(col)).alias(col)
+            for col in schema_cols
+        ])
+        .sink_parquet(str(merged_path), compression="zstd")
+    )
 
 
 def extract_keywords(merged_path: Path, enriched_path: Path, top_k: int = DEFAULT_KEYWORD_COUNT, write_csv: bool = True):
@@ -657,13 +710,31 @@ def extract_keywords(merged_path: Path, enriched_path: Path, top_k: int = DEFAUL
             pl.col("body_text")
         ).alias("corpus")
     )
-    corpus = frame["corpus"].to_list()
+    # Tokenize once in Polars; both the TF-IDF path and the fallback consume the
+    # space-joined tokens, so sklearn only has to split on whitespace.
+    corpus = (
+        frame["corpus"]
+        .str.to_lowercase()
+        .str.extract_all(r"[a-z][a-z0-9_-]{2,}")
+        .list.join(" ")
+        .fill_null("")
+        .to_list()
+    )
 
     keywords: list[str] = []
     try:
-        vectorizer = TfidfVectorizer(stop_words="english", max_features=80000, ngram_range=(1, 2), min_df=2)
+        vectorizer = TfidfVectorizer(
+            stop_words="english",
+            max_features=80000,
+            ngram_range=(1, 2),
+            min_df=2,
+            lowercase=False,
+            tokenizer=str.split,
+            token_pattern=None,
+        )
         matrix = vectorizer.fit_transform(corpus)
-        vocab = vectorizer.get_feature_names_out()
+        # Plain list lookups are cheaper than indexing a NumPy object array per token.
+        vocab: list[str] = vectorizer.get_feature_names_out().tolist()
         # Use numpy argsort on the CSR matrix for fast top-k per row
         import numpy as np
         csr = matrix.tocsr()
@@ -679,13 +750,11 @@ def extract_keywords(merged_path: Path, enriched_path: Path, top_k: int = DEFAUL
             else:
                 top_idx = np.argpartition(row_data, -top_k)[-top_k:]
                 top_idx = top_idx[np.argsort(row_data[top_idx])[::-1]]
-            tokens = [str(vocab[row_indices[j]]) for j in top_idx]
-            keywords.append(", ".join(tokens))
+            keywords.append(", ".join([vocab[k] for k in row_indices[top_idx].tolist()]))
     except Exception:
         # Conservative fallback if TF-IDF fails.
-        token_re = re.compile(r"[a-zA-Z][a-zA-Z0-9_-]{2,}")
         for text in corpus:
-            tokens = token_re.findall(str(text or "").lower())
+            tokens = text.split()
             seen = []
             used = set()
             for token in tokens:
@@ -7,30 +7,42 @@ Includes async concurrent domain liveness verification.
 
 import asyncio
 import argparse
+import base64
+import hashlib
+import heapq
 import io
 import json
 import os
 import pickle
 import re
+import secrets
 import shutil
 import ssl
+import statistics
 import sys
 import tempfile
+import threading
 import time
 import traceback
+import weakref
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from uuid import uuid4
-from typing import Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Optional
 from pathlib import Path
 from urllib.parse import urlsplit
 
 import aiohttp
+import numpy as np
+import orjson
 import polars as pl
 from fastapi import FastAPI, File, UploadFile, Form, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 # Import DNS-based domain validation
 from domain_validator import check_domains_dns_batch, get_cdn_reference_data
@@ -69,27 +81,65 @@ FONTS_DIR = APP_BASE_DIR / "resources" / "fonts"
 SESSION_TTL_SECONDS = 60 * 60 * 24 * 30
 SESSION_STORE: dict[str, dict] = {}
 SESSION_STORE_DIR = DATA_DIR / "session_store"
-SESSION_FILE_SUFFIX = ".session.pkl"
+SESSION_FILE_SUFFIX = ".session.json"
+LEGACY_SESSION_FILE_SUFFIX = ".session.pkl"
+CSV_PARSE_CACHE_DIR = DATA_DIR / "csv_parse_cache"
+CSV_PARSE_CACHE_MIN_BYTES = 1024 * 1024
+CSV_PARSE_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+# Part of every cache file name; bump whenever _parse_csv_bytes or
+# sanitize_column_names can produce a different frame for the same bytes.
+CSV_PARSE_CACHE_VERSION = 2
+# Codec for the session dataframe snapshot; lz4 keeps interactive saves cheap.
+PARQUET_CODEC = str(os.getenv("HOUND_PARQUET_CODEC") or "lz4").strip().lower()
 APP_BOOT_TS = time.time()
 
 
 def _refresh_data_paths_from_env() -> None:
-    global DATA_DIR, SESSION_STORE_DIR, SCRAPE_JOB_DIR
+    global DATA_DIR, SESSION_STORE_DIR, SCRAPE_JOB_DIR, CSV_PARSE_CACHE_DIR
     DATA_DIR = _resolve_data_dir_from_env()
     SESSION_STORE_DIR = DATA_DIR / "session_store"
     SCRAPE_JOB_DIR = DATA_DIR / "scrape_jobs"
+    CSV_PARSE_CACHE_DIR = DATA_DIR / "csv_parse_cache"
 
-UPLOAD_CHUNK_SIZE = 1024 * 1024
 MAX_UPLOAD_BYTES = 1024 * 1024 * 1024  # 1 GB limit (supports 600k+ rows)
 PREVIEW_ROW_LIMIT = 8
 TYPE_SAMPLE_LIMIT = 250
 VALUE_SAMPLE_SCAN_LIMIT = 5000
 VALUE_SAMPLE_LIMIT = 50
+CSV_SNIFF_BYTES = 64 * 1024
+CSV_NULL_VALUES = ["", "null", "NULL", "n/a", "N/A", "na", "NA"]
+CSV_SNIFF_LINES = 20
 
 _EMAIL_TYPE_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 URL_RE = re.compile(r"^(?:https?://|www\.)", re.IGNORECASE)
 DOMAIN_RE = re.compile(r"^[a-z0-9][a-z0-9.-]+\.[a-z]{2,}(?:/.*)?$", re.IGNORECASE)
 NUMERIC_RE = re.compile(r"^-?\d+(?:[.,]\d+)?$")
+_LINK_TYPE_RE = re.compile(rf"{URL_RE.pattern}|{DOMAIN_RE.pattern}", re.IGNORECASE)
+# Shape gate for looks_like_date (after / and . are folded to -): every accepted
+# strptime format starts with digit-digit-digit groups, so anything else is rejected
+# without trying the formats.
+_DATE_SHAPE_RE = re.compile(r"^\d{1,4}-\s?\d{1,2}-\s?\d{1,4}")
+_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%m-%d-%Y",
+    "%d-%m-%Y",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S%z",
+)
+# Placeholder cell values treated as "no value". Key extraction drops the full
+# set; the TLD filter and single-domain check only skip their historical subsets.
+_PLACEHOLDER_KEYS = frozenset({"unknown", "n/a", "none", "null"})
+_PLACEHOLDER_VALUES = _PLACEHOLDER_KEYS | {""}
+_TLD_BLANK_VALUES = frozenset({"", "unknown", "n/a"})
+_NO_DOMAIN_VALUES = frozenset({"", "unknown", "n/a", "none"})
+# Splitters/cleaners used per value by the payload parsers and key normalizers.
+_MULTIVALUE_SPLIT_RE = re.compile(r"[,\n;|]+")
+_COMMA_NL_SPLIT_RE = re.compile(r"[,\n]+")
+_WS_COMMA_SPLIT_RE = re.compile(r"[\s,]+")
+_NONALNUM_RE = re.compile(r"[^a-z0-9]+")
+_WS_RE = re.compile(r"\s+")
+_TLD_DISALLOWED_CHARS_RE = re.compile(r"[^a-z0-9.-]")
 BLOCKED_DOMAIN_CATEGORIES = {
     "blogs": [
         "wordpress.com", "blogspot.com", "medium.com", "ghost.io",
@@ -126,6 +176,12 @@ BLOCKED_DOMAIN_CATEGORIES = {
         "bigcartel.com",
     ],
 }
+# Blocked suffix -> category label; built in reverse so the first category listing a suffix wins.
+BLOCKED_DOMAIN_CATEGORY_BY_SUFFIX: dict[str, str] = {
+    domain: category
+    for category, domains in reversed(list(BLOCKED_DOMAIN_CATEGORIES.items()))
+    for domain in domains
+}
 
 # Country name normalization for geo_country match type
 COUNTRY_ALIASES = {
@@ -164,6 +220,13 @@ def normalize_country(value: str) -> str:
     v = str(value or "").strip().lower()
     return COUNTRY_ALIASES.get(v, v.upper()[:2] if len(v) == 2 else v)
 
+
+def normalize_country_expr(expr: pl.Expr) -> pl.Expr:
+    """Vectorized normalize_country over a Utf8 expression (nulls normalize like "")."""
+    v = expr.fill_null("").str.strip_chars().str.to_lowercase()
+    fallback = pl.when(v.str.len_chars() == 2).then(v.str.to_uppercase().str.slice(0, 2)).otherwise(v)
+    return v.replace_strict(COUNTRY_ALIASES, default=fallback, return_dtype=pl.Utf8)
+
 RESOLVED_IPS_COLUMN = "resolved_ips"
 HTML_LANG_COLUMN = "html_lang"
 CURRENCY_SIGNALS_COLUMN = "currency_signals"
@@ -223,6 +286,13 @@ async def startup_event():
     _load_persisted_sessions()
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Write any session snapshots still waiting on the persist debounce."""
+    flush_pending_persists()
+    await close_domain_check_resolver()
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -268,14 +338,18 @@ def _prepare_runtime_data_layout() -> None:
 
     legacy_session_store = APP_BASE_DIR / "session_store"
     if legacy_session_store.exists() and legacy_session_store.is_dir():
-        for path in legacy_session_store.glob(f"*{SESSION_FILE_SUFFIX}"):
-            target = SESSION_STORE_DIR / path.name
-            if target.exists():
-                continue
-            try:
-                shutil.copy2(path, target)
-            except Exception:
-                traceback.print_exc()
+        for suffix in (SESSION_FILE_SUFFIX, LEGACY_SESSION_FILE_SUFFIX):
+            for path in legacy_session_store.glob(f"*{suffix}"):
+                target = SESSION_STORE_DIR / path.name
+                if target.exists():
+                    continue
+                try:
+                    shutil.copy2(path, target)
+                    blob_dir = legacy_session_store / path.name[: -len(suffix)]
+                    if blob_dir.is_dir():
+                        shutil.copytree(blob_dir, SESSION_STORE_DIR / blob_dir.name, dirs_exist_ok=True)
+                except Exception:
+                    traceback.print_exc()
 
 def ensure_csv_filename(file_name: Optional[str]) -> None:
     """Validate incoming file extension for CSV-focused flows."""
@@ -287,53 +361,53 @@ def ensure_csv_filename(file_name: Optional[str]) -> None:
 
 
 async def read_upload_bytes(file: UploadFile, max_bytes: int = MAX_UPLOAD_BYTES) -> bytes:
-    """Read uploaded file in chunks with explicit size guard."""
+    """Read uploaded file into a single buffer with explicit size guard."""
     ensure_csv_filename(file.filename)
-    chunks: list[bytes] = []
-    total = 0
-    while True:
-        chunk = await file.read(UPLOAD_CHUNK_SIZE)
-        if not chunk:
-            break
-        total += len(chunk)
-        if total > max_bytes:
-            raise HTTPException(
-                status_code=413,
-                detail=f"Upload exceeds {max_bytes // (1024 * 1024)}MB limit.",
-            )
-        chunks.append(chunk)
-    raw = b"".join(chunks)
+    # The multipart parser has already spooled the body to a temp file, so size
+    # it there and read it back once rather than concatenating chunks in memory.
+    size = file.size
+    if size is None:
+        file.file.seek(0, os.SEEK_END)
+        size = file.file.tell()
+    if size > max_bytes:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Upload exceeds {max_bytes // (1024 * 1024)}MB limit.",
+        )
+    await file.seek(0)
+    raw = await file.read()
     if not raw:
         raise HTTPException(status_code=400, detail="Uploaded file is empty.")
     return raw
 
 
 def detect_csv_separator(raw: bytes) -> str:
-    """Infer likely CSV delimiter from early lines."""
-    probe = raw[:8192].decode("utf-8-sig", errors="replace")
-    lines = [ln for ln in probe.splitlines()[:5] if ln.strip()]
+    """Infer likely CSV delimiter from early lines, preferring stable per-line counts."""
+    probe = raw[:CSV_SNIFF_BYTES].decode("utf-8-sig", errors="replace")
+    lines = probe.splitlines()
+    if len(raw) > CSV_SNIFF_BYTES and len(lines) > 1:
+        lines = lines[:-1]  # Last line is likely cut mid-row.
+    lines = [ln for ln in lines[:CSV_SNIFF_LINES] if ln.strip()]
     if not lines:
         return ","
     candidates = [",", ";", "\t", "|"]
     scores = {}
     for sep in candidates:
         counts = [line.count(sep) for line in lines]
-        scores[sep] = (sum(counts), max(counts) if counts else 0)
-    best = max(candidates, key=lambda sep: (scores[sep][0], scores[sep][1]))
+        scores[sep] = (sum(counts), -statistics.pvariance(counts), max(counts))
+    best = max(candidates, key=lambda sep: scores[sep])
     return best if scores[best][0] > 0 else ","
 
 
 def sanitize_column_names(columns: list[str]) -> list[str]:
     """Normalize blank/duplicate headers while preserving readability."""
-    seen: dict[str, int] = {}
+    seen: defaultdict[str, int] = defaultdict(int)
     normalized = []
     for idx, raw_name in enumerate(columns, start=1):
-        base = (raw_name or "").strip()
-        if not base:
-            base = f"column_{idx}"
-        key = base.lower()
-        count = seen.get(key, 0) + 1
-        seen[key] = count
+        base = (raw_name or "").strip() or f"column_{idx}"
+        key = base.casefold()
+        seen[key] += 1
+        count = seen[key]
         normalized.append(base if count == 1 else f"{base}_{count}")
     return normalized
 
@@ -365,21 +439,36 @@ def parse_numeric_value(value: str) -> Optional[float]:
         return None
 
 
+def parse_numeric_expr(expr: pl.Expr) -> pl.Expr:
+    """
+    Vectorized parse_numeric_value over a Utf8 expression (null where unparseable).
+    Unlike float(), the Polars cast rejects underscore digit grouping and non-ASCII digits.
+    """
+    cleaned = expr.str.replace_all(r"[$% ]", "")
+    has_comma = cleaned.str.contains(",", literal=True)
+    has_dot = cleaned.str.contains(".", literal=True)
+    normalized = (
+        # EU style: 1.234,56 (last separator is a comma)
+        pl.when(has_comma & has_dot & cleaned.str.contains(r",[^.,]*$"))
+        .then(cleaned.str.replace_all(".", "", literal=True).str.replace_all(",", ".", literal=True))
+        # Single decimal comma: 12,5
+        .when(has_comma & ~has_dot & cleaned.str.contains(r"^[^,]*,[^,]{0,2}$"))
+        .then(cleaned.str.replace(",", ".", literal=True))
+        # US style / thousands separators: 1,234.56, 1,234
+        .otherwise(cleaned.str.replace_all(",", "", literal=True))
+    )
+    return normalized.cast(pl.Float64, strict=False)
+
+
 def looks_like_date(value: str) -> bool:
     """Check whether a scalar resembles a date/time string."""
     raw = str(value).strip()
     if not raw:
         return False
     sample = raw.replace("/", "-").replace(".", "-")
-    fmts = (
-        "%Y-%m-%d",
-        "%m-%d-%Y",
-        "%d-%m-%Y",
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%dT%H:%M:%S%z",
-    )
-    for fmt in fmts:
+    if not _DATE_SHAPE_RE.match(sample):
+        return False
+    for fmt in _DATE_FORMATS:
         try:
             datetime.strptime(sample, fmt)
             return True
@@ -388,32 +477,81 @@ def looks_like_date(value: str) -> bool:
     return False
 
 
-def sample_distinct_values(series: pl.Series, limit: int = VALUE_SAMPLE_LIMIT, scan_limit: int = VALUE_SAMPLE_SCAN_LIMIT) -> list[str]:
-    """Collect an ordered distinct sample without materializing full unique sets."""
-    out: list[str] = []
-    seen: set[str] = set()
-    for value in series.head(scan_limit).to_list():
-        if value is None:
-            continue
-        text = str(value).strip()
-        if not text:
-            continue
-        if text in seen:
+def _csv_parse_cache_path(raw: bytes) -> Path:
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    return CSV_PARSE_CACHE_DIR / f"{digest}.v{CSV_PARSE_CACHE_VERSION}.arrow"
+
+
+def _evict_csv_parse_cache() -> None:
+    """Drop entries from older parser versions, then least recently used entries
+    once the cache exceeds its size cap."""
+    entries = []
+    current_suffix = f".v{CSV_PARSE_CACHE_VERSION}.arrow"
+    for path in CSV_PARSE_CACHE_DIR.glob("*.arrow"):
+        try:
+            if not path.name.endswith(current_suffix):
+                path.unlink()
+                continue
+            stat = path.stat()
+        except OSError:
             continue
-        seen.add(text)
-        out.append(text)
-        if len(out) >= limit:
+        entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= CSV_PARSE_CACHE_MAX_BYTES:
             break
-    return out
+        try:
+            path.unlink()
+            total -= size
+        except OSError:
+            continue
+
+
+def _purge_csv_parse_cache(file_names: Iterable[str]) -> None:
+    """Remove parse-cache entries by file name (see _write_session_blobs)."""
+    for file_name in file_names:
+        name = Path(str(file_name)).name
+        if name.endswith(".arrow"):
+            (CSV_PARSE_CACHE_DIR / name).unlink(missing_ok=True)
 
 
 def read_csv_bytes(raw: bytes) -> pl.DataFrame:
-    """Read CSV bytes with delimiter detection and resilient parsing."""
+    """
+    Read CSV bytes with delimiter detection and resilient parsing.
+    Larger files are cached as Arrow IPC keyed by content hash and parser
+    version, so re-uploads and session restores skip the CSV parse. Entries
+    are removed with the session that uploaded them (see _remove_session_files).
+    """
+    if len(raw) < CSV_PARSE_CACHE_MIN_BYTES:
+        return _parse_csv_bytes(raw)
+
+    cache_path = _csv_parse_cache_path(raw)
+    try:
+        df = pl.read_ipc(cache_path, memory_map=False)
+        os.utime(cache_path)
+        return df
+    except Exception:
+        pass
+
+    df = _parse_csv_bytes(raw)
+    try:
+        CSV_PARSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_suffix(f".{secrets.token_hex(16)}.tmp")
+        df.write_ipc(tmp, compression="lz4")
+        tmp.replace(cache_path)
+        _evict_csv_parse_cache()
+    except Exception:
+        traceback.print_exc()
+    return df
+
+
+def _parse_csv_bytes(raw: bytes) -> pl.DataFrame:
     separator_hint = detect_csv_separator(raw)
     separators = [separator_hint] + [sep for sep in [",", ";", "\t", "|"] if sep != separator_hint]
     read_errors = []
-    parsed_candidates: list[tuple[str, pl.DataFrame]] = []
 
+    # Parse once with the sniffed separator; other candidates are only tried
+    # when the parser itself rejects the input.
     for sep in separators:
         try:
             df = pl.read_csv(
@@ -423,25 +561,16 @@ def read_csv_bytes(raw: bytes) -> pl.DataFrame:
                 try_parse_dates=False,
                 truncate_ragged_lines=True,
                 ignore_errors=True,
-                null_values=["", "null", "NULL", "n/a", "N/A", "na", "NA"],
+                null_values=CSV_NULL_VALUES,
             )
-            if df.width > 0:
-                parsed_candidates.append((sep, df))
         except Exception as exc:
             read_errors.append(str(exc))
-
-    if parsed_candidates:
-        # Prefer parses with more than one column; among those pick the widest schema.
-        multi_col = [(sep, df) for sep, df in parsed_candidates if df.width > 1]
-        chosen_sep, chosen_df = max(
-            multi_col if multi_col else parsed_candidates,
-            key=lambda item: item[1].width,
-        )
-        _ = chosen_sep  # Reserved for future diagnostics.
-        cleaned_names = sanitize_column_names(chosen_df.columns)
-        if cleaned_names != chosen_df.columns:
-            chosen_df = chosen_df.rename(dict(zip(chosen_df.columns, cleaned_names)))
-        return chosen_df
+            continue
+        if df.width > 0:
+            cleaned_names = sanitize_column_names(df.columns)
+            if cleaned_names != df.columns:
+                df = df.rename(dict(zip(df.columns, cleaned_names)))
+            return df
 
     # Final fallback with forgiving UTF-8 decode.
     text = raw.decode("utf-8-sig", errors="replace")
@@ -460,6 +589,41 @@ def read_csv_bytes(raw: bytes) -> pl.DataFrame:
     return df
 
 
+CSV_PARSE_MAX_WORKERS = 8
+
+
+def read_csv_bytes_many(raws: list[bytes]) -> list[pl.DataFrame]:
+    """Parse several CSV payloads in parallel threads (the Polars reader releases the GIL)."""
+    if len(raws) <= 1:
+        return [read_csv_bytes(raw) for raw in raws]
+    with ThreadPoolExecutor(max_workers=min(CSV_PARSE_MAX_WORKERS, len(raws))) as pool:
+        return list(pool.map(read_csv_bytes, raws))
+
+
+def scan_csv_bytes(raw: bytes) -> pl.LazyFrame:
+    """
+    Lazily scan CSV bytes so callers can project the columns they need before
+    the body is parsed. Falls back to the eager reader when the scan fails.
+    """
+    try:
+        lf = pl.scan_csv(
+            raw,
+            separator=detect_csv_separator(raw),
+            infer_schema_length=500,
+            try_parse_dates=False,
+            truncate_ragged_lines=True,
+            ignore_errors=True,
+            null_values=CSV_NULL_VALUES,
+            encoding="utf8-lossy",
+            with_column_names=sanitize_column_names,
+        )
+        if lf.collect_schema().len() > 0:
+            return lf
+    except Exception:
+        pass
+    return read_csv_bytes(raw).lazy()
+
+
 def infer_column_type(col_name: str, series: pl.Series) -> str:
     """Infer a lightweight semantic type for UI previews."""
     name = (col_name or "").lower()
@@ -470,26 +634,32 @@ def infer_column_type(col_name: str, series: pl.Series) -> str:
     if any(k in name for k in ("date", "time", "created", "updated")):
         return "date"
 
-    sample = [str(v).strip() for v in series.drop_nulls().head(TYPE_SAMPLE_LIMIT).to_list() if str(v).strip()]
-    if not sample:
+    sample = series.cast(pl.Utf8, strict=False).drop_nulls().head(TYPE_SAMPLE_LIMIT).str.strip_chars()
+    sample = sample.filter(sample != "")
+    total = sample.len()
+    if not total:
         return "text"
 
-    total = len(sample)
-    lower = [s.lower() for s in sample]
-    email_count = sum(1 for s in lower if _EMAIL_TYPE_RE.match(s))
-    link_count = sum(1 for s in lower if URL_RE.match(s) or DOMAIN_RE.match(s))
-    bool_count = sum(1 for s in lower if s in ("true", "false", "yes", "no", "1", "0"))
-    date_count = sum(1 for s in sample if looks_like_date(s))
-    numeric_count = sum(1 for s in sample if parse_numeric_value(s) is not None or NUMERIC_RE.match(s))
-
+    # Regex counts run as Polars string kernels; checks are ordered by
+    # precedence so later (Python-side) counts are skipped once a type wins.
+    lower = sample.str.to_lowercase()
+    email_count = int(lower.str.contains(_EMAIL_TYPE_RE.pattern).sum())
     if email_count / total >= 0.65:
         return "email"
+    link_count = int(lower.str.contains(_LINK_TYPE_RE.pattern).sum())
     if link_count / total >= 0.6:
         return "link"
+    date_candidates = sample.filter(sample.str.replace_all(r"[/.]", "-").str.contains(_DATE_SHAPE_RE.pattern))
+    date_count = sum(1 for s in date_candidates.to_list() if looks_like_date(s))
     if date_count / total >= 0.55:
         return "date"
+    bool_count = int(lower.is_in(["true", "false", "yes", "no", "1", "0"]).sum())
     if bool_count / total >= 0.8:
         return "boolean"
+    value = pl.col("value")
+    numeric_count = int(sample.to_frame("value").select(
+        (value.str.contains(NUMERIC_RE.pattern) | parse_numeric_expr(value).is_not_null()).sum()
+    ).item())
     if numeric_count / total >= 0.65:
         return "number"
     return "text"
@@ -556,72 +726,84 @@ HEADER_TOKEN_ALIASES = {
 GENERIC_HEADER_TOKENS = {"name", "type", "value", "id", "status", "date", "description"}
 
 
-def _tokenize_header_name(value: str) -> list[str]:
+@lru_cache(maxsize=4096)
+def _tokenize_header_name(value: str) -> tuple[str, ...]:
     raw = str(value or "").strip().lower()
     if not raw:
-        return []
-    collapsed = re.sub(r"[^a-z0-9]+", " ", raw).strip()
+        return ()
+    collapsed = _NONALNUM_RE.sub(" ", raw).strip()
     if not collapsed:
-        return []
-    tokens = []
-    for token in collapsed.split():
-        mapped = HEADER_TOKEN_ALIASES.get(token, token)
-        tokens.append(mapped)
-    return tokens
+        return ()
+    return tuple(HEADER_TOKEN_ALIASES.get(token, token) for token in collapsed.split())
 
 
+@lru_cache(maxsize=4096)
 def _normalize_header_name(value: str) -> str:
     return " ".join(_tokenize_header_name(value))
 
 
-def _header_match_score(
-    source_name: str,
-    source_type: str,
-    canonical_name: str,
-    canonical_type: str,
+def _header_match_matrix(
+    source_norms: list[str],
+    source_types: list[str],
+    canonical_norms: list[str],
+    canonical_types: list[str],
     match_threshold: float = 92.0,
-) -> tuple[float, str]:
-    source_norm = _normalize_header_name(source_name)
-    canonical_norm = _normalize_header_name(canonical_name)
-    if not source_norm or not canonical_norm:
-        return 0.0, "none"
-
-    if source_norm == canonical_norm:
-        return 100.0, "normalized_exact"
-
-    source_tokens = source_norm.split()
-    canonical_tokens = canonical_norm.split()
-    score = float(fuzz.token_set_ratio(source_norm, canonical_norm))
-    strategy = "fuzzy"
-
-    if (
-        len(source_tokens) == 1
-        and len(canonical_tokens) > 1
-        and source_tokens[0] in GENERIC_HEADER_TOKENS
-    ):
-        score -= 16
-    if (
-        len(canonical_tokens) == 1
-        and len(source_tokens) > 1
-        and canonical_tokens[0] in GENERIC_HEADER_TOKENS
-    ):
-        score -= 16
-
-    if source_type == canonical_type:
-        score += 2
-    elif source_type != "text" and canonical_type != "text":
-        score -= 12
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Score every normalized source header against every normalized canonical
+    header in one pass.
+    Returns (scores, strategies) matrices shaped (len(source), len(canonical)).
+    """
+    # Anything below the cutoff cannot reach the threshold even with the +2/+8 boosts.
+    score = process.cdist(
+        source_norms,
+        canonical_norms,
+        scorer=fuzz.token_set_ratio,
+        score_cutoff=max(0.0, match_threshold - 20),
+        dtype=np.float64,
+        workers=-1,
+    )
 
-    # Type-affinity boost for borderline matches (85-92 range)
-    if 85.0 <= score < match_threshold:
-        if source_type == canonical_type and source_type != "text":
-            score += 8
-            strategy = "type_boosted"
-        elif {source_type, canonical_type} <= {"link", "email"}:
-            score += 5
-            strategy = "type_boosted"
+    def _token_shape(norms: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        token_lists = [norm.split() for norm in norms]
+        single_generic = np.array(
+            [len(tokens) == 1 and tokens[0] in GENERIC_HEADER_TOKENS for tokens in token_lists],
+            dtype=bool,
+        )
+        multi_token = np.array([len(tokens) > 1 for tokens in token_lists], dtype=bool)
+        return single_generic, multi_token
 
-    return max(0.0, min(100.0, score)), strategy
+    src_generic, src_multi = _token_shape(source_norms)
+    can_generic, can_multi = _token_shape(canonical_norms)
+    score -= 16.0 * np.outer(src_generic, can_multi)
+    score -= 16.0 * np.outer(src_multi, can_generic)
+
+    src_types = np.array(source_types, dtype=object)[:, None]
+    can_types = np.array(canonical_types, dtype=object)[None, :]
+    same_type = src_types == can_types
+    src_typed = src_types != "text"
+    can_typed = can_types != "text"
+    score += np.where(same_type, 2.0, np.where(src_typed & can_typed, -12.0, 0.0))
+
+    # Type-affinity boost for borderline matches (85-92 range)
+    borderline = (score >= 85.0) & (score < match_threshold)
+    boost_same = borderline & same_type & src_typed
+    contact_types = np.isin(src_types, ("link", "email")) & np.isin(can_types, ("link", "email"))
+    boost_contact = borderline & ~boost_same & contact_types
+    score += 8.0 * boost_same + 5.0 * boost_contact
+    np.clip(score, 0.0, 100.0, out=score)
+
+    strategies = np.where(boost_same | boost_contact, "type_boosted", "fuzzy").astype(object)
+
+    src_norm_arr = np.array(source_norms, dtype=object)[:, None]
+    can_norm_arr = np.array(canonical_norms, dtype=object)[None, :]
+    exact = src_norm_arr == can_norm_arr
+    score[exact] = 100.0
+    strategies[exact] = "normalized_exact"
+    empty = (src_norm_arr == "") | (can_norm_arr == "")
+    score[empty] = 0.0
+    strategies[empty] = "none"
+    return score, strategies
 
 
 def merge_dataframes_with_schema_mapping(
@@ -646,46 +828,46 @@ def merge_dataframes_with_schema_mapping(
         if not isinstance(df, pl.DataFrame):
             continue
 
-        assigned_targets: set[str] = set()
         column_aliases: list[tuple[str, str]] = []
         mapped_columns: list[dict] = []
 
-        for col in df.columns:
-            inferred_type = infer_column_type(col, df[col].cast(pl.Utf8, strict=False))
+        source_types = [infer_column_type(col, df[col].cast(pl.Utf8, strict=False)) for col in df.columns]
+        source_norms = [_normalize_header_name(col) for col in df.columns]
+        # Only canonicals known before this file can be matched; columns added
+        # while walking it are claimed by their own source column.
+        canonical_names = [canonical["name"] for canonical in canonical_columns]
+        if canonical_names:
+            score_matrix, strategy_matrix = _header_match_matrix(
+                source_norms=source_norms,
+                source_types=source_types,
+                canonical_norms=[canonical["norm"] for canonical in canonical_columns],
+                canonical_types=[canonical["inferredType"] for canonical in canonical_columns],
+                match_threshold=match_threshold,
+            )
+        canonical_name_arr = np.array(canonical_names, dtype=object)
+
+        for idx, col in enumerate(df.columns):
+            inferred_type = source_types[idx]
             target = col
             strategy = "new_column"
             score = 100.0
 
-            best_match = None
-            best_score = -1.0
-            best_strategy = "none"
-            for canonical in canonical_columns:
-                canonical_name = canonical["name"]
-                if canonical_name in assigned_targets:
-                    continue
-                candidate_score, candidate_strategy = _header_match_score(
-                    source_name=col,
-                    source_type=inferred_type,
-                    canonical_name=canonical_name,
-                    canonical_type=canonical["inferredType"],
-                    match_threshold=match_threshold,
-                )
-                if candidate_score > best_score:
-                    best_score = candidate_score
-                    best_match = canonical_name
-                    best_strategy = candidate_strategy
-
-            if best_match and best_score >= match_threshold:
-                target = best_match
-                strategy = best_strategy
-                score = best_score
+            # Claimed canonicals are knocked out of the matrix below, so the
+            # best remaining candidate is a plain row argmax.
+            best_idx = int(np.argmax(score_matrix[idx])) if canonical_names else -1
+            if best_idx >= 0 and score_matrix[idx, best_idx] >= match_threshold:
+                target = canonical_names[best_idx]
+                strategy = str(strategy_matrix[idx, best_idx])
+                score = float(score_matrix[idx, best_idx])
             else:
                 canonical_columns.append({
                     "name": col,
                     "inferredType": inferred_type,
+                    "norm": source_norms[idx],
                 })
 
-            assigned_targets.add(target)
+            if canonical_names:
+                score_matrix[:, canonical_name_arr == target] = -1.0
             column_aliases.append((col, target))
             confidence = "new" if strategy == "new_column" else (
                 "exact" if score >= 98.0 else (
@@ -739,18 +921,22 @@ async def _parse_upload_datasets(upload_files: list[UploadFile], label: str) ->
     if not upload_files:
         raise HTTPException(status_code=400, detail=f"No {label} files were uploaded.")
 
-    parsed: list[dict[str, Any]] = []
-    for idx, upload in enumerate(upload_files, start=1):
+    async def _parse_one(idx: int, upload: UploadFile) -> dict[str, Any]:
         raw = await read_upload_bytes(upload)
-        df = read_csv_bytes(raw)
-        file_name = str(upload.filename or f"{label}_{idx}.csv")
-        parsed.append({
-            "fileName": file_name,
+        # Polars parses off the event loop (it releases the GIL), so files
+        # are read and parsed concurrently.
+        df = await asyncio.to_thread(read_csv_bytes, raw)
+        return {
+            "fileName": str(upload.filename or f"{label}_{idx}.csv"),
             "raw": raw,
             "df": df,
             "rows": df.height,
             "columns": df.width,
-        })
+        }
+
+    parsed: list[dict[str, Any]] = list(await asyncio.gather(
+        *(_parse_one(idx, upload) for idx, upload in enumerate(upload_files, start=1))
+    ))
 
     combined_df, mapping = merge_dataframes_with_schema_mapping(parsed)
     return {
@@ -763,19 +949,39 @@ async def _parse_upload_datasets(upload_files: list[UploadFile], label: str) ->
     }
 
 
-def build_columns_info(df: pl.DataFrame) -> tuple[list[dict], list[dict]]:
+def _as_utf8(df: pl.DataFrame) -> pl.DataFrame:
+    """Cast every column to Utf8 once so profiling helpers can share the view."""
+    return df.select([pl.col(col).cast(pl.Utf8, strict=False) for col in df.columns])
+
+
+def build_columns_info(df: pl.DataFrame, utf_df: Optional[pl.DataFrame] = None) -> tuple[list[dict], list[dict]]:
     """Return legacy columns info plus richer column profiles."""
     columns_info = []
     column_profiles = []
     total_rows = max(df.height, 1)
-    mv_cols = detect_multivalue_columns(df)
+    if utf_df is None:
+        utf_df = _as_utf8(df)
+    mv_cols = detect_multivalue_columns(df, utf_df=utf_df)
+
+    # Null counts, distinct counts and value samples for every column come out
+    # of one select so Polars can evaluate the columns in parallel.
+    exprs = []
+    for idx, col in enumerate(df.columns):
+        non_null = pl.col(col).drop_nulls()
+        stripped = non_null.head(VALUE_SAMPLE_SCAN_LIMIT).str.strip_chars()
+        exprs.extend([
+            non_null.len().alias(f"{idx}:count"),
+            non_null.n_unique().alias(f"{idx}:unique"),
+            stripped.filter(stripped != "").unique(maintain_order=True).head(VALUE_SAMPLE_LIMIT).implode().alias(f"{idx}:sample"),
+        ])
+    profile = utf_df.select(exprs).row(0, named=True) if exprs else {}
 
-    for col in df.columns:
-        utf_series = df[col].cast(pl.Utf8, strict=False)
-        non_null = utf_series.drop_nulls()
-        unique_count = int(non_null.n_unique()) if non_null.len() else 0
-        sample = sample_distinct_values(non_null, limit=VALUE_SAMPLE_LIMIT, scan_limit=VALUE_SAMPLE_SCAN_LIMIT)
-        null_count = df.height - non_null.len()
+    for idx, col in enumerate(df.columns):
+        utf_series = utf_df[col]
+        non_null_count = int(profile[f"{idx}:count"])
+        unique_count = int(profile[f"{idx}:unique"]) if non_null_count else 0
+        sample = list(profile[f"{idx}:sample"] or [])
+        null_count = df.height - non_null_count
 
         columns_info.append({
             "name": col,
@@ -800,20 +1006,37 @@ def build_columns_info(df: pl.DataFrame) -> tuple[list[dict], list[dict]]:
     return columns_info, column_profiles
 
 
-def detect_multivalue_columns(df: pl.DataFrame, threshold: float = 0.30) -> dict[str, str]:
+def detect_multivalue_columns(
+    df: pl.DataFrame,
+    threshold: float = 0.30,
+    utf_df: Optional[pl.DataFrame] = None,
+) -> dict[str, str]:
     """Detect columns where values contain multiple items separated by ;, comma, or |."""
     result = {}
     separators = [";", "|"]  # comma excluded by default — too many false positives with names/addresses
-    for col in df.columns:
-        utf = df[col].cast(pl.Utf8, strict=False).drop_nulls()
-        if utf.len() < 5:
+    if not df.columns:
+        return result
+    if utf_df is None:
+        utf_df = _as_utf8(df)
+
+    # One frame-wide select: non-null totals and per-separator hit counts for
+    # every column, evaluated in parallel by Polars.
+    exprs = []
+    for idx, col in enumerate(df.columns):
+        utf = pl.col(col)
+        exprs.append(utf.is_not_null().sum().alias(f"{idx}:total"))
+        for sep in separators:
+            exprs.append(utf.str.contains(sep, literal=True).sum().alias(f"{idx}:{sep}"))
+    counts = utf_df.select(exprs).row(0, named=True)
+
+    for idx, col in enumerate(df.columns):
+        total = counts[f"{idx}:total"]
+        if total < 5:
             continue
-        total = utf.len()
         best_sep = None
         best_rate = 0.0
         for sep in separators:
-            count = utf.str.contains(re.escape(sep), literal=True).sum()
-            rate = count / total
+            rate = (counts[f"{idx}:{sep}"] or 0) / total
             if rate > best_rate:
                 best_rate = rate
                 best_sep = sep
@@ -860,7 +1083,42 @@ def _safe_parse_iso_datetime(value: str) -> Optional[datetime]:
         return None
 
 
-def _build_view_filter_expr(view_filter: dict, columns: list[str]) -> Optional[pl.Expr]:
+@lru_cache(maxsize=256)
+def _ci_pattern(value: str, anchored: bool = False) -> str:
+    escaped = re.escape(value)
+    return f"(?i)^{escaped}$" if anchored else f"(?i){escaped}"
+
+
+def _truthy_expr(name: str, dtype: pl.DataType) -> pl.Expr:
+    """Python truthiness of a cell (None, "", 0 and False are falsy) as an expression."""
+    col = pl.col(name)
+    if dtype == pl.Null:
+        return pl.lit(False)
+    if dtype in (pl.Utf8, pl.Categorical) or isinstance(dtype, pl.Enum):
+        expr = col.cast(pl.Utf8) != ""
+    elif dtype == pl.Boolean:
+        expr = col
+    elif dtype.is_numeric():
+        expr = col != 0
+    else:
+        expr = col.is_not_null()
+    return expr.fill_null(False)
+
+
+def _filled_expr(name: str, dtype: pl.DataType) -> pl.Expr:
+    """1 when a cell is non-null and not blank after stripping, else 0."""
+    if dtype in (pl.Utf8, pl.Categorical) or isinstance(dtype, pl.Enum):
+        expr = pl.col(name).cast(pl.Utf8).str.strip_chars() != ""
+    else:
+        expr = pl.col(name).is_not_null()
+    return expr.fill_null(False).cast(pl.UInt32)
+
+
+def _build_view_filter_expr(
+    view_filter: dict,
+    columns: list[str],
+    parsed_cache: Optional[dict[str, pl.Expr]] = None,
+) -> Optional[pl.Expr]:
     field = str(view_filter.get("field") or "").strip()
     op = str(view_filter.get("op") or "").strip().lower()
     value = str(view_filter.get("value") or "").strip()
@@ -869,17 +1127,17 @@ def _build_view_filter_expr(view_filter: dict, columns: list[str]) -> Optional[p
         return None
 
     text_col = pl.col(field).cast(pl.Utf8, strict=False).fill_null("")
-    lower_col = text_col.str.to_lowercase()
-    lower_value = value.lower()
 
+    # Case-insensitive regexes match in one pass instead of lowercasing the
+    # whole column first.
     if op == "contains":
         if not value:
             return None
-        return lower_col.str.contains(lower_value, literal=True)
+        return text_col.str.contains(_ci_pattern(value))
     if op == "equals":
-        return lower_col == lower_value
+        return text_col.str.contains(_ci_pattern(value, anchored=True))
     if op == "not_equals":
-        return lower_col != lower_value
+        return ~text_col.str.contains(_ci_pattern(value, anchored=True))
     if op == "is_empty":
         return text_col.str.strip_chars() == ""
     if op == "is_not_empty":
@@ -887,7 +1145,13 @@ def _build_view_filter_expr(view_filter: dict, columns: list[str]) -> Optional[p
     if op in ("before", "after"):
         target_dt = _safe_parse_iso_datetime(value)
         if target_dt:
-            parsed_col = text_col.str.strptime(pl.Datetime, strict=False)
+            # Reuse one parse node per field so several date rules on the same
+            # column share a single strptime.
+            if parsed_cache is None:
+                parsed_cache = {}
+            parsed_col = parsed_cache.get(field)
+            if parsed_col is None:
+                parsed_col = parsed_cache[field] = text_col.str.strptime(pl.Datetime, strict=False)
             return parsed_col < target_dt if op == "before" else parsed_col > target_dt
         if not value:
             return None
@@ -898,27 +1162,113 @@ def _build_view_filter_expr(view_filter: dict, columns: list[str]) -> Optional[p
 def _apply_view_filters(df: pl.DataFrame, view_filters_raw: str, allowed_columns: list[str]) -> pl.DataFrame:
     raw = str(view_filters_raw or "").strip() or "[]"
     try:
-        parsed = json.loads(raw)
-    except json.JSONDecodeError as exc:
+        parsed = orjson.loads(raw)
+    except orjson.JSONDecodeError as exc:
         raise HTTPException(status_code=400, detail="Invalid viewFilters payload.") from exc
 
     if not isinstance(parsed, list):
         raise HTTPException(status_code=400, detail="viewFilters payload must be an array.")
 
-    working = df
+    exprs: list[pl.Expr] = []
+    parsed_cache: dict[str, pl.Expr] = {}
     for item in parsed:
         if not isinstance(item, dict):
             continue
-        expr = _build_view_filter_expr(item, allowed_columns)
+        expr = _build_view_filter_expr(item, allowed_columns, parsed_cache)
         if expr is not None:
-            working = working.filter(expr)
-    return working
+            exprs.append(expr)
+    if not exprs:
+        return df
+    # One lazy filter lets the optimizer share repeated casts/lowercasing
+    # across predicates instead of materializing a frame per rule.
+    return df.lazy().filter(*exprs).collect()
 
 
 def _session_file_path(session_id: str) -> Path:
     return SESSION_STORE_DIR / f"{session_id}{SESSION_FILE_SUFFIX}"
 
 
+def _session_blob_dir(session_id: str) -> Path:
+    return SESSION_STORE_DIR / session_id
+
+
+def _session_dataframe_path(session_id: str) -> Path:
+    return _session_blob_dir(session_id) / "df.parquet"
+
+
+# Raw CSV uploads are stored as sidecar files next to the JSON metadata. Blobs
+# are immutable once attached to a session, so we keep the exact bytes object
+# last written per (session, blob name) and skip rewriting it on metadata-only
+# persists. The dataframe snapshot is written straight to df.parquet in the same
+# directory by _replace_session_dataframe.
+SESSION_BLOB_FIELDS = ("csvRaw", "dedupeRaw")
+SESSION_BLOB_LIST_FIELDS = ("sourceRaws", "dedupeRaws")
+_PERSISTED_BLOBS: dict[str, dict[str, bytes]] = {}
+# Parse-cache file name per written CSV blob, recorded in the snapshot as
+# csvParseCacheFiles so deleting a session can purge them without rehashing.
+_PERSISTED_PARSE_CACHE_FILES: dict[str, dict[str, str]] = {}
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write data to a sibling temp file, flush it to disk, then rename over path."""
+    tmp = f"{path}.tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o600)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        # fdatasync skips the metadata flush; not available on macOS/Windows.
+        getattr(os, "fdatasync", os.fsync)(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+def _session_json_default(value: Any) -> Any:
+    # Sets are the only non-JSON type sessions hold; anything else would come
+    # back as a different type on reload, so fail the write instead.
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"unserializable session value: {type(value)!r}")
+
+
+RUN_ID_SET_KEYS = (
+    "qualifiedIds",
+    "removedFilterIds",
+    "removedDomainIds",
+    "removedHubspotIds",
+    "removedIntraDedupeIds",
+)
+
+
+def _pack_row_ids(ids: set[int]) -> dict:
+    """Encode a row-id set as a base64 little-endian bitmap starting at its smallest id."""
+    if not ids:
+        return {"offset": 0, "bits": ""}
+    arr = np.fromiter(ids, dtype=np.int64, count=len(ids))
+    offset = int(arr.min())
+    mask = np.zeros(int(arr.max()) - offset + 1, dtype=bool)
+    mask[arr - offset] = True
+    return {"offset": offset, "bits": base64.b64encode(np.packbits(mask, bitorder="little").tobytes()).decode("ascii")}
+
+
+def _unpack_row_ids(value: Any) -> set[int]:
+    if isinstance(value, (set, list)):
+        return set(value)
+    if not isinstance(value, dict) or not value.get("bits"):
+        return set()
+    bits = np.unpackbits(np.frombuffer(base64.b64decode(value["bits"]), dtype=np.uint8), bitorder="little")
+    return set((np.flatnonzero(bits) + int(value.get("offset") or 0)).tolist())
+
+
+def _int_keyed(mapping: Any) -> dict:
+    """Copy a row-id keyed map; JSON snapshots bring the int keys back as strings."""
+    mapping = dict(mapping or {})
+    if mapping and isinstance(next(iter(mapping)), str):
+        return {int(k): v for k, v in mapping.items() if k.isdigit()}
+    return mapping
+
+
 def _compact_run_snapshot(run: Optional[dict], now: Optional[float] = None) -> Optional[dict]:
     if not isinstance(run, dict):
         return None
@@ -935,12 +1285,7 @@ def _compact_run_snapshot(run: Optional[dict], now: Optional[float] = None) -> O
         "totalRows": int(run.get("totalRows", 0)),
         "qualifiedCount": int(run.get("qualifiedCount", 0)),
         "removedCount": int(run.get("removedCount", 0)),
-        "removedBreakdown": run.get("removedBreakdown", {
-            "removedFilter": 0,
-            "removedDomain": 0,
-            "removedHubspot": 0,
-            "removedIntraDedupe": 0,
-        }),
+        "removedBreakdown": _copy_removed_breakdown(run),
         "startedAt": run.get("startedAt"),
         "finishedAt": run.get("finishedAt"),
         "pausedAt": run.get("pausedAt"),
@@ -959,28 +1304,17 @@ def _compact_run_snapshot(run: Optional[dict], now: Optional[float] = None) -> O
         })
 
     if status in {"running", "pausing", "paused"}:
+        for key in RUN_ID_SET_KEYS:
+            compact[key] = _unpack_row_ids(run.get(key))
         for key in (
-            "qualifiedIds",
-            "removedFilterIds",
-            "removedDomainIds",
-            "removedHubspotIds",
-            "removedIntraDedupeIds",
+            "removedFilterReasonById",
+            "removedDomainReasonById",
+            "removedIntraDedupeReasonById",
         ):
-            value = run.get(key)
-            if isinstance(value, set):
-                compact[key] = set(value)
-            elif isinstance(value, list):
-                compact[key] = set(value)
-            else:
-                compact[key] = set()
-        compact["removedFilterReasonById"] = dict(run.get("removedFilterReasonById") or {})
-        compact["removedDomainReasonById"] = dict(run.get("removedDomainReasonById") or {})
+            compact[key] = _int_keyed(run.get(key))
         compact["removedHubspotDetailById"] = {
-            int(k): v
-            for k, v in dict(run.get("removedHubspotDetailById") or {}).items()
-            if str(k).isdigit() and isinstance(v, dict)
+            k: v for k, v in _int_keyed(run.get("removedHubspotDetailById")).items() if isinstance(v, dict)
         }
-        compact["removedIntraDedupeReasonById"] = dict(run.get("removedIntraDedupeReasonById") or {})
         if run.get("runConfig"):
             compact["runConfig"] = dict(run["runConfig"])
     else:
@@ -1032,6 +1366,16 @@ def _compact_scrape_snapshot(scrape: Optional[dict], now: Optional[float] = None
     return compact
 
 
+def _pack_run_snapshot_ids(run: Optional[dict]) -> Optional[dict]:
+    # Paused runs carry one id set per outcome over the whole dataset; as
+    # bitmaps they cost a bit per row on disk instead of a JSON integer.
+    if isinstance(run, dict):
+        for key in RUN_ID_SET_KEYS:
+            if key in run:
+                run[key] = _pack_row_ids(run[key])
+    return run
+
+
 def _serialize_session_for_disk(session_id: str, session: dict) -> dict:
     source_raws = [raw for raw in (session.get("sourceRaws") or []) if raw]
     csv_raw = session.get("csvRaw")
@@ -1046,12 +1390,12 @@ def _serialize_session_for_disk(session_id: str, session: dict) -> dict:
     return {
         "sessionId": session_id,
         "csvRaw": csv_raw,
-        "dfParquet": session.get("dfParquet"),
         "fileName": session.get("fileName"),
         "sourceFileNames": list(session.get("sourceFileNames") or []),
         "sourceRaws": source_raws,
         "sourceMapping": list(session.get("sourceMapping") or []),
         "sourceRows": int(session.get("sourceRows") or 0),
+        "rowCount": session.get("rowCount"),
         "columns": list(session.get("columns") or []),
         "columnProfiles": list(session.get("columnProfiles") or []),
         "previewRows": list(session.get("previewRows") or []),
@@ -1063,7 +1407,7 @@ def _serialize_session_for_disk(session_id: str, session: dict) -> dict:
         "dedupeMapping": list(session.get("dedupeMapping") or []),
         "dedupeSourceRows": int(session.get("dedupeSourceRows") or 0),
         "workspaceConfig": dict(session.get("workspaceConfig") or {}),
-        "activeRun": _compact_run_snapshot(session.get("activeRun")),
+        "activeRun": _pack_run_snapshot_ids(_compact_run_snapshot(session.get("activeRun"))),
         "activeScrape": _compact_scrape_snapshot(session.get("activeScrape")),
         "lastRunStatus": session.get("lastRunStatus"),
         "createdAt": float(session.get("createdAt") or time.time()),
@@ -1071,69 +1415,241 @@ def _serialize_session_for_disk(session_id: str, session: dict) -> dict:
     }
 
 
-def _persist_session(session_id: str, session: dict) -> None:
+def _write_session_blobs(session_id: str, payload: dict) -> None:
+    """Swap byte fields in payload for sidecar-file refs, writing only changed blobs."""
+    blob_dir = _session_blob_dir(session_id)
+    written = _PERSISTED_BLOBS.setdefault(session_id, {})
+    cache_files = _PERSISTED_PARSE_CACHE_FILES.setdefault(session_id, {})
+    names_by_id: dict[int, str] = {}
+    live_names: set[str] = set()
+
+    def _blob_ref(name: str, data: Optional[bytes]) -> Optional[dict]:
+        if not data:
+            return None
+        # csvRaw/dedupeRaw usually alias the first source/dedupe raw.
+        name = names_by_id.setdefault(id(data), name)
+        live_names.add(name)
+        if written.get(name) is not data:
+            blob_dir.mkdir(parents=True, exist_ok=True)
+            _atomic_write_bytes(blob_dir / name, data)
+            written[name] = data
+            # Hashed here, on the persist worker, so deletes never rehash uploads.
+            cache_file = _csv_parse_cache_path(data).name if len(data) >= CSV_PARSE_CACHE_MIN_BYTES else None
+            stale = cache_files.pop(name, None)
+            if stale and stale != cache_file:
+                _purge_csv_parse_cache([stale])
+            if cache_file:
+                cache_files[name] = cache_file
+        return {"__blob__": name}
+
+    payload["sourceRaws"] = [_blob_ref(f"source_{idx}.csv", raw) for idx, raw in enumerate(payload["sourceRaws"])]
+    payload["dedupeRaws"] = [_blob_ref(f"dedupe_{idx}.csv", raw) for idx, raw in enumerate(payload["dedupeRaws"])]
+    payload["csvRaw"] = _blob_ref("csv_raw.csv", payload.get("csvRaw"))
+    payload["dedupeRaw"] = _blob_ref("dedupe_raw.csv", payload.get("dedupeRaw"))
+
+    for name in set(written) - live_names:
+        written.pop(name, None)
+        (blob_dir / name).unlink(missing_ok=True)
+        stale = cache_files.pop(name, None)
+        if stale:
+            _purge_csv_parse_cache([stale])
+    payload["csvParseCacheFiles"] = dict(cache_files)
+
+
+def _read_session_blobs(session_id: str, payload: dict) -> None:
+    """Resolve sidecar-file refs in a loaded payload back into bytes."""
+    blob_dir = _session_blob_dir(session_id)
+    written = _PERSISTED_BLOBS.setdefault(session_id, {})
+
+    def _load(ref: Any) -> Any:
+        if not isinstance(ref, dict) or "__blob__" not in ref:
+            return ref
+        name = str(ref["__blob__"])
+        if name not in written:
+            written[name] = (blob_dir / name).read_bytes()
+        return written[name]
+
+    for key in SESSION_BLOB_FIELDS:
+        payload[key] = _load(payload.get(key))
+    for key in SESSION_BLOB_LIST_FIELDS:
+        payload[key] = [_load(ref) for ref in (payload.get(key) or [])]
+    cache_files = payload.pop("csvParseCacheFiles", None)
+    if isinstance(cache_files, dict):
+        _PERSISTED_PARSE_CACHE_FILES[session_id] = {str(k): str(v) for k, v in cache_files.items()}
+
+
+# Digest of the last written snapshot (minus updatedAt) per session, with the
+# updatedAt it was written at. Touch-only persists are skipped until the on-disk
+# timestamp is SESSION_TOUCH_PERSIST_SECONDS stale, which keeps the TTL check on
+# load accurate to well within SESSION_TTL_SECONDS.
+SESSION_TOUCH_PERSIST_SECONDS = 60 * 60
+_PERSISTED_DIGESTS: dict[str, tuple[bytes, float]] = {}
+
+
+def _encode_session_payload(payload: dict) -> bytes:
+    return orjson.dumps(
+        payload,
+        default=_session_json_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    )
+
+
+def _write_session_snapshot(session_id: str, payload: dict) -> None:
     try:
         SESSION_STORE_DIR.mkdir(parents=True, exist_ok=True)
         path = _session_file_path(session_id)
-        tmp = path.with_suffix(path.suffix + ".tmp")
+        _write_session_blobs(session_id, payload)
+        updated_at = float(payload.pop("updatedAt", None) or time.time())
+        encoded = _encode_session_payload(payload)
+        digest = hashlib.blake2b(encoded, digest_size=16).digest()
+        last = _PERSISTED_DIGESTS.get(session_id)
+        if (
+            last is not None
+            and last[0] == digest
+            and (updated_at - last[1]) < SESSION_TOUCH_PERSIST_SECONDS
+            and path.exists()
+        ):
+            return
+        # The payload always has keys, so updatedAt is spliced in as the last
+        # member instead of encoding the whole snapshot a second time.
+        _atomic_write_bytes(path, encoded[:-1] + b',"updatedAt":' + orjson.dumps(updated_at) + b"}")
+        _PERSISTED_DIGESTS[session_id] = (digest, updated_at)
+    except Exception:
+        traceback.print_exc()
+
+
+# Session writes are coalesced on a background thread: handlers snapshot the
+# session (cheap, and consistent with the event loop's view) and only the
+# latest snapshot per session is encoded and written once the debounce window
+# passes.
+SESSION_PERSIST_DEBOUNCE_SECONDS = 0.5
+_PENDING_PERSISTS: dict[str, dict] = {}
+_PENDING_PERSISTS_LOCK = threading.Lock()
+_SESSION_WRITE_LOCK = threading.Lock()
+_PERSIST_EVENT = threading.Event()
+_persist_thread: Optional[threading.Thread] = None
+
+
+def _persist_worker() -> None:
+    while True:
+        _PERSIST_EVENT.wait()
+        time.sleep(SESSION_PERSIST_DEBOUNCE_SECONDS)
+        _PERSIST_EVENT.clear()
+        flush_pending_persists()
+
+
+def flush_pending_persists() -> None:
+    """Write every queued session snapshot now."""
+    with _PENDING_PERSISTS_LOCK:
+        pending = list(_PENDING_PERSISTS.items())
+        _PENDING_PERSISTS.clear()
+    for session_id, payload in pending:
+        with _SESSION_WRITE_LOCK:
+            # Deleted while queued; don't resurrect it on disk.
+            if session_id not in SESSION_STORE:
+                continue
+            _write_session_snapshot(session_id, payload)
+
+
+def _persist_session(session_id: str, session: dict) -> None:
+    global _persist_thread
+    try:
         payload = _serialize_session_for_disk(session_id, session)
-        with tmp.open("wb") as handle:
-            pickle.dump(payload, handle, protocol=pickle.HIGHEST_PROTOCOL)
-        tmp.replace(path)
     except Exception:
         traceback.print_exc()
+        return
+    with _PENDING_PERSISTS_LOCK:
+        _PENDING_PERSISTS[session_id] = payload
+        if _persist_thread is None or not _persist_thread.is_alive():
+            _persist_thread = threading.Thread(target=_persist_worker, name="session-persist", daemon=True)
+            _persist_thread.start()
+    _PERSIST_EVENT.set()
 
 
 def _delete_persisted_session(session_id: str) -> None:
-    path = _session_file_path(session_id)
-    if path.exists():
-        try:
-            path.unlink()
-        except Exception:
-            traceback.print_exc()
+    with _PENDING_PERSISTS_LOCK:
+        _PENDING_PERSISTS.pop(session_id, None)
+    with _SESSION_WRITE_LOCK:
+        _remove_session_files(session_id)
+
+
+def _remove_session_files(session_id: str) -> None:
+    _PERSISTED_BLOBS.pop(session_id, None)
+    _PERSISTED_DIGESTS.pop(session_id, None)
+    try:
+        _purge_csv_parse_cache((_PERSISTED_PARSE_CACHE_FILES.pop(session_id, None) or {}).values())
+    except Exception:
+        traceback.print_exc()
+    for path in (_session_file_path(session_id), SESSION_STORE_DIR / f"{session_id}{LEGACY_SESSION_FILE_SUFFIX}"):
+        if path.exists():
+            try:
+                path.unlink()
+            except Exception:
+                traceback.print_exc()
+    blob_dir = _session_blob_dir(session_id)
+    if blob_dir.is_dir():
+        shutil.rmtree(blob_dir, ignore_errors=True)
+
+
+def _read_persisted_payload(path: Path) -> Optional[dict]:
+    if path.name.endswith(LEGACY_SESSION_FILE_SUFFIX):
+        session_id = path.name[: -len(LEGACY_SESSION_FILE_SUFFIX)]
+        with path.open("rb") as handle:
+            payload = pickle.load(handle)
+    else:
+        session_id = path.name[: -len(SESSION_FILE_SUFFIX)]
+        payload = orjson.loads(path.read_bytes())
+        if isinstance(payload, dict):
+            _read_session_blobs(str(payload.get("sessionId") or "").strip() or session_id, payload)
+    return payload if isinstance(payload, dict) else None
 
 
 def _load_persisted_sessions() -> None:
     SESSION_STORE.clear()
+    _EXPIRY_HEAP.clear()
+    _PERSISTED_DIGESTS.clear()
+    _PERSISTED_BLOBS.clear()
+    _PERSISTED_PARSE_CACHE_FILES.clear()
     SESSION_STORE_DIR.mkdir(parents=True, exist_ok=True)
     now = time.time()
 
-    for path in SESSION_STORE_DIR.glob(f"*{SESSION_FILE_SUFFIX}"):
+    paths = list(SESSION_STORE_DIR.glob(f"*{SESSION_FILE_SUFFIX}"))
+    paths += list(SESSION_STORE_DIR.glob(f"*{LEGACY_SESSION_FILE_SUFFIX}"))
+    for path in paths:
+        is_legacy = path.name.endswith(LEGACY_SESSION_FILE_SUFFIX)
+        suffix = LEGACY_SESSION_FILE_SUFFIX if is_legacy else SESSION_FILE_SUFFIX
+        file_session_id = path.name[: -len(suffix)]
         try:
-            with path.open("rb") as handle:
-                payload = pickle.load(handle)
+            payload = _read_persisted_payload(path)
         except Exception:
-            try:
-                path.unlink()
-            except Exception:
-                traceback.print_exc()
+            payload = None
+        if payload is None:
+            if is_legacy:
+                path.unlink(missing_ok=True)
+            else:
+                _delete_persisted_session(file_session_id)
             continue
 
-        if not isinstance(payload, dict):
-            try:
-                path.unlink()
-            except Exception:
-                traceback.print_exc()
+        session_id = str(payload.get("sessionId") or "").strip() or file_session_id
+        if is_legacy and session_id in SESSION_STORE:
+            # Already migrated; drop the leftover pickle.
+            path.unlink(missing_ok=True)
             continue
-
-        session_id = str(payload.get("sessionId") or "").strip() or path.name[: -len(SESSION_FILE_SUFFIX)]
         updated_at = float(payload.get("updatedAt") or now)
         if (now - updated_at) > SESSION_TTL_SECONDS:
-            try:
-                path.unlink()
-            except Exception:
-                traceback.print_exc()
+            _delete_persisted_session(session_id)
             continue
 
         SESSION_STORE[session_id] = {
             "csvRaw": payload.get("csvRaw"),
-            "dfParquet": payload.get("dfParquet"),
+            "dfParquetPath": _restore_session_dataframe_path(session_id, payload.get("dfParquet")),
             "df": None,
             "fileName": payload.get("fileName") or "dataset.csv",
             "sourceFileNames": list(payload.get("sourceFileNames") or []),
             "sourceRaws": list(payload.get("sourceRaws") or []),
             "sourceMapping": list(payload.get("sourceMapping") or []),
             "sourceRows": int(payload.get("sourceRows") or 0),
+            "rowCount": payload.get("rowCount"),
             "columns": list(payload.get("columns") or []),
             "columnProfiles": list(payload.get("columnProfiles") or []),
             "previewRows": list(payload.get("previewRows") or []),
@@ -1153,10 +1669,24 @@ def _load_persisted_sessions() -> None:
             "createdAt": float(payload.get("createdAt") or updated_at),
             "updatedAt": updated_at,
         }
+        _schedule_session_expiry(session_id, updated_at)
+        if is_legacy:
+            # Migrate pickled snapshots to the JSON + sidecar layout.
+            _write_session_snapshot(session_id, _serialize_session_for_disk(session_id, SESSION_STORE[session_id]))
+            if _session_file_path(session_id).exists():
+                path.unlink(missing_ok=True)
 
 
 _last_stale_cleanup: float = 0.0
 _STALE_CLEANUP_INTERVAL: float = 30.0
+# (expires_at, sid) min-heap. Entries are lower bounds: touching a session only
+# bumps updatedAt, so the sweep re-checks and reschedules entries that are
+# still live instead of pushing on every touch.
+_EXPIRY_HEAP: list[tuple[float, str]] = []
+
+
+def _schedule_session_expiry(sid: str, updated_at: float) -> None:
+    heapq.heappush(_EXPIRY_HEAP, (updated_at + SESSION_TTL_SECONDS, sid))
 
 
 def _clean_stale_sessions() -> None:
@@ -1165,10 +1695,17 @@ def _clean_stale_sessions() -> None:
     if now - _last_stale_cleanup < _STALE_CLEANUP_INTERVAL:
         return
     _last_stale_cleanup = now
-    stale = [sid for sid, payload in SESSION_STORE.items() if (now - payload.get("updatedAt", now)) > SESSION_TTL_SECONDS]
-    for sid in stale:
-        SESSION_STORE.pop(sid, None)
-        _delete_persisted_session(sid)
+    while _EXPIRY_HEAP and _EXPIRY_HEAP[0][0] < now:
+        _, sid = heapq.heappop(_EXPIRY_HEAP)
+        payload = SESSION_STORE.get(sid)
+        if payload is None:
+            continue
+        updated_at = payload.get("updatedAt", now)
+        if (now - updated_at) > SESSION_TTL_SECONDS:
+            SESSION_STORE.pop(sid, None)
+            _delete_persisted_session(sid)
+        else:
+            _schedule_session_expiry(sid, updated_at)
 
 
 def _put_session(
@@ -1192,17 +1729,18 @@ def _put_session(
     dedupe_source_rows: Optional[int] = None,
 ) -> str:
     _clean_stale_sessions()
-    sid = uuid4().hex
+    sid = secrets.token_hex(16)
     now = time.time()
     SESSION_STORE[sid] = {
         "csvRaw": raw_csv,
-        "dfParquet": None,
+        "dfParquetPath": None,
         "df": df,
         "fileName": file_name,
         "sourceFileNames": list(source_file_names or ([file_name] if file_name else [])),
         "sourceRaws": list(source_raws or ([raw_csv] if raw_csv else [])),
         "sourceMapping": list(source_mapping or []),
         "sourceRows": int(source_rows if source_rows is not None else df.height),
+        "rowCount": int(df.height),
         "columns": columns_info,
         "columnProfiles": column_profiles,
         "previewRows": preview_rows,
@@ -1222,6 +1760,7 @@ def _put_session(
         "createdAt": now,
         "updatedAt": now,
     }
+    _schedule_session_expiry(sid, now)
     _persist_session(sid, SESSION_STORE[sid])
     return sid
 
@@ -1258,10 +1797,34 @@ def _set_session_dedupe(
     return session
 
 
-def _dataframe_to_parquet_bytes(df: pl.DataFrame) -> bytes:
-    buf = io.BytesIO()
-    df.write_parquet(buf, compression="zstd")
-    return buf.getvalue()
+def _persist_session_dataframe(session_id: str, df: pl.DataFrame) -> Optional[Path]:
+    """Write the session dataframe snapshot to its sidecar parquet file.
+
+    Encoded in memory, then written durably under the session write lock so it
+    can't interleave with the persist worker or a delete. Returns None if the
+    session was deleted in the meantime.
+    """
+    buffer = io.BytesIO()
+    df.write_parquet(buffer, compression=PARQUET_CODEC)
+    path = _session_dataframe_path(session_id)
+    with _SESSION_WRITE_LOCK:
+        if session_id not in SESSION_STORE:
+            return None
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write_bytes(path, buffer.getbuffer())
+    return path
+
+
+def _restore_session_dataframe_path(session_id: str, legacy_parquet: Any = None) -> Optional[str]:
+    path = _session_dataframe_path(session_id)
+    if isinstance(legacy_parquet, (bytes, bytearray)) and legacy_parquet and not path.exists():
+        # Pickled snapshots carried the parquet bytes inline.
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(legacy_parquet)
+        except Exception:
+            traceback.print_exc()
+    return str(path) if path.exists() else None
 
 
 def _refresh_session_dataframe_metadata(session: dict, df: pl.DataFrame) -> None:
@@ -1272,13 +1835,28 @@ def _refresh_session_dataframe_metadata(session: dict, df: pl.DataFrame) -> None
     session["anomalies"] = build_column_anomalies(column_profiles, df.height)
 
 
-def _replace_session_dataframe(session: dict, df: pl.DataFrame) -> None:
+def _replace_session_dataframe(session_id: str, session: dict, df: pl.DataFrame) -> None:
+    session.pop("lf", None)
+    # Polars frames are immutable, so the same object with the same shape means
+    # the existing snapshot is still current.
+    fingerprint = (id(df), df.height, df.width, tuple(df.columns))
+    unchanged = (
+        session.get("df") is df
+        and session.get("dfParquetPath")
+        and session.get("_dfParquetFingerprint") == fingerprint
+    )
     session["df"] = df
-    try:
-        session["dfParquet"] = _dataframe_to_parquet_bytes(df)
-    except Exception:
-        session["dfParquet"] = None
-        traceback.print_exc()
+    session["rowCount"] = int(df.height)
+    if not unchanged:
+        try:
+            path = _persist_session_dataframe(session_id, df)
+            session["dfParquetPath"] = str(path) if path else None
+            session["_dfParquetFingerprint"] = fingerprint
+        except Exception:
+            session["dfParquetPath"] = None
+            session.pop("_dfParquetFingerprint", None)
+            _session_dataframe_path(session_id).unlink(missing_ok=True)
+            traceback.print_exc()
     _refresh_session_dataframe_metadata(session, df)
     if not session.get("sourceRows"):
         session["sourceRows"] = int(df.height)
@@ -1288,11 +1866,13 @@ def _get_session_df(session: dict) -> pl.DataFrame:
     """Get cached parsed source dataframe, parsing once if needed."""
     if isinstance(session.get("df"), pl.DataFrame):
         return session["df"]
-    parquet_raw = session.get("dfParquet")
-    if parquet_raw:
+    if session.get("dfParquetPath"):
         try:
-            df = pl.read_parquet(io.BytesIO(parquet_raw))
+            # Collect through the cached scan so lazy probes and the eager frame
+            # share one source.
+            df = _get_session_lf(session).collect()
             session["df"] = df
+            session["rowCount"] = int(df.height)
             if not session.get("sourceRows"):
                 session["sourceRows"] = int(df.height)
             if not session.get("columns") or not session.get("columnProfiles"):
@@ -1303,18 +1883,11 @@ def _get_session_df(session: dict) -> pl.DataFrame:
             traceback.print_exc()
     source_raws = [raw for raw in (session.get("sourceRaws") or []) if raw]
     if len(source_raws) > 1:
+        file_names = list(session.get("sourceFileNames") or [])
         parsed = [{
-            "fileName": file_name or f"source_{idx + 1}.csv",
-            "df": read_csv_bytes(raw),
-        } for idx, (file_name, raw) in enumerate(
-            zip(session.get("sourceFileNames") or [], source_raws)
-        )]
-        if len(parsed) < len(source_raws):
-            for idx in range(len(parsed), len(source_raws)):
-                parsed.append({
-                    "fileName": f"source_{idx + 1}.csv",
-                    "df": read_csv_bytes(source_raws[idx]),
-                })
+            "fileName": (file_names[idx] if idx < len(file_names) else "") or f"source_{idx + 1}.csv",
+            "df": frame,
+        } for idx, frame in enumerate(read_csv_bytes_many(source_raws))]
         df, mapping = merge_dataframes_with_schema_mapping(parsed)
         session["sourceMapping"] = mapping
     else:
@@ -1323,6 +1896,7 @@ def _get_session_df(session: dict) -> pl.DataFrame:
             raise HTTPException(status_code=500, detail="Session source data is unavailable.")
         df = read_csv_bytes(csv_raw)
     session["df"] = df
+    session["rowCount"] = int(df.height)
     if not session.get("sourceRows"):
         session["sourceRows"] = int(df.height)
     if not session.get("columns") or not session.get("columnProfiles"):
@@ -1331,6 +1905,64 @@ def _get_session_df(session: dict) -> pl.DataFrame:
     return df
 
 
+def _get_session_lf(session: dict) -> pl.LazyFrame:
+    """Lazy view of the session dataframe for schema and row-count probes."""
+    if isinstance(session.get("df"), pl.DataFrame):
+        return session["df"].lazy()
+    lf = session.get("lf")
+    if isinstance(lf, pl.LazyFrame):
+        return lf
+    source_raws = [raw for raw in (session.get("sourceRaws") or []) if raw]
+    if session.get("dfParquetPath"):
+        lf = pl.scan_parquet(session["dfParquetPath"])
+    elif len(source_raws) <= 1 and session.get("csvRaw"):
+        lf = scan_csv_bytes(session["csvRaw"])
+    else:
+        # Multi-file sources need the schema-mapped merge.
+        return _get_session_df(session).lazy()
+    session["lf"] = lf
+    return lf
+
+
+def _session_df_columns(session: dict) -> list[str]:
+    """Source column names, read from the schema when the frame isn't loaded."""
+    if not isinstance(session.get("df"), pl.DataFrame):
+        try:
+            return _get_session_lf(session).collect_schema().names()
+        except HTTPException:
+            raise
+        except Exception:
+            session.pop("lf", None)
+    return _get_session_df(session).columns
+
+
+def _session_df_height(session: dict) -> int:
+    """Source row count; counted once from the scan when the frame isn't loaded."""
+    if not isinstance(session.get("df"), pl.DataFrame):
+        row_count = session.get("rowCount")
+        if isinstance(row_count, int):
+            return row_count
+        try:
+            row_count = int(_get_session_lf(session).select(pl.len()).collect().item())
+            session["rowCount"] = row_count
+            return row_count
+        except HTTPException:
+            raise
+        except Exception:
+            session.pop("lf", None)
+    return _get_session_df(session).height
+
+
+def _get_session_column(session: dict, column: str) -> pl.Series:
+    """One source column, projected out of the parquet snapshot when the frame isn't loaded."""
+    if not isinstance(session.get("df"), pl.DataFrame) and session.get("dfParquetPath"):
+        try:
+            return _get_session_lf(session).select(column).collect().to_series()
+        except Exception:
+            session.pop("lf", None)
+    return _get_session_df(session)[column]
+
+
 def _get_session_dedupe_df(session: dict) -> Optional[pl.DataFrame]:
     """Get cached parsed dedupe dataframe, parsing once if needed."""
     dedupe_df = session.get("dedupeDf")
@@ -1338,13 +1970,11 @@ def _get_session_dedupe_df(session: dict) -> Optional[pl.DataFrame]:
         return dedupe_df
     dedupe_raws = [raw for raw in (session.get("dedupeRaws") or []) if raw]
     if len(dedupe_raws) > 1:
-        parsed = []
         names = session.get("dedupeFileNames") or []
-        for idx, raw in enumerate(dedupe_raws, start=1):
-            parsed.append({
-                "fileName": names[idx - 1] if idx - 1 < len(names) else f"dedupe_{idx}.csv",
-                "df": read_csv_bytes(raw),
-            })
+        parsed = [{
+            "fileName": names[idx - 1] if idx - 1 < len(names) else f"dedupe_{idx}.csv",
+            "df": frame,
+        } for idx, frame in enumerate(read_csv_bytes_many(dedupe_raws), start=1)]
         combined, mapping = merge_dataframes_with_schema_mapping(parsed)
         session["dedupeDf"] = combined
         session["dedupeMapping"] = mapping
@@ -1375,13 +2005,12 @@ def _rebuild_dedupe_from_raws(
 
     parsed: list[dict[str, Any]] = []
     input_rows = 0
-    for idx, raw in enumerate(clean_raws, start=1):
+    for idx, df in enumerate(read_csv_bytes_many(clean_raws), start=1):
         file_name = (
             dedupe_file_names[idx - 1]
             if idx - 1 < len(dedupe_file_names) and str(dedupe_file_names[idx - 1] or "").strip()
             else f"dedupe_{idx}.csv"
         )
-        df = read_csv_bytes(raw)
         input_rows += int(df.height)
         parsed.append({
             "fileName": file_name,
@@ -1393,7 +2022,10 @@ def _rebuild_dedupe_from_raws(
 
 
 def _build_session_payload(session_id: str, session: dict) -> dict[str, Any]:
-    source_df = _get_session_df(session)
+    if not session.get("columns") or not session.get("columnProfiles"):
+        # Column metadata is rebuilt from the full frame.
+        _get_session_df(session)
+    source_columns = _session_df_columns(session)
     source_file_names = list(session.get("sourceFileNames") or [])
     source_name = session.get("fileName") or _summarize_file_names(source_file_names, "dataset.csv")
     dedupe_df = _get_session_dedupe_df(session)
@@ -1407,14 +2039,7 @@ def _build_session_payload(session_id: str, session: dict) -> dict[str, Any]:
         "fileCount": len(dedupe_file_names),
     }
     if dedupe_df is not None:
-        # Cache infer_dedupe_matches — deterministic for same column sets
-        cache_key = (tuple(source_df.columns), tuple(dedupe_df.columns))
-        cached = session.get("_inferredMatchesCache")
-        if isinstance(cached, tuple) and len(cached) == 2 and cached[0] == cache_key:
-            inferred_matches = cached[1]
-        else:
-            inferred_matches = infer_dedupe_matches(source_df.columns, dedupe_df.columns)
-            session["_inferredMatchesCache"] = (cache_key, inferred_matches)
+        inferred_matches = infer_dedupe_matches(source_columns, dedupe_df.columns)
         primary_match = inferred_matches[0] if inferred_matches else {"sourceColumn": None, "hubspotColumn": None, "keyType": None}
         dedupe_payload.update({
             "columns": dedupe_df.columns,
@@ -1429,6 +2054,7 @@ def _build_session_payload(session_id: str, session: dict) -> dict[str, Any]:
             "inferredMatches": inferred_matches,
         })
 
+    total_rows = _session_df_height(session)
     payload = {
         "sessionId": session_id,
         "fileName": source_name,
@@ -1437,8 +2063,8 @@ def _build_session_payload(session_id: str, session: dict) -> dict[str, Any]:
         "columns": list(session.get("columns") or []),
         "columnProfiles": list(session.get("columnProfiles") or []),
         "previewRows": list(session.get("previewRows") or []),
-        "totalRows": source_df.height,
-        "sourceRows": int(session.get("sourceRows") or source_df.height),
+        "totalRows": total_rows,
+        "sourceRows": int(session.get("sourceRows") or total_rows),
         "sourceMappings": list(session.get("sourceMapping") or []),
         "anomalies": dict(session.get("anomalies") or {}),
         "workspaceConfig": dict(session.get("workspaceConfig") or {}),
@@ -1455,79 +2081,108 @@ def _build_session_payload(session_id: str, session: dict) -> dict[str, Any]:
 
 def _parse_rules_payload(rules_raw: str) -> list[dict]:
     try:
-        parsed = json.loads(str(rules_raw or "[]"))
-    except json.JSONDecodeError as exc:
+        parsed = orjson.loads(str(rules_raw or "[]"))
+    except orjson.JSONDecodeError as exc:
         raise HTTPException(status_code=400, detail="Invalid rules payload.") from exc
     if not isinstance(parsed, list):
         raise HTTPException(status_code=400, detail="Rules payload must be an array.")
     return [item for item in parsed if isinstance(item, dict)]
 
 
-def _build_status_sets_from_rows(rows: list[dict]) -> dict:
-    qualified_ids: set[int] = set()
-    removed_filter_ids: set[int] = set()
-    removed_domain_ids: set[int] = set()
-    removed_hubspot_ids: set[int] = set()
-    removed_filter_reasons: dict[int, str] = {}
-    removed_domain_reasons: dict[int, str] = {}
-    removed_hubspot_detail_by_id: dict[int, dict] = {}
+def _build_status_sets_from_df(
+    status_df: pl.DataFrame,
+    removed_hubspot_detail_by_id: Optional[dict[int, dict]] = None,
+) -> dict:
+    """Status sets from a `_rowId`/`_rowStatus`/`_rowReasons` frame, column-wise."""
+    status_df = status_df.filter(pl.col("_rowId") >= 0).select(
+        pl.col("_rowId").cast(pl.Int64),
+        pl.col("_rowStatus").cast(pl.Utf8).fill_null(""),
+        pl.col("_rowReasons").cast(pl.List(pl.Utf8)).list.first().alias("_reason"),
+    )
+    status = status_df["_rowStatus"]
+    ids = status_df["_rowId"].to_numpy()
 
-    for row in rows:
-        row_id = int(row.get("_rowId", -1))
-        if row_id < 0:
-            continue
-        status = str(row.get("_rowStatus") or "")
-        reasons = row.get("_rowReasons") or []
-        if status == "qualified":
-            qualified_ids.add(row_id)
-        elif status == "removed_filter":
-            removed_filter_ids.add(row_id)
-            if reasons:
-                removed_filter_reasons[row_id] = str(reasons[0])
-        elif status == "removed_domain":
-            removed_domain_ids.add(row_id)
-            if reasons:
-                removed_domain_reasons[row_id] = str(reasons[0]).replace("domain_", "")
-        elif status == "removed_hubspot":
-            removed_hubspot_ids.add(row_id)
-            detail = row.get("_dedupeMatch")
-            if isinstance(detail, dict):
-                removed_hubspot_detail_by_id[row_id] = detail
+    def _ids_with(name: str) -> set[int]:
+        return set(ids[(status == name).to_numpy()].tolist())
+
+    def _reasons_with(name: str) -> dict[int, str]:
+        subset = status_df.filter((pl.col("_rowStatus") == name) & pl.col("_reason").is_not_null())
+        return dict(zip(subset["_rowId"].to_list(), subset["_reason"].to_list()))
 
+    removed_hubspot_ids = _ids_with("removed_hubspot")
+    detail_map = removed_hubspot_detail_by_id or {}
     return {
-        "qualifiedIds": qualified_ids,
-        "removedFilterIds": removed_filter_ids,
-        "removedFilterReasonById": removed_filter_reasons,
-        "removedDomainIds": removed_domain_ids,
+        "qualifiedIds": _ids_with("qualified"),
+        "removedFilterIds": _ids_with("removed_filter"),
+        "removedFilterReasonById": _reasons_with("removed_filter"),
+        "removedDomainIds": _ids_with("removed_domain"),
         "removedHubspotIds": removed_hubspot_ids,
-        "removedDomainReasonById": removed_domain_reasons,
-        "removedHubspotDetailById": removed_hubspot_detail_by_id,
+        "removedDomainReasonById": {
+            rid: reason.replace("domain_", "") for rid, reason in _reasons_with("removed_domain").items()
+        },
+        "removedHubspotDetailById": {
+            rid: detail
+            for rid, detail in detail_map.items()
+            if rid in removed_hubspot_ids and isinstance(detail, dict)
+        },
     }
 
 
+# Read-only templates for idle snapshots; callers get shallow copies since
+# payloads are extended (e.g. with "result") after serialization.
+_DEFAULT_REMOVED_BREAKDOWN = MappingProxyType({
+    "removedFilter": 0,
+    "removedDomain": 0,
+    "removedHubspot": 0,
+    "removedIntraDedupe": 0,
+})
+
+
+def _copy_removed_breakdown(run: dict) -> dict:
+    """Own copy of a run's removedBreakdown; never the run state's dict or None."""
+    if "removedBreakdown" not in run:
+        return dict(_DEFAULT_REMOVED_BREAKDOWN)
+    return dict(run.get("removedBreakdown") or {})
+
+
+_IDLE_RUN_SNAPSHOT = MappingProxyType({
+    "status": "idle",
+    "stage": "idle",
+    "progress": 0.0,
+    "message": "",
+    "processedRows": 0,
+    "totalRows": 0,
+    "qualifiedCount": 0,
+    "removedCount": 0,
+    "removedBreakdown": _DEFAULT_REMOVED_BREAKDOWN,
+    "completed": True,
+    "pauseRequested": False,
+    "finishOnPause": False,
+    "pausedAt": None,
+    "error": "",
+})
+_IDLE_SCRAPE_SNAPSHOT = MappingProxyType({
+    "status": "idle",
+    "stage": "idle",
+    "progress": 0.0,
+    "message": "",
+    "processed": 0,
+    "total": 0,
+    "ok": 0,
+    "fail": 0,
+    "ratePerSec": 0.0,
+    "domainField": "",
+    "outputDir": "",
+    "completed": True,
+    "error": "",
+})
+
+
 def _serialize_run_snapshot(run: Optional[dict], include_result: bool = True) -> dict:
     if not isinstance(run, dict):
-        return {
-            "status": "idle",
-            "stage": "idle",
-            "progress": 0.0,
-            "message": "",
-            "processedRows": 0,
-            "totalRows": 0,
-            "qualifiedCount": 0,
-            "removedCount": 0,
-            "removedBreakdown": {
-                "removedFilter": 0,
-                "removedDomain": 0,
-                "removedHubspot": 0,
-                "removedIntraDedupe": 0,
-            },
-            "completed": True,
-            "pauseRequested": False,
-            "finishOnPause": False,
-            "pausedAt": None,
-            "error": "",
-        }
+        payload = dict(_IDLE_RUN_SNAPSHOT)
+        payload["removedBreakdown"] = dict(_DEFAULT_REMOVED_BREAKDOWN)
+        return payload
 
     payload = {
         "runId": run.get("runId"),
@@ -1539,12 +2194,7 @@ def _serialize_run_snapshot(run: Optional[dict], include_result: bool = True) ->
         "totalRows": int(run.get("totalRows", 0)),
         "qualifiedCount": int(run.get("qualifiedCount", 0)),
         "removedCount": int(run.get("removedCount", 0)),
-        "removedBreakdown": run.get("removedBreakdown", {
-            "removedFilter": 0,
-            "removedDomain": 0,
-            "removedHubspot": 0,
-            "removedIntraDedupe": 0,
-        }),
+        "removedBreakdown": _copy_removed_breakdown(run),
         "completed": run.get("status") in ("done", "error"),
         "pauseRequested": bool(run.get("pauseRequested")),
         "finishOnPause": bool(run.get("finishOnPause")),
@@ -1560,21 +2210,7 @@ def _serialize_run_snapshot(run: Optional[dict], include_result: bool = True) ->
 
 def _serialize_scrape_snapshot(scrape: Optional[dict], include_result: bool = True) -> dict:
     if not isinstance(scrape, dict):
-        return {
-            "status": "idle",
-            "stage": "idle",
-            "progress": 0.0,
-            "message": "",
-            "processed": 0,
-            "total": 0,
-            "ok": 0,
-            "fail": 0,
-            "ratePerSec": 0.0,
-            "domainField": "",
-            "outputDir": "",
-            "completed": True,
-            "error": "",
-        }
+        return dict(_IDLE_SCRAPE_SNAPSHOT)
 
     payload = {
         "scrapeId": scrape.get("scrapeId"),
@@ -1599,6 +2235,89 @@ def _serialize_scrape_snapshot(scrape: Optional[dict], include_result: bool = Tr
     return payload
 
 
+def _domain_reason_token(detail: Any) -> str:
+    return f"domain_{detail}".replace("/", "_").replace(" ", "_").replace(":", "_")
+
+
+# Status codes for the finished-run lookup arrays, in _resolve_row_annotation
+# precedence order (higher codes win).
+_RUN_STATUS_NAMES = ("qualified", "removed_hubspot", "removed_domain", "removed_filter", "removed_intra_dedupe")
+_RUN_STATUS_SET_KEYS = ("qualifiedIds", "removedHubspotIds", "removedDomainIds", "removedFilterIds", "removedIntraDedupeIds")
+_RUN_STATUS_UNSET = 255
+_RUN_STATUS_FIXED_REASONS = {
+    0: ["qualified_passed_all_checks"],
+    1: ["hubspot_duplicate_match"],
+    4: ["intra_dedupe_duplicate"],
+}
+
+
+def _materialize_run_lookup(run_state: dict) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-row status arrays for a finished run: uint8 status codes indexed by row
+    id, plus object arrays of filter/domain reasons and hubspot match details.
+    """
+    id_arrays = [
+        np.fromiter((int(v) for v in (run_state.get(key) or ())), dtype=np.int64)
+        for key in _RUN_STATUS_SET_KEYS
+    ]
+    size = 1 + max((int(ids.max()) for ids in id_arrays if ids.size), default=-1)
+    codes = np.full(size, _RUN_STATUS_UNSET, dtype=np.uint8)
+    # Lowest precedence first; higher-priority statuses overwrite.
+    for code, ids in enumerate(id_arrays):
+        codes[ids[ids >= 0]] = code
+
+    reasons = np.empty(size, dtype=object)
+    details = np.empty(size, dtype=object)
+    hubspot_ids = np.flatnonzero(codes == 1)
+    if hubspot_ids.size:
+        detail_by_id = _int_keyed(run_state.get("removedHubspotDetailById"))
+        details[hubspot_ids] = [
+            detail if isinstance(detail, dict) else None
+            for detail in map(detail_by_id.get, hubspot_ids.tolist())
+        ]
+    domain_ids = np.flatnonzero(codes == 2)
+    if domain_ids.size:
+        domain_reason_by_id = _int_keyed(run_state.get("removedDomainReasonById"))
+        reasons[domain_ids] = [
+            _domain_reason_token(str(domain_reason_by_id.get(row_id, "unreachable")))
+            for row_id in domain_ids.tolist()
+        ]
+    filter_ids = np.flatnonzero(codes == 3)
+    if filter_ids.size:
+        filter_reason_by_id = _int_keyed(run_state.get("removedFilterReasonById"))
+        reasons[filter_ids] = [
+            str(filter_reason_by_id.get(row_id, "rule_filter_mismatch"))
+            for row_id in filter_ids.tolist()
+        ]
+    return codes, reasons, details
+
+
+def _annotation_from_lookup(
+    lookup: tuple[np.ndarray, np.ndarray, np.ndarray],
+    row_id: int,
+) -> Optional[tuple[str, list[str], Optional[dict]]]:
+    codes, reasons, details = lookup
+    if not 0 <= row_id < codes.size:
+        return None
+    code = int(codes[row_id])
+    if code == _RUN_STATUS_UNSET:
+        return None
+    fixed = _RUN_STATUS_FIXED_REASONS.get(code)
+    return _RUN_STATUS_NAMES[code], list(fixed) if fixed is not None else [reasons[row_id]], details[row_id]
+
+
+def _session_run_lookup(session: dict, run_state: dict) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Cached _materialize_run_lookup for the session's finished-run status sets."""
+    # lastRunStatus is replaced, never mutated, when a run completes, so holding
+    # the source object is enough to detect staleness.
+    cached = session.get("_rowStatusLookup")
+    if isinstance(cached, tuple) and cached[0] is run_state:
+        return cached[1]
+    lookup = _materialize_run_lookup(run_state)
+    session["_rowStatusLookup"] = (run_state, lookup)
+    return lookup
+
+
 def _resolve_row_annotation(row_id: int, run_state: Optional[dict]) -> tuple[str, list[str], Optional[dict]]:
     if not isinstance(run_state, dict):
         return "qualified", ["preview_only"], None
@@ -1619,7 +2338,7 @@ def _resolve_row_annotation(row_id: int, run_state: Optional[dict]) -> tuple[str
         return "removed_filter", [str(removed_filter_reason_by_id.get(row_id, "rule_filter_mismatch"))], None
     if row_id in removed_domain_ids:
         detail = str(removed_domain_reason_by_id.get(row_id, "unreachable"))
-        return "removed_domain", [f"domain_{detail}".replace("/", "_").replace(" ", "_").replace(":", "_")], None
+        return "removed_domain", [_domain_reason_token(detail)], None
     if row_id in removed_hubspot_ids:
         detail = removed_hubspot_detail_by_id.get(row_id)
         return "removed_hubspot", ["hubspot_duplicate_match"], detail if isinstance(detail, dict) else None
@@ -1680,93 +2399,111 @@ def _domain_result_resolved_ips_csv(result: Optional[dict]) -> str:
 
 
 def _normalize_domain_col(df: pl.DataFrame, domain_field: str) -> pl.DataFrame:
-    """Add a __domain_key column via a single map_elements call, only if not already present."""
+    """Add a __domain_key column with Polars string kernels, only if not already present."""
     if "__domain_key" in df.columns:
         return df
-    return df.with_columns(
-        pl.col(domain_field)
-        .cast(pl.Utf8)
-        .map_elements(lambda d: normalize_domain_key(str(d or "")), return_dtype=pl.Utf8)
-        .alias("__domain_key")
-    )
+    return df.with_columns(normalize_domain_key_series(df[domain_field]).alias("__domain_key"))
+
+
+def _attach_domain_keys(
+    df_with_id: pl.DataFrame,
+    working: pl.DataFrame,
+    domain_field: str,
+) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Normalize __domain_key once on the full frame and carry it onto the working subset.
+
+    __row_id is the positional index of df_with_id, so the subset's keys are a gather
+    rather than a second normalization pass. The _build_* join helpers below expect
+    this column to be present.
+    """
+    df_with_id = _normalize_domain_col(df_with_id, domain_field)
+    if "__domain_key" not in working.columns:
+        working = working.with_columns(df_with_id["__domain_key"].gather(working["__row_id"]))
+    return df_with_id, working
 
 
 def _build_resolved_ips_columns(df: pl.DataFrame, domain_field: str, domain_results: dict) -> pl.DataFrame:
     """Add resolved_ips column via vectorized join instead of per-row map_elements."""
-    df = _normalize_domain_col(df, domain_field)
-    lookup_rows = []
-    for domain_key, result in domain_results.items():
-        lookup_rows.append({"__domain_key": domain_key, RESOLVED_IPS_COLUMN: _domain_result_resolved_ips_csv(result)})
-    if not lookup_rows:
+    if not domain_results:
         return df.with_columns(pl.lit("").alias(RESOLVED_IPS_COLUMN))
-    lookup_df = pl.DataFrame(lookup_rows)
+    lookup_df = pl.DataFrame(
+        {
+            "__domain_key": list(domain_results),
+            RESOLVED_IPS_COLUMN: [_domain_result_resolved_ips_csv(result) for result in domain_results.values()],
+        },
+        schema={"__domain_key": pl.Utf8, RESOLVED_IPS_COLUMN: pl.Utf8},
+    )
     joined = df.join(lookup_df, on="__domain_key", how="left")
     return joined.with_columns(pl.col(RESOLVED_IPS_COLUMN).fill_null(""))
 
 
 def _build_homepage_signal_columns(df: pl.DataFrame, domain_field: str, homepage_results: dict) -> pl.DataFrame:
     """Add all homepage signal columns via a single vectorized join."""
-    df = _normalize_domain_col(df, domain_field)
     signal_keys = [
-        ("html_lang", HTML_LANG_COLUMN, ""),
-        ("currency_signals", CURRENCY_SIGNALS_COLUMN, "none"),
-        ("meta_title", META_TITLE_COLUMN, ""),
-        ("meta_description", META_DESCRIPTION_COLUMN, ""),
-        ("b2b_score", B2B_SCORE_COLUMN, 0),
-        ("us_signals", US_SIGNALS_COLUMN, False),
-        ("website_keywords_match", WEBSITE_KEYWORDS_MATCH_COLUMN, False),
-        ("homepage_status", HOMEPAGE_STATUS_COLUMN, "inconclusive:missing_homepage_signals"),
+        ("html_lang", HTML_LANG_COLUMN, "", pl.Utf8),
+        ("currency_signals", CURRENCY_SIGNALS_COLUMN, "none", pl.Utf8),
+        ("meta_title", META_TITLE_COLUMN, "", pl.Utf8),
+        ("meta_description", META_DESCRIPTION_COLUMN, "", pl.Utf8),
+        ("b2b_score", B2B_SCORE_COLUMN, 0, pl.Int64),
+        ("us_signals", US_SIGNALS_COLUMN, False, pl.Boolean),
+        ("website_keywords_match", WEBSITE_KEYWORDS_MATCH_COLUMN, False, pl.Boolean),
+        ("homepage_status", HOMEPAGE_STATUS_COLUMN, "inconclusive:missing_homepage_signals", pl.Utf8),
     ]
     if not homepage_results:
-        for _, col_name, default in signal_keys:
-            df = df.with_columns(pl.lit(default).alias(col_name))
-        return df
-    lookup_rows = []
-    for domain_key, result in homepage_results.items():
-        row = {"__domain_key": domain_key}
-        for src_key, col_name, default in signal_keys:
-            val = result.get(src_key)
-            row[col_name] = val if val is not None else default
-        lookup_rows.append(row)
-    lookup_df = pl.DataFrame(lookup_rows)
+        return df.with_columns([pl.lit(default, dtype=dtype).alias(col_name) for _, col_name, default, dtype in signal_keys])
+    # Columnar lookup with an explicit schema; nulls (missing or mistyped
+    # values) take the column default after the join.
+    results = list(homepage_results.values())
+    lookup_columns: dict[str, list] = {"__domain_key": list(homepage_results)}
+    lookup_schema: dict[str, Any] = {"__domain_key": pl.Utf8}
+    for src_key, col_name, _, dtype in signal_keys:
+        lookup_columns[col_name] = [result.get(src_key) for result in results]
+        lookup_schema[col_name] = dtype
+    lookup_df = pl.DataFrame(lookup_columns, schema=lookup_schema, strict=False)
     # Drop any pre-existing signal columns before joining
-    existing_signal_cols = [col for _, col, _ in signal_keys if col in df.columns]
+    existing_signal_cols = [col for _, col, _, _ in signal_keys if col in df.columns]
     if existing_signal_cols:
         df = df.drop(existing_signal_cols)
     joined = df.join(lookup_df, on="__domain_key", how="left")
-    for _, col_name, default in signal_keys:
-        joined = joined.with_columns(pl.col(col_name).fill_null(default))
-    return joined
+    return joined.with_columns([pl.col(col_name).fill_null(default) for _, col_name, default, _ in signal_keys])
 
 
-def _build_domain_alive_mask(df: pl.DataFrame, domain_field: str, domain_results: dict) -> pl.Series:
-    """Build a boolean mask for domain liveness via vectorized join."""
-    df = _normalize_domain_col(df, domain_field)
-    alive_map = {
-        dk: _domain_result_allows_row(result)
-        for dk, result in domain_results.items()
-    }
-    lookup_rows = [{"__domain_key": dk, "__domain_alive": alive} for dk, alive in alive_map.items()]
-    if not lookup_rows:
+def _build_domain_alive_mask(df: pl.DataFrame, domain_results: dict) -> pl.Series:
+    """Build a boolean mask for domain liveness: `__domain_key` is a live result key."""
+    if not domain_results:
         return pl.Series("__domain_alive", [False] * df.height)
-    lookup_df = pl.DataFrame(lookup_rows)
-    joined = df.select("__domain_key").join(lookup_df, on="__domain_key", how="left")
-    return joined["__domain_alive"].fill_null(False)
+    # Membership in the live-key column; unknown/null keys are dead.
+    alive_keys = pl.Series(
+        [key for key, result in domain_results.items() if _domain_result_allows_row(result)], dtype=pl.Utf8
+    )
+    return df["__domain_key"].is_in(alive_keys).fill_null(False).alias("__domain_alive")
 
 
-def _build_homepage_alive_mask(df: pl.DataFrame, domain_field: str, homepage_results: dict) -> pl.Series:
-    """Build a boolean mask for homepage qualification via vectorized join."""
-    df = _normalize_domain_col(df, domain_field)
-    alive_map = {
-        dk: _homepage_result_allows_row(result)
-        for dk, result in homepage_results.items()
-    }
-    lookup_rows = [{"__domain_key": dk, "__hp_alive": alive} for dk, alive in alive_map.items()]
-    if not lookup_rows:
+def _removed_reason_by_row_id(removed_df: pl.DataFrame, results: dict, field: str, default: str) -> dict[int, str]:
+    """Row id -> results[__domain_key][field] for removed rows, resolved once per distinct key."""
+    keys = removed_df["__domain_key"].fill_null("")
+    status_by_key = {key: results.get(key, {}).get(field, default) for key in keys.unique().to_list()}
+    return dict(zip(removed_df["__row_id"].to_list(), [status_by_key[key] for key in keys.to_list()]))
+
+
+def _live_domain_keys(domains: list[str], domain_results: dict) -> list[str]:
+    """Keys from `domains` whose rows pass _build_domain_alive_mask, order kept.
+
+    The homepage stage reuses the DNS stage's unique domains through this
+    instead of re-collecting them from the filtered frame.
+    """
+    return [key for key in domains if key in domain_results and _domain_result_allows_row(domain_results[key])]
+
+
+def _build_homepage_alive_mask(df: pl.DataFrame, homepage_results: dict) -> pl.Series:
+    """Build a boolean mask for homepage qualification: `__domain_key` is not a disqualified result key."""
+    if not homepage_results:
         return pl.Series("__hp_alive", [True] * df.height)
-    lookup_df = pl.DataFrame(lookup_rows)
-    joined = df.select("__domain_key").join(lookup_df, on="__domain_key", how="left")
-    return joined["__hp_alive"].fill_null(True)
+    # Only disqualified keys drop a row; unknown/null keys pass.
+    blocked_keys = pl.Series(
+        [key for key, result in homepage_results.items() if not _homepage_result_allows_row(result)], dtype=pl.Utf8
+    )
+    return (~df["__domain_key"].is_in(blocked_keys)).fill_null(True).alias("__hp_alive")
 
 
 def _homepage_result_allows_row(result: Optional[dict]) -> bool:
@@ -1790,31 +2527,59 @@ def _parse_form_bool(value: Optional[str]) -> bool:
     return str(value or "").strip().lower() in {"1", "true", "yes", "on"}
 
 
+def _parse_list_payload(
+    payload: Optional[str],
+    splitter: re.Pattern,
+    normalizer: Callable[[str], str],
+) -> list[str]:
+    """
+    Parse a JSON array, a JSON string, or a delimiter-separated string into
+    normalized, de-duplicated (first-seen order), non-empty items.
+    """
+    raw = str(payload or "").strip()
+    if not raw:
+        return []
+
+    values: Optional[list[str]] = None
+    # Only arrays, strings and objects can parse to something other than a
+    # single separator-free token, so skip json.loads for everything else.
+    if raw[:1] in "[{\"":
+        try:
+            parsed = json.loads(raw)
+        except ValueError:
+            parsed = None
+        else:
+            if isinstance(parsed, list):
+                values = [str(v) for v in parsed if v is not None]
+            elif isinstance(parsed, str):
+                values = splitter.split(parsed)
+            else:
+                values = [raw]
+    if values is None:
+        values = splitter.split(raw)
+    return [token for token in dict.fromkeys(normalizer(value) for value in values) if token]
+
+
+def _normalize_lower_token(value: str) -> str:
+    return value.strip().lower()
+
+
 def _parse_blocklist_categories(payload: Optional[str]) -> dict[str, bool]:
     """Parse JSON dict of category→bool for domain blocklist."""
-    if not payload:
-        return {cat: True for cat in BLOCKED_DOMAIN_CATEGORIES}
-    try:
-        parsed = json.loads(str(payload))
+    raw = str(payload or "").strip()
+    if raw[:1] == "{":
+        try:
+            parsed = json.loads(raw)
+        except ValueError:
+            parsed = None
         if isinstance(parsed, dict):
             return {str(k): bool(v) for k, v in parsed.items()}
-    except (json.JSONDecodeError, TypeError):
-        pass
     return {cat: True for cat in BLOCKED_DOMAIN_CATEGORIES}
 
 
 def _parse_custom_blocked_domains(payload: Optional[str]) -> list[str]:
     """Parse JSON array or comma/newline-separated list of custom blocked domains."""
-    if not payload:
-        return []
-    try:
-        parsed = json.loads(str(payload))
-        if isinstance(parsed, list):
-            return [str(d).strip().lower() for d in parsed if str(d).strip()]
-    except (json.JSONDecodeError, TypeError):
-        pass
-    parts = re.split(r"[,\n]+", str(payload))
-    return [p.strip().lower() for p in parts if p.strip()]
+    return _parse_list_payload(payload, _COMMA_NL_SPLIT_RE, _normalize_lower_token)
 
 
 def _normalize_tld_token(value: str) -> str:
@@ -1823,7 +2588,7 @@ def _normalize_tld_token(value: str) -> str:
         return ""
     raw = raw.replace("*.", "")
     raw = raw.strip(".")
-    raw = re.sub(r"[^a-z0-9.-]", "", raw)
+    raw = _TLD_DISALLOWED_CHARS_RE.sub("", raw)
     if not raw:
         return ""
     return f".{raw}"
@@ -1834,84 +2599,15 @@ def _parse_tld_list_payload(payload: Optional[str]) -> set[str]:
     Accept JSON arrays or comma/newline-separated strings of TLD suffixes.
     Returns canonical tokens like ".co.uk" or ".com".
     """
-    raw = str(payload or "").strip()
-    if not raw:
-        return set()
-
-    items: list[str]
-    try:
-        parsed = json.loads(raw)
-        if isinstance(parsed, list):
-            items = [str(v) for v in parsed]
-        elif isinstance(parsed, str):
-            items = re.split(r"[\s,]+", parsed)
-        else:
-            items = [raw]
-    except Exception:
-        items = re.split(r"[\s,]+", raw)
-
-    out = set()
-    for item in items:
-        token = _normalize_tld_token(item)
-        if token:
-            out.add(token)
-    return out
+    return set(_parse_list_payload(payload, _WS_COMMA_SPLIT_RE, _normalize_tld_token))
 
 
 def _parse_website_keywords_payload(payload: Optional[str]) -> list[str]:
-    raw = str(payload or "").strip()
-    if not raw:
-        return []
-
-    values: list[str]
-    try:
-        parsed = json.loads(raw)
-        if isinstance(parsed, list):
-            values = [str(v) for v in parsed]
-        elif isinstance(parsed, str):
-            values = re.split(r"[\n,]+", parsed)
-        else:
-            values = [raw]
-    except Exception:
-        values = re.split(r"[\n,]+", raw)
-
-    deduped: list[str] = []
-    seen: set[str] = set()
-    for value in values:
-        token = str(value or "").strip().lower()
-        if not token or token in seen:
-            continue
-        seen.add(token)
-        deduped.append(token)
-    return deduped
+    return _parse_list_payload(payload, _COMMA_NL_SPLIT_RE, _normalize_lower_token)
 
 
 def _parse_export_columns_payload(payload: Optional[str]) -> list[str]:
-    raw = str(payload or "").strip()
-    if not raw:
-        return []
-
-    values: list[str]
-    try:
-        parsed = json.loads(raw)
-        if isinstance(parsed, list):
-            values = [str(v) for v in parsed]
-        elif isinstance(parsed, str):
-            values = re.split(r"[\n,]+", parsed)
-        else:
-            values = [raw]
-    except Exception:
-        values = re.split(r"[\n,]+", raw)
-
-    selected: list[str] = []
-    seen: set[str] = set()
-    for value in values:
-        token = str(value or "").strip()
-        if not token or token in seen:
-            continue
-        seen.add(token)
-        selected.append(token)
-    return selected
+    return _parse_list_payload(payload, _COMMA_NL_SPLIT_RE, str.strip)
 
 
 def _apply_export_column_selection(df: pl.DataFrame, selected_columns: list[str]) -> pl.DataFrame:
@@ -1926,15 +2622,15 @@ def _apply_export_column_selection(df: pl.DataFrame, selected_columns: list[str]
     return df.select(keep)
 
 
+# Each prefix is stripped at most once, in this order.
+_DOMAIN_PREFIX_RE = re.compile(r"^(?:https://)?(?:http://)?(?:www\.)?")
+
+
 def normalize_domain(d: str) -> str:
     """Strip protocol, www., trailing slash from a domain string."""
     if not d or not isinstance(d, str):
         return ""
-    d = d.strip().lower()
-    for prefix in ("https://", "http://", "www."):
-        if d.startswith(prefix):
-            d = d[len(prefix):]
-    return d.rstrip("/").strip()
+    return _DOMAIN_PREFIX_RE.sub("", d.strip().lower(), count=1).rstrip("/").strip()
 
 
 def _extract_domain_host(value: Optional[str]) -> str:
@@ -1945,18 +2641,63 @@ def _extract_domain_host(value: Optional[str]) -> str:
     return host
 
 
-def _host_matches_tld(host: str, tld: str) -> bool:
-    suffix = str(tld or "").strip().lower().lstrip(".")
-    if not suffix or not host:
-        return False
-    return host == suffix or host.endswith(f".{suffix}")
+def _extract_domain_host_series(values: pl.Series) -> pl.Series:
+    """Column-wise _extract_domain_host for printable-ASCII values; nulls stay null."""
+    clean = (
+        values.cast(pl.Utf8, strict=False)
+        .str.strip_chars()
+        .str.to_lowercase()
+        .str.strip_prefix("https://")
+        .str.strip_prefix("http://")
+        .str.strip_prefix("www.")
+        .str.strip_chars_end("/")
+        .str.strip_chars()
+    )
+    return (
+        clean.str.extract(r"^([^/:]*)", 1)
+        .str.strip_chars()
+        .str.strip_chars(".")
+    )
+
+
+def _match_tld_suffix_series(hosts: pl.Series, index: dict[str, tuple[int, str]]) -> pl.Series:
+    """Column-wise _match_tld_suffix: the highest-priority matching token per host, else null."""
+    if not index:
+        return pl.Series(hosts.name, [None] * hosts.len(), dtype=pl.Utf8)
+    host = pl.col(hosts.name)
+    matches = [
+        pl.when((host == suffix) | host.str.ends_with(f".{suffix}")).then(pl.lit(token, dtype=pl.Utf8))
+        for suffix, (_, token) in sorted(index.items(), key=lambda item: item[1][0])
+    ]
+    return hosts.to_frame().select(pl.coalesce(matches).alias(hosts.name)).to_series()
 
 
-def _match_tld_suffix(host: str, tlds: set[str]) -> Optional[str]:
-    for token in sorted(tlds, key=len, reverse=True):
-        if _host_matches_tld(host, token):
-            return token
-    return None
+def _build_tld_suffix_index(tlds: set[str]) -> dict[str, tuple[int, str]]:
+    """Map each normalized TLD suffix to (priority, original token); longer tokens win."""
+    index: dict[str, tuple[int, str]] = {}
+    for rank, token in enumerate(sorted(tlds, key=len, reverse=True)):
+        suffix = str(token or "").strip().lower().lstrip(".")
+        if suffix:
+            index.setdefault(suffix, (rank, token))
+    return index
+
+
+def _match_tld_suffix(host: str, tlds: set[str] | dict[str, tuple[int, str]]) -> Optional[str]:
+    """Return the TLD token matching host, walking its label suffixes against the index.
+    Accepts a TLD set or a prebuilt _build_tld_suffix_index() map."""
+    if not host or not tlds:
+        return None
+    index = tlds if isinstance(tlds, dict) else _build_tld_suffix_index(tlds)
+    best: Optional[tuple[int, str]] = None
+    candidate = host
+    while True:
+        hit = index.get(candidate)
+        if hit is not None and (best is None or hit[0] < best[0]):
+            best = hit
+        dot = candidate.find(".")
+        if dot < 0:
+            return best[1] if best else None
+        candidate = candidate[dot + 1:]
 
 
 def _is_country_code_root(host: str) -> bool:
@@ -1968,8 +2709,8 @@ def _is_country_code_root(host: str) -> bool:
 
 def _evaluate_tld_filter(
     domain_value: Optional[str],
-    disallowed_tlds: set[str],
-    allowed_tlds: set[str],
+    disallowed_tlds: set[str] | dict[str, tuple[int, str]],
+    allowed_tlds: set[str] | dict[str, tuple[int, str]],
     exclude_country_tlds: bool,
 ) -> tuple[bool, Optional[str], Optional[str]]:
     host = _extract_domain_host(domain_value)
@@ -2009,52 +2750,94 @@ def _apply_domain_tld_filter(
     if df.height == 0 or domain_field not in df.columns:
         return df, 0, 0, [], {}
 
-    domain_values = df[domain_field].cast(pl.Utf8).to_list()
-    unique_domains = {
-        d for d in domain_values
-        if d and str(d).strip().lower() not in ("unknown", "n/a", "")
-    }
+    col = df[domain_field].cast(pl.Utf8)
+    is_blank = col.is_null() | col.str.strip_chars().str.to_lowercase().is_in(list(_TLD_BLANK_VALUES))
+    domains = col.filter(~is_blank).unique(maintain_order=True).alias("__tld_domain")
+
+    disallowed_index = _build_tld_suffix_index(disallowed_tlds)
+    allowed_index = _build_tld_suffix_index(allowed_tlds)
+
+    # Printable-ASCII values are decided column-wise; anything else (unicode
+    # whitespace/letters, control chars) keeps the scalar str semantics.
+    fallback_mask = domains.str.contains(r"[^\x20-\x7e]")
+    vector_domains = domains.filter(~fallback_mask)
+    hosts = _extract_domain_host_series(vector_domains).alias("host")
+    # Many raw values share a host (scheme/path variants); match suffixes once per host.
+    unique_hosts = hosts.unique()
+    host_tokens = pl.DataFrame({
+        "host": unique_hosts,
+        "allow": _match_tld_suffix_series(unique_hosts, allowed_index),
+        "disallow": _match_tld_suffix_series(unique_hosts, disallowed_index),
+        "root": unique_hosts.str.extract(r"\.([a-z]{2})$", 1),
+    })
+    blocked_token = (
+        pl.when((pl.col("host") == "") | pl.col("allow").is_not_null())
+        .then(pl.lit(None, dtype=pl.Utf8))
+        .when(pl.col("disallow").is_not_null())
+        .then(pl.col("disallow"))
+        .when(pl.lit(bool(exclude_country_tlds)) & pl.col("root").is_not_null())
+        .then(pl.lit(".") + pl.col("root"))
+    )
+    decisions = pl.DataFrame({"__tld_domain": vector_domains, "host": hosts}).join(
+        host_tokens, on="host", how="left"
+    ).select(
+        "__tld_domain",
+        (pl.lit("disallowed_tld_") + blocked_token.str.strip_chars_start(".").str.replace_all(".", "_", literal=True))
+        .alias("__tld_code"),
+        (pl.lit("disallowed tld (") + blocked_token + pl.lit(")")).alias("__tld_status"),
+    )
 
-    decision_by_domain: dict[str, tuple[bool, Optional[str], Optional[str]]] = {}
-    for domain in unique_domains:
-        decision_by_domain[domain] = _evaluate_tld_filter(
+    checked_count = vector_domains.len()
+    fallback_rows: list[tuple[str, Optional[str], Optional[str]]] = []
+    for domain in domains.filter(fallback_mask).to_list():
+        if str(domain).strip().lower() in _TLD_BLANK_VALUES:
+            continue
+        checked_count += 1
+        _, code, status = _evaluate_tld_filter(
             domain_value=domain,
-            disallowed_tlds=disallowed_tlds,
-            allowed_tlds=allowed_tlds,
+            disallowed_tlds=disallowed_index,
+            allowed_tlds=allowed_index,
             exclude_country_tlds=exclude_country_tlds,
         )
+        fallback_rows.append((domain, code, status))
+    if fallback_rows:
+        decisions = pl.concat([
+            decisions,
+            pl.DataFrame(fallback_rows, schema=decisions.schema, orient="row"),
+        ])
 
-    disallowed_domain_values = [d for d, (allowed, _, _) in decision_by_domain.items() if not allowed]
-    col = df[domain_field].cast(pl.Utf8)
-    is_blank = col.is_null() | col.str.strip_chars().str.to_lowercase().is_in(["", "unknown", "n/a"])
-    keep_mask = is_blank | ~col.is_in(disallowed_domain_values)
+    blocked = decisions.filter(pl.col("__tld_code").is_not_null())
+    # One hash join tags every row with its block code (null = kept); the same
+    # column feeds both the keep mask and the per-row reasons.
+    row_codes = col.alias("__tld_domain").to_frame().join(
+        blocked.select(["__tld_domain", "__tld_code"]), on="__tld_domain", how="left", maintain_order="left"
+    )["__tld_code"]
+    keep_mask = is_blank | row_codes.is_null()
 
     filtered = df.filter(keep_mask)
     removed_count = df.height - filtered.height
     if removed_count <= 0:
-        return filtered, 0, len(unique_domains), [], {}
+        return filtered, 0, checked_count, [], {}
 
-    dead_domains = []
-    for domain, (allowed, _, status) in decision_by_domain.items():
-        if not allowed:
-            dead_domains.append({"domain": domain, "status": status or "disallowed tld"})
+    dead_domains = [
+        {"domain": domain, "status": status or "disallowed tld"}
+        for domain, status in blocked.select(["__tld_domain", "__tld_status"]).iter_rows()
+    ]
 
-    reasons_by_row_id: dict[int, str] = {}
-    removed_rows = df.filter(~keep_mask).select(["__row_id", domain_field]).to_dicts()
-    for item in removed_rows:
-        domain_value = item.get(domain_field)
-        _, code, _ = decision_by_domain.get(domain_value, (False, "disallowed_tld", None))
-        reasons_by_row_id[int(item["__row_id"])] = str(code or "disallowed_tld")
+    reasons_by_row_id: dict[int, str] = dict(zip(
+        df["__row_id"].filter(~keep_mask).cast(pl.Int64).to_list(),
+        row_codes.filter(~keep_mask).to_list(),
+    ))
 
-    return filtered, removed_count, len(unique_domains), dead_domains, reasons_by_row_id
+    return filtered, removed_count, checked_count, dead_domains, reasons_by_row_id
 
 
 def normalize_company_text(value: str) -> str:
     """Normalize company-like text for duplicate detection."""
     if not value:
         return ""
-    cleaned = re.sub(r"[^a-z0-9]+", " ", str(value).lower()).strip()
-    return re.sub(r"\s+", " ", cleaned)
+    cleaned = _NONALNUM_RE.sub(" ", str(value).lower()).strip()
+    return _WS_RE.sub(" ", cleaned)
 
 
 def normalize_link(value: str) -> str:
@@ -2067,6 +2850,9 @@ def normalize_link(value: str) -> str:
 
 
 _COMMON_SUBDOMAINS = ("www.", "app.", "mail.", "blog.", "m.", "ww1.", "ww2.", "www2.", "web.", "portal.")
+# Alternation is tried in tuple order (leftmost-first in both Python re and
+# Polars), so this strips the same single prefix as a startswith loop.
+_COMMON_SUBDOMAIN_RE = re.compile("^(?:" + "|".join(re.escape(prefix) for prefix in _COMMON_SUBDOMAINS) + ")")
 
 
 def normalize_domain_key(value: str) -> str:
@@ -2078,7 +2864,7 @@ def normalize_domain_key(value: str) -> str:
         return ""
 
     # If protocol is missing, urlsplit treats host as path.
-    candidate = raw if re.match(r"^[a-z][a-z0-9+.-]*://", raw) else f"http://{raw}"
+    candidate = raw if _URL_SCHEME_RE.match(raw) else f"http://{raw}"
     try:
         parsed = urlsplit(candidate)
     except Exception:
@@ -2089,22 +2875,97 @@ def normalize_domain_key(value: str) -> str:
     if not host:
         return ""
     host = host.split("/", 1)[0].split("@")[-1].split(":", 1)[0].strip(".")
-    for prefix in _COMMON_SUBDOMAINS:
-        if host.startswith(prefix):
-            host = host[len(prefix):]
-            break
-    return host
+    return _COMMON_SUBDOMAIN_RE.sub("", host, count=1)
+
+
+_URL_SCHEME_RE = re.compile(r"^[a-z][a-z0-9+.-]*://")
+# Values urlsplit treats specially (stripped control chars, IPv6 brackets,
+# NFKC netloc checks on non-ASCII) go through normalize_domain_key itself.
+_DOMAIN_KEY_FALLBACK_RE = re.compile(r"[^\x20-\x7e]|[\[\]]")
+
+
+def normalize_domain_key_series(values: pl.Series) -> pl.Series:
+    """Column-wise normalize_domain_key; nulls stay null."""
+    values = values.cast(pl.Utf8, strict=False)
+    raw = values.str.strip_chars().str.to_lowercase()
+    rest = raw.str.replace(_URL_SCHEME_RE.pattern, "")
+    # urlsplit netloc: everything up to the first / ? or #.
+    host = (
+        rest.str.extract(r"^([^/?#]*)", 1)
+        .str.replace(r"^.*@", "")
+        .str.replace(r":.*$", "")
+        .str.strip_chars(".")
+        .str.replace(_COMMON_SUBDOMAIN_RE.pattern, "")
+    )
+    keys = (
+        pl.select(
+            pl.when((raw == "") | raw.str.contains(" ", literal=True))
+            .then(pl.lit(""))
+            .otherwise(host)
+            .alias(values.name)
+        )
+        .to_series()
+    )
+    fallback_idx = values.str.contains(_DOMAIN_KEY_FALLBACK_RE.pattern).fill_null(False).arg_true()
+    if fallback_idx.len():
+        keys = keys.scatter(fallback_idx, [normalize_domain_key(v) for v in values.gather(fallback_idx).to_list()])
+    return keys
 
 
-def is_blocked_domain(host: str, blocked_suffixes: list[str]) -> Optional[str]:
+def build_blocked_suffix_index(blocked_suffixes: list[str]) -> dict[str, int]:
+    """Map each blocked suffix to its first position in the list (match priority)."""
+    index: dict[str, int] = {}
+    for rank, suffix in enumerate(blocked_suffixes):
+        index.setdefault(suffix, rank)
+    return index
+
+
+def is_blocked_domain(host: str, blocked_suffixes: list[str] | dict[str, int]) -> Optional[str]:
     """Check if a normalized domain matches any blocked domain suffix.
+    Accepts a suffix list or a prebuilt build_blocked_suffix_index() map.
     Returns the matching blocked suffix or None."""
     if not host or not blocked_suffixes:
         return None
-    for suffix in blocked_suffixes:
-        if host == suffix or host.endswith(f".{suffix}"):
-            return suffix
-    return None
+    index = blocked_suffixes if isinstance(blocked_suffixes, dict) else build_blocked_suffix_index(blocked_suffixes)
+    # Look up the host and every label suffix of it instead of scanning the
+    # blocklist; ties go to the suffix listed first, as with a linear scan.
+    best_rank = -1
+    match = None
+    candidate = host
+    while True:
+        rank = index.get(candidate)
+        if rank is not None and (match is None or rank < best_rank):
+            best_rank = rank
+            match = candidate
+        dot = candidate.find(".")
+        if dot < 0:
+            return match
+        candidate = candidate[dot + 1:]
+
+
+def match_blocked_domain_series(values: pl.Series, blocked_suffixes: list[str]) -> pl.Series:
+    """Column-wise is_blocked_domain over raw domain values; null where nothing matches.
+
+    One anchored regex over the normalized hosts finds the blocked rows; the
+    matched suffix (first-listed wins) is resolved once per distinct blocked host.
+    """
+    hosts = normalize_domain_key_series(values).fill_null("")
+    matches = pl.Series(values.name, [None] * hosts.len(), dtype=pl.Utf8)
+    if not blocked_suffixes or hosts.len() == 0:
+        return matches
+    pattern = r"(?:^|\.)(?:" + "|".join(re.escape(suffix) for suffix in dict.fromkeys(blocked_suffixes)) + r")$"
+    blocked_idx = hosts.str.contains(pattern).arg_true()
+    if blocked_idx.len() == 0:
+        return matches
+    index = build_blocked_suffix_index(blocked_suffixes)
+    blocked_hosts = hosts.gather(blocked_idx)
+    unique_hosts = blocked_hosts.unique().to_list()
+    return matches.scatter(
+        blocked_idx,
+        blocked_hosts.replace_strict(
+            unique_hosts, [is_blocked_domain(host, index) for host in unique_hosts], return_dtype=pl.Utf8
+        ),
+    )
 
 
 def build_blocked_suffixes(categories: dict[str, bool], custom_domains: list[str]) -> list[str]:
@@ -2138,7 +2999,7 @@ def normalize_linkedin_key(value: str) -> str:
         # likely plain linkedin handle (without @)
         return raw
 
-    candidate = raw if re.match(r"^[a-z][a-z0-9+.-]*://", raw) else f"https://{raw}"
+    candidate = raw if _URL_SCHEME_RE.match(raw) else f"https://{raw}"
     try:
         parsed = urlsplit(candidate)
     except Exception:
@@ -2179,43 +3040,191 @@ def _split_multivalue_tokens(value: str) -> list[str]:
     raw = str(value or "").strip()
     if not raw:
         return []
-    parts = [part.strip() for part in re.split(r"[,\n;|]+", raw) if part and str(part).strip()]
+    parts = [part.strip() for part in _MULTIVALUE_SPLIT_RE.split(raw) if part and str(part).strip()]
     return parts if len(parts) > 1 else [raw]
 
 
+def _unique_keys(keys: Iterable[str]) -> list[str]:
+    return [key for key in dict.fromkeys(keys) if key and key not in _PLACEHOLDER_KEYS]
+
+
 def _extract_normalized_keys(value: str, key_class: str) -> list[str]:
     tokens = _split_multivalue_tokens(value) if key_class in ("domain", "linkedin", "email") else [str(value or "")]
-    out: list[str] = []
-    seen: set[str] = set()
-    for token in tokens:
-        if key_class == "domain":
-            key = normalize_domain_key(token)
-        elif key_class == "linkedin":
-            key = normalize_linkedin_key(token)
-        elif key_class == "email":
-            key = normalize_email_key(token)
-        else:
-            key = normalize_company_text(token)
-        if not key or key in seen or key in {"unknown", "n/a", "none", "null"}:
-            continue
-        seen.add(key)
-        out.append(key)
-    return out
+    if key_class == "domain":
+        normalize = normalize_domain_key
+    elif key_class == "linkedin":
+        normalize = normalize_linkedin_key
+    elif key_class == "email":
+        normalize = normalize_email_key
+    else:
+        normalize = normalize_company_text
+    return _unique_keys(normalize(token) for token in tokens)
+
+
+def _extract_normalized_key_frame(
+    values: pl.Series,
+    key_class: str,
+    key_memo: Optional[dict[tuple[str, str], list[str]]] = None,
+) -> pl.DataFrame:
+    """Column-wise _extract_normalized_keys for non-null values.
+
+    Returns one (__idx, __value, __key) row per extracted key in input row order,
+    where __idx is the value's position in the input. Values holding characters
+    where str.strip() and Polars whitespace trimming disagree go through the
+    scalar extractor, memoized per (value, key_class) in `key_memo` so callers
+    can share it across the columns of one dedupe call.
+    """
+    values = values.cast(pl.Utf8, strict=False)
+    frame = pl.DataFrame({"__value": values}).with_row_index("__idx").drop_nulls("__value")
+    odd_mask = frame["__value"].str.contains(r"[^\t-\r\x20-\x7e]")
+    vector = frame.filter(~odd_mask)
+
+    value = pl.col("__value")
+    if key_class in ("domain", "linkedin", "email"):
+        raw = value.str.strip_chars()
+        parts = raw.str.extract_all(r"[^,\n;|]+").list.eval(
+            pl.element().str.strip_chars().filter(pl.element().str.strip_chars() != "")
+        )
+        tokens = (
+            pl.when(parts.list.len() > 1)
+            .then(parts)
+            .when(raw != "")
+            .then(pl.concat_list(raw))
+            .otherwise(pl.lit([], dtype=pl.List(pl.Utf8)))
+        )
+    else:
+        tokens = pl.concat_list(value)
+    exploded = vector.select("__idx", "__value", tokens.alias("__token")).explode("__token").drop_nulls("__token")
+
+    token = exploded["__token"]
+    if key_class == "domain":
+        keys = normalize_domain_key_series(token)
+    elif key_class == "email":
+        lowered = token.str.strip_chars().str.to_lowercase()
+        keys = pl.select(
+            pl.when(lowered.str.contains(EMAIL_RE.pattern)).then(lowered).otherwise(pl.lit("")).alias("__token")
+        ).to_series()
+    elif key_class == "linkedin":
+        unique_tokens = token.unique().to_list()
+        keys = token.replace_strict(
+            unique_tokens, [normalize_linkedin_key(item) for item in unique_tokens], return_dtype=pl.Utf8
+        )
+    else:
+        keys = (
+            token.str.to_lowercase()
+            .str.replace_all(_NONALNUM_RE.pattern, " ")
+            .str.strip_chars()
+            .str.replace_all(_WS_RE.pattern, " ")
+        )
+    keyed = exploded.select("__idx", "__value").with_columns(keys.alias("__key"))
+
+    if key_memo is None:
+        key_memo = {}
+    odd_rows = []
+    for idx, raw_value in frame.filter(odd_mask).iter_rows():
+        memo_key = (raw_value, key_class)
+        keys = key_memo.get(memo_key)
+        if keys is None:
+            keys = key_memo[memo_key] = _extract_normalized_keys(raw_value, key_class)
+        odd_rows.extend((idx, raw_value, key) for key in keys)
+    if odd_rows:
+        keyed = pl.concat([keyed, pl.DataFrame(odd_rows, schema=keyed.schema, orient="row")]).sort(
+            "__idx", maintain_order=True
+        )
+    return keyed.filter(
+        ~pl.col("__key").is_in(list(_PLACEHOLDER_VALUES))
+    ).select("__idx", "__value", "__key")
 
 
-def _collect_unique_normalized_domains(values: list[str]) -> list[str]:
-    out: list[str] = []
-    seen: set[str] = set()
-    for value in values:
-        raw = str(value or "").strip()
-        if not raw or raw.lower() in {"unknown", "n/a", "none", "null"}:
-            continue
-        key = normalize_domain_key(raw)
-        if not key or key in {"unknown", "n/a", "none", "null"} or key in seen:
-            continue
-        seen.add(key)
-        out.append(key)
-    return out
+def _collect_unique_normalized_domains(values: pl.Series, keys: Optional[pl.Series] = None) -> list[str]:
+    """Distinct normalized domain keys in first-seen order, skipping placeholder values.
+
+    keys may pass an already-normalized __domain_key column aligned with values.
+    """
+    values = values.cast(pl.Utf8, strict=False)
+    if keys is None:
+        keys = normalize_domain_key_series(values)
+    raw = values.str.strip_chars()
+    valid = ~(raw.is_null() | raw.str.to_lowercase().is_in(list(_PLACEHOLDER_VALUES)))
+    # str.strip() also drops a few ASCII separators Polars keeps; recheck those rows in Python.
+    odd_idx = values.str.contains(r"[\x00-\x1f\x7f]").fill_null(False).arg_true()
+    if odd_idx.len():
+        valid = valid.scatter(
+            odd_idx,
+            [str(v).strip().lower() not in _PLACEHOLDER_VALUES for v in values.gather(odd_idx).to_list()],
+        )
+    return _unique_keys(keys.filter(valid).unique(maintain_order=True).to_list())
+
+
+_GUESS_KEY_COLUMN_HINTS: dict[str, tuple[str, ...]] = {
+    "domain": ("domain", "website", "url", "site", "homepage", "web"),
+    "linkedin": ("linkedin", "li url", "li", "linkedin url"),
+    "email": ("email", "e-mail", "mail"),
+    "company": ("company", "account", "organization", "org", "name"),
+}
+_KEY_COLUMN_HINTS: dict[str, tuple[str, ...]] = {
+    "domain": ("domain", "website", "url", "homepage"),
+    "linkedin": ("linkedin", "li url", "linkedin url"),
+    "email": ("email", "e-mail", "mail"),
+    "company": ("company", "account", "organization", "org", "name"),
+}
+_COMPANY_KEY_EXCLUSIONS = (
+    " id",
+    "ids",
+    "owner",
+    "associated",
+    "parent",
+    "child",
+    "deal",
+    "ticket",
+    "contact",
+    "project",
+    "quote",
+    "task",
+    "lead",
+    "campaign",
+    "source",
+    "record",
+    "date",
+    "time",
+    "number of",
+    "count",
+    "industry",
+    "keyword",
+    "domain",
+    "url",
+    "facebook",
+    "linkedin",
+    "twitter",
+    "revenue",
+    "employee",
+    "country",
+    "state",
+    "city",
+    "postal",
+    "phone",
+    "address",
+    "first name",
+    "last name",
+    "fullname",
+    "full name",
+)
+_DOMAIN_KEY_EXCLUSIONS = ("linkedin", "logo", "technolog", "pagerank", "page rank", "tranco", "umbrella")
+_EMAIL_KEY_EXCLUSIONS = ("email owner", "email status", "email type", "email domain", "email count")
+
+
+def _substring_any_re(tokens: Iterable[str]) -> re.Pattern:
+    """One alternation regex whose .search() is any(token in text for token in tokens)."""
+    return re.compile("|".join(re.escape(token) for token in tokens))
+
+
+_KEY_COLUMN_HINT_RES = {key_class: _substring_any_re(hints) for key_class, hints in _KEY_COLUMN_HINTS.items()}
+_KEY_COLUMN_EXCLUSION_RES = {
+    "domain": _substring_any_re(_DOMAIN_KEY_EXCLUSIONS),
+    "linkedin": None,
+    "email": _substring_any_re(_EMAIL_KEY_EXCLUSIONS),
+    "company": _substring_any_re(_COMPANY_KEY_EXCLUSIONS),
+}
 
 
 def guess_key_column(columns: list[str], preferred_class: Optional[str] = None) -> tuple[Optional[str], Optional[str]]:
@@ -2223,18 +3232,12 @@ def guess_key_column(columns: list[str], preferred_class: Optional[str] = None)
     Guess best key column and key class.
     Key classes: domain, linkedin, email, company.
     """
-    class_hints = {
-        "domain": ["domain", "website", "url", "site", "homepage", "web"],
-        "linkedin": ["linkedin", "li url", "li", "linkedin url"],
-        "email": ["email", "e-mail", "mail"],
-        "company": ["company", "account", "organization", "org", "name"],
-    }
+    lowered = [(col, col.lower()) for col in columns]
 
     def find_for_class(key_class: str) -> Optional[str]:
-        hints = class_hints[key_class]
-        for hint in hints:
-            for col in columns:
-                if hint in col.lower():
+        for hint in _GUESS_KEY_COLUMN_HINTS[key_class]:
+            for col, col_lower in lowered:
+                if hint in col_lower:
                     return col
         return None
 
@@ -2252,112 +3255,107 @@ def guess_key_column(columns: list[str], preferred_class: Optional[str] = None)
 
 def guess_key_columns(columns: list[str]) -> dict[str, list[str]]:
     """Return candidate key columns by class using lightweight heuristics."""
-    class_hints = {
-        "domain": ["domain", "website", "url", "homepage"],
-        "linkedin": ["linkedin", "li url", "linkedin url"],
-        "email": ["email", "e-mail", "mail"],
-        "company": ["company", "account", "organization", "org", "name"],
-    }
-    company_exclusions = (
-        " id",
-        "ids",
-        "owner",
-        "associated",
-        "parent",
-        "child",
-        "deal",
-        "ticket",
-        "contact",
-        "project",
-        "quote",
-        "task",
-        "lead",
-        "campaign",
-        "source",
-        "record",
-        "date",
-        "time",
-        "number of",
-        "count",
-        "industry",
-        "keyword",
-        "domain",
-        "url",
-        "facebook",
-        "linkedin",
-        "twitter",
-        "revenue",
-        "employee",
-        "country",
-        "state",
-        "city",
-        "postal",
-        "phone",
-        "address",
-    )
-    domain_exclusions = ("logo", "technolog", "pagerank", "page rank", "tranco", "umbrella")
-    email_exclusions = ("email owner", "email status", "email type", "email domain", "email count")
+    return {key_class: list(cols) for key_class, cols in _guess_key_columns_cached(tuple(columns)).items()}
+
+
+@lru_cache(maxsize=256)
+def _guess_key_columns_cached(columns: tuple[str, ...]) -> dict[str, tuple[str, ...]]:
     out: dict[str, list[str]] = {"domain": [], "linkedin": [], "email": [], "company": []}
-    for key_class, hints in class_hints.items():
+    for key_class, hint_re in _KEY_COLUMN_HINT_RES.items():
+        exclusion_re = _KEY_COLUMN_EXCLUSION_RES[key_class]
         for col in columns:
             col_lower = col.lower()
-            if key_class == "domain" and "linkedin" in col_lower:
+            if exclusion_re is not None and exclusion_re.search(col_lower):
                 continue
-            if key_class == "domain" and any(token in col_lower for token in domain_exclusions):
-                continue
-            if key_class == "linkedin" and not (
-                "linkedin" in col_lower or "li url" in col_lower
-            ):
-                continue
-            if key_class == "email" and any(token in col_lower for token in email_exclusions):
-                continue
-            if key_class == "company" and any(token in col_lower for token in ("first name", "last name", "fullname", "full name")):
-                continue
-            if key_class == "company" and any(token in col_lower for token in company_exclusions):
-                continue
-            if any(hint in col_lower for hint in hints):
+            if hint_re.search(col_lower):
                 out[key_class].append(col)
-    return out
+    return {key_class: tuple(cols) for key_class, cols in out.items()}
 
 
 def infer_dedupe_matches(source_columns: list[str], dedupe_columns: list[str]) -> list[dict]:
     """Infer how source keys can be compared against dedupe keys across key types."""
-    source_by_class = guess_key_columns(source_columns)
-    dedupe_by_class = guess_key_columns(dedupe_columns)
-    matches: list[dict] = []
+    return [
+        {key: list(value) if isinstance(value, tuple) else value for key, value in match.items()}
+        for match in _infer_dedupe_matches_cached(tuple(source_columns), tuple(dedupe_columns))
+    ]
+
+
+@lru_cache(maxsize=256)
+def _infer_dedupe_matches_cached(
+    source_columns: tuple[str, ...],
+    dedupe_columns: tuple[str, ...],
+) -> tuple[MappingProxyType, ...]:
+    # Schemas recur across sessions; results are frozen so cache hits can be shared.
+    source_by_class = guess_key_columns(list(source_columns))
+    dedupe_by_class = guess_key_columns(list(dedupe_columns))
+    matches: list[MappingProxyType] = []
     for key_type in ("domain", "linkedin", "email", "company"):
         source_candidates = source_by_class.get(key_type) or []
         source_col = source_candidates[0] if source_candidates else None
         hubspot_cols = dedupe_by_class.get(key_type, [])
         if source_col and hubspot_cols:
-            matches.append({
+            matches.append(MappingProxyType({
                 "keyType": key_type,
                 "sourceColumn": source_col,
-                "sourceColumns": source_candidates,
+                "sourceColumns": tuple(source_candidates),
                 "hubspotColumn": hubspot_cols[0],
-                "hubspotColumns": hubspot_cols,
-            })
-    return matches
+                "hubspotColumns": tuple(hubspot_cols),
+            }))
+    return tuple(matches)
 
 
-def _fuzzy_matches_any(normalized: str, reference_set: set[str], threshold: float = 90.0) -> bool:
-    """Check if a normalized company name fuzzy-matches any reference value."""
-    if not normalized or not reference_set:
-        return False
-    for ref in reference_set:
-        if fuzz.ratio(normalized, ref) >= threshold:
-            return True
-    return False
+# Upper bound on score-matrix cells per cdist call (uint8, so ~16 MB).
+FUZZY_CDIST_MAX_CELLS = 16_000_000
 
 
-def _first_fuzzy_match(normalized: str, reference_set: set[str], threshold: float = 90.0) -> str:
-    """Return first fuzzy-matching reference value, or empty string."""
-    if not normalized or not reference_set:
-        return ""
-    for ref in reference_set:
-        if fuzz.ratio(normalized, ref) >= threshold:
-            return ref
-    return ""
+def _first_fuzzy_matches(
+    candidates: list[str],
+    reference_set: set[str],
+    threshold: float = 90.0,
+    workers: int = -1,
+) -> dict[str, str]:
+    """Map each candidate to its first fuzz.ratio >= threshold reference value ("" if none).
+
+    "First" follows reference_set iteration order. Scores are computed in batched
+    rapidfuzz cdist calls; with score_cutoff every sub-threshold cell is 0, so the
+    first non-zero column of each row is the match.
+
+    fuzz.ratio is 100 * (1 - indel / (len_a + len_b)) and indel >= |len_a - len_b|,
+    so candidates are grouped by length and only scored against references whose
+    length can still reach the threshold. The filter is exact (no false negatives).
+    """
+    candidates = [value for value in dict.fromkeys(candidates) if value]
+    if not candidates or not reference_set:
+        return {value: "" for value in candidates}
+    references = list(reference_set)
+    ref_lengths = np.fromiter((len(value) for value in references), dtype=np.int64, count=len(references))
+    slack = 1.0 - threshold / 100.0
+    candidates_by_length: dict[int, list[str]] = {}
+    for value in candidates:
+        candidates_by_length.setdefault(len(value), []).append(value)
+
+    out: dict[str, str] = {value: "" for value in candidates}
+    for length, group in candidates_by_length.items():
+        ref_idx = np.flatnonzero(np.abs(ref_lengths - length) <= (ref_lengths + length) * slack + 1e-9)
+        if not ref_idx.size:
+            continue
+        group_refs = [references[idx] for idx in ref_idx]
+        chunk_size = max(1, FUZZY_CDIST_MAX_CELLS // len(group_refs))
+        for start in range(0, len(group), chunk_size):
+            chunk = group[start:start + chunk_size]
+            hits = process.cdist(
+                chunk,
+                group_refs,
+                scorer=fuzz.ratio,
+                score_cutoff=threshold,
+                dtype=np.uint8,
+                workers=workers,
+            ) > 0
+            first = hits.argmax(axis=1)
+            for value, row_hit, idx in zip(chunk, hits.any(axis=1), first):
+                if row_hit:
+                    out[value] = group_refs[idx]
+    return out
 
 
 def build_dedupe_key_set(df: pl.DataFrame, column_name: str, key_class: str) -> set[str]:
@@ -2365,22 +3363,78 @@ def build_dedupe_key_set(df: pl.DataFrame, column_name: str, key_class: str) ->
     if not column_name or column_name not in df.columns:
         return set()
 
-    values = df[column_name].cast(pl.Utf8).drop_nulls().to_list()
-    out = set()
-    for value in values:
-        for key in _extract_normalized_keys(value, key_class):
-            out.add(key)
-    return out
+    return set(_extract_normalized_key_frame(df[column_name], key_class)["__key"].unique().to_list())
+
+
+HUBSPOT_MATCH_MAX_WORKERS = 4
+
+# Normalized HubSpot reference keys per (dedupe frame, key columns, key class).
+# Session dedupe frames are reused across previews and runs, so entries are keyed
+# by frame identity and guarded by a weakref against id reuse.
+_HUBSPOT_REFERENCE_CACHE: dict[tuple[int, tuple[str, ...], str], tuple[weakref.ref, tuple[pl.DataFrame, pl.DataFrame]]] = {}
+_HUBSPOT_REFERENCE_CACHE_MAX = 32
+_HUBSPOT_REFERENCE_CACHE_LOCK = threading.Lock()
+
+
+def _hubspot_reference_frame(
+    hubspot_df: pl.DataFrame,
+    hubspot_cols: list[str],
+    key_class: str,
+    cache: bool = False,
+) -> Optional[tuple[pl.DataFrame, pl.DataFrame]]:
+    """Unique reference keys with the first __value each came from, plus the
+    distinct (__value, __column) frame that resolves a value's origin column.
+
+    The origin join is left to the detail stage, which only needs it for the
+    matched keys. Returns None when none of hubspot_cols exist. With cache=True
+    the frames are memoized for this hubspot_df object.
+    """
+    cache_key = (id(hubspot_df), tuple(hubspot_cols), key_class)
+    if cache:
+        with _HUBSPOT_REFERENCE_CACHE_LOCK:
+            cached = _HUBSPOT_REFERENCE_CACHE.get(cache_key)
+        if cached is not None and cached[0]() is hubspot_df:
+            return cached[1]
+
+    # Stack the HubSpot key columns and normalize each distinct raw value
+    # once. The first occurrence of each key stays in the frame as its origin
+    # (column/value); origins are only resolved for rows that end up removed.
+    stacked = [
+        pl.DataFrame({"__value": hubspot_df[hubspot_col].cast(pl.Utf8), "__column": hubspot_col})
+        for hubspot_col in hubspot_cols
+        if hubspot_col in hubspot_df.columns
+    ]
+    if not stacked:
+        return None
+    raw_values = (
+        pl.concat(stacked)
+        .drop_nulls("__value")
+        .unique(subset="__value", keep="first", maintain_order=True)
+    )
+    reference_keys = (
+        _extract_normalized_key_frame(raw_values["__value"], key_class)
+        .unique(subset="__key", keep="first", maintain_order=True)
+    )
+    if cache:
+        with _HUBSPOT_REFERENCE_CACHE_LOCK:
+            for stale_key in [k for k, (ref, _) in _HUBSPOT_REFERENCE_CACHE.items() if ref() is None]:
+                _HUBSPOT_REFERENCE_CACHE.pop(stale_key, None)
+            while len(_HUBSPOT_REFERENCE_CACHE) >= _HUBSPOT_REFERENCE_CACHE_MAX:
+                _HUBSPOT_REFERENCE_CACHE.pop(next(iter(_HUBSPOT_REFERENCE_CACHE)))
+            _HUBSPOT_REFERENCE_CACHE[cache_key] = (weakref.ref(hubspot_df), (reference_keys, raw_values))
+    return reference_keys, raw_values
 
 
 def apply_hubspot_dedupe(
     qualified: pl.DataFrame,
     dedupe_raw: Optional[bytes] = None,
     dedupe_df: Optional[pl.DataFrame] = None,
+    collect_details: bool = True,
 ) -> tuple[pl.DataFrame, dict]:
     """
     Remove rows from `qualified` that already exist in the HubSpot CSV.
-    Returns updated df and metadata.
+    Returns updated df and metadata. With collect_details=False the per-row
+    removedDetailsByRowId (and the origin lookups behind it) are skipped.
     """
     info = {
         "enabled": False,
@@ -2397,25 +3451,46 @@ def apply_hubspot_dedupe(
         return qualified, info
 
     info["enabled"] = True
-    hubspot_df = dedupe_df if dedupe_df is not None else read_csv_bytes(dedupe_raw or b"")
-    if qualified.height == 0 or hubspot_df.height == 0:
+    if qualified.height == 0:
+        return qualified, info
+    if dedupe_df is not None:
+        hubspot_df = dedupe_df
+        inferred_matches = infer_dedupe_matches(qualified.columns, hubspot_df.columns)
+    else:
+        # Matching only needs headers, so parse just the matched key columns.
+        hubspot_lf = scan_csv_bytes(dedupe_raw or b"")
+        hubspot_columns = hubspot_lf.collect_schema().names()
+        inferred_matches = infer_dedupe_matches(qualified.columns, hubspot_columns)
+        key_columns = list(dict.fromkeys(
+            col for match in inferred_matches for col in (match.get("hubspotColumns") or []) if col in hubspot_columns
+        ))
+        hubspot_df = hubspot_lf.select(key_columns or hubspot_columns[:1]).collect()
+    if hubspot_df.height == 0:
         return qualified, info
 
-    inferred_matches = infer_dedupe_matches(qualified.columns, hubspot_df.columns)
     if not inferred_matches:
         info["warnings"].append("Could not infer matching columns for HubSpot dedupe.")
         return qualified, info
 
     info["checkedCount"] = qualified.height
 
-    strong_key_present_mask: Optional[pl.Series] = None
-    strong_hit_mask: Optional[pl.Series] = None
-    company_hit_mask: Optional[pl.Series] = None
+    # Row masks are accumulated in place across classes and source columns.
+    strong_key_present_mask = np.zeros(qualified.height, dtype=bool)
+    strong_hit_mask = np.zeros(qualified.height, dtype=bool)
+    company_hit_mask = np.zeros(qualified.height, dtype=bool)
     reference_keys_by_class: dict[str, set[str]] = {}
-    reference_origin_by_class: dict[str, dict[str, dict[str, str]]] = {}
+    reference_origin_by_class: dict[str, pl.DataFrame] = {}
+    reference_values_by_class: dict[str, pl.DataFrame] = {}
     source_cols_by_class: dict[str, list[str]] = {}
     use_fuzzy_by_class: dict[str, bool] = {}
+    fuzzy_ref_by_class: dict[str, dict[str, str]] = {}
+    key_frames_by_class: dict[str, dict[str, pl.DataFrame]] = {}
     active_matches: list[dict] = []
+    match_specs: list[tuple[str, list[str], list[str]]] = []
+    # Scalar-path keys for this call only; entries are keyed by class, so the
+    # matches running side by side never write the same slot.
+    key_memo: dict[tuple[str, str], list[str]] = {}
+    cdist_workers = -1
     for match in inferred_matches:
         key_class = str(match.get("keyType") or "")
         source_cols = [str(col) for col in (match.get("sourceColumns") or []) if str(col).strip() and str(col) in qualified.columns]
@@ -2424,64 +3499,92 @@ def apply_hubspot_dedupe(
             if source_col and source_col in qualified.columns:
                 source_cols = [source_col]
         hubspot_cols = [str(col) for col in (match.get("hubspotColumns") or []) if str(col).strip()]
-        if not key_class or not source_cols or not hubspot_cols:
-            continue
+        if key_class and source_cols and hubspot_cols:
+            match_specs.append((key_class, source_cols, hubspot_cols))
+
+    def _match_key_class(spec: tuple[str, list[str], list[str]]) -> Optional[dict]:
+        """Reference keys, candidate key frames and hit keys for one match."""
+        key_class, source_cols, hubspot_cols = spec
+        reference = _hubspot_reference_frame(hubspot_df, hubspot_cols, key_class, cache=dedupe_df is not None)
+        if reference is None or reference[0].height == 0:
+            return None
+        reference_origin, reference_values = reference
 
+        # Exact hits are a hashed is_in against the unique reference keys; the
+        # Python set is only built for fuzzy matching and the detail lookups.
+        hit_keys = reference_origin["__key"]
+        use_fuzzy = key_class == "company" and hit_keys.len() <= 50_000
         reference_keys: set[str] = set()
-        reference_origin: dict[str, dict[str, str]] = {}
-        for hubspot_col in hubspot_cols:
-            if hubspot_col not in hubspot_df.columns:
-                continue
-            for value in hubspot_df[hubspot_col].cast(pl.Utf8).drop_nulls().to_list():
-                keys = _extract_normalized_keys(value, key_class)
-                if not keys:
-                    continue
-                for key in keys:
-                    if key not in reference_origin:
-                        reference_origin[key] = {
-                            "hubspotColumn": hubspot_col,
-                            "hubspotValue": str(value or "")[:240],
-                        }
-                    reference_keys.add(key)
-        if not reference_keys:
-            continue
-
-        use_fuzzy = key_class == "company" and len(reference_keys) <= 50_000
-        reference_keys_by_class[key_class] = reference_keys
-        reference_origin_by_class[key_class] = reference_origin
-        source_cols_by_class[key_class] = source_cols
-        use_fuzzy_by_class[key_class] = use_fuzzy
-        class_hit_mask: Optional[pl.Series] = None
-        class_has_key_mask: Optional[pl.Series] = None
-        for source_col in source_cols:
-            candidate_series = qualified[source_col].cast(pl.Utf8)
-            key_presence_col_mask = candidate_series.map_elements(
-                lambda value: bool(_extract_normalized_keys(value, key_class)),
-                return_dtype=pl.Boolean,
+        if use_fuzzy or collect_details:
+            for key in hit_keys.to_list():
+                # Added one at a time in first-seen order: the fuzzy "first match"
+                # follows this set's iteration order.
+                reference_keys.add(key)
+        # Candidate keys stay in (row position, key) frames; presence and hit
+        # masks are scattered from the positions of matching keys.
+        key_frames = {
+            source_col: _extract_normalized_key_frame(qualified[source_col], key_class, key_memo)
+            for source_col in source_cols
+        }
+        fuzzy_refs: dict[str, str] = {}
+        if use_fuzzy:
+            candidate_keys = pl.concat([frame["__key"] for frame in key_frames.values()]).unique(maintain_order=True)
+            fuzzy_refs = _first_fuzzy_matches(
+                candidate_keys.filter(~candidate_keys.is_in(hit_keys.implode())).to_list(),
+                reference_keys,
+                90.0,
+                workers=cdist_workers,
             )
-            if use_fuzzy:
-                hit_col_mask = candidate_series.map_elements(
-                    lambda value: any(
-                        key in reference_keys or _fuzzy_matches_any(key, reference_keys, 90.0)
-                        for key in _extract_normalized_keys(value, key_class)
-                    ),
-                    return_dtype=pl.Boolean,
-                )
-            else:
-                hit_col_mask = candidate_series.map_elements(
-                    lambda value: any(key in reference_keys for key in _extract_normalized_keys(value, key_class)),
-                    return_dtype=pl.Boolean,
-                )
-            class_has_key_mask = key_presence_col_mask if class_has_key_mask is None else (class_has_key_mask | key_presence_col_mask)
-            class_hit_mask = hit_col_mask if class_hit_mask is None else (class_hit_mask | hit_col_mask)
-        if class_hit_mask is None:
-            continue
+            hit_keys = pl.concat([hit_keys, pl.Series([key for key, ref in fuzzy_refs.items() if ref], dtype=pl.Utf8)])
+        return {
+            "reference_origin": reference_origin,
+            "reference_values": reference_values,
+            "reference_keys": reference_keys,
+            "use_fuzzy": use_fuzzy,
+            "fuzzy_refs": fuzzy_refs,
+            "key_frames": key_frames,
+            "hit_indices": [
+                key_frame.filter(pl.col("__key").is_in(hit_keys.implode()))["__idx"].to_numpy()
+                for key_frame in key_frames.values()
+            ],
+        }
+
+    # Matches touch disjoint reference/source columns and their heavy steps
+    # (Polars string kernels, rapidfuzz) release the GIL, so they run side by
+    # side; results are applied below in match order.
+    if len(match_specs) > 1:
+        pool_size = min(HUBSPOT_MATCH_MAX_WORKERS, len(match_specs))
+        # Split the cores between pool threads instead of letting each cdist
+        # call spawn one worker per core.
+        cdist_workers = max(1, (os.cpu_count() or 1) // pool_size)
+        with ThreadPoolExecutor(max_workers=pool_size) as pool:
+            class_results = list(pool.map(_match_key_class, match_specs))
+    else:
+        class_results = [_match_key_class(spec) for spec in match_specs]
 
+    for (key_class, source_cols, hubspot_cols), result in zip(match_specs, class_results):
+        if result is None:
+            continue
+        reference_keys_by_class[key_class] = result["reference_keys"]
+        reference_origin_by_class[key_class] = result["reference_origin"]
+        reference_values_by_class[key_class] = result["reference_values"]
+        source_cols_by_class[key_class] = source_cols
+        use_fuzzy_by_class[key_class] = result["use_fuzzy"]
+        if result["use_fuzzy"]:
+            fuzzy_ref_by_class[key_class] = result["fuzzy_refs"]
+        key_frames_by_class[key_class] = result["key_frames"]
         if key_class in {"domain", "linkedin", "email"}:
-            strong_key_present_mask = class_has_key_mask if strong_key_present_mask is None else (strong_key_present_mask | class_has_key_mask)
-            strong_hit_mask = class_hit_mask if strong_hit_mask is None else (strong_hit_mask | class_hit_mask)
+            presence_mask, hit_mask = strong_key_present_mask, strong_hit_mask
         elif key_class == "company":
-            company_hit_mask = class_hit_mask if company_hit_mask is None else (company_hit_mask | class_hit_mask)
+            presence_mask, hit_mask = None, company_hit_mask
+        else:
+            presence_mask, hit_mask = None, None
+        for key_frame, hit_idx in zip(result["key_frames"].values(), result["hit_indices"]):
+            # Scatter straight into the shared masks (OR across columns/classes).
+            if presence_mask is not None:
+                presence_mask[key_frame["__idx"].to_numpy()] = True
+            if hit_mask is not None:
+                hit_mask[hit_idx] = True
 
         active_matches.append({
             "keyType": key_class,
@@ -2489,84 +3592,102 @@ def apply_hubspot_dedupe(
             "sourceColumns": source_cols,
             "hubspotColumn": hubspot_cols[0],
             "hubspotColumns": hubspot_cols,
-            "referenceCount": len(reference_keys),
+            "referenceCount": result["reference_origin"].height,
         })
 
     if not active_matches:
         info["warnings"].append("HubSpot dedupe files had no usable key values.")
         return qualified, info
 
-    if strong_hit_mask is None:
-        strong_hit_mask = pl.Series("__strong_hit", [False] * qualified.height, dtype=pl.Boolean)
-    if strong_key_present_mask is None:
-        strong_key_present_mask = pl.Series("__strong_key_present", [False] * qualified.height, dtype=pl.Boolean)
-    if company_hit_mask is None:
-        company_hit_mask = pl.Series("__company_hit", [False] * qualified.height, dtype=pl.Boolean)
-
     # Prefer high-confidence key classes (domain/linkedin/email).
     # Only use company-name matching as a fallback when no strong key is present on the source row.
-    remove_mask = strong_hit_mask | ((~strong_key_present_mask) & company_hit_mask)
-    keep_mask = ~remove_mask
+    remove_mask = strong_hit_mask | (~strong_key_present_mask & company_hit_mask)
+    keep_mask = pl.Series(~remove_mask)
 
     deduped = qualified.filter(keep_mask)
     info["removedCount"] = qualified.height - deduped.height
     info["matches"] = active_matches
-    if "__row_id" in qualified.columns and info["removedCount"] > 0:
-        df_with_idx = qualified.with_row_count("__dedupe_idx")
-        removed_rows = df_with_idx.filter(remove_mask).to_dicts()
+    if collect_details and "__row_id" in qualified.columns and info["removedCount"] > 0:
+        # Details reuse the per-class keys extracted for the hit masks; only the
+        # removed rows' ids and source values are pulled into Python.
+        removed_idx = np.flatnonzero(remove_mask)
+        removed_row_ids = qualified["__row_id"].gather(removed_idx).to_list()
+        removed_strong_hits = strong_hit_mask[removed_idx].tolist()
+        detail_cols = list(dict.fromkeys(col for cols in source_cols_by_class.values() for col in cols))
+        removed_values = {col: qualified[col].gather(removed_idx).to_list() for col in detail_cols}
+        removed_keys_by_col: dict[tuple[str, str], dict[int, list[str]]] = {}
+
+        def _removed_row_keys(key_class: str, source_col: str) -> dict[int, list[str]]:
+            """Row position -> ordered keys, for removed rows only."""
+            cache_key = (key_class, source_col)
+            if cache_key not in removed_keys_by_col:
+                grouped = (
+                    key_frames_by_class[key_class][source_col]
+                    .filter(pl.col("__idx").is_in(removed_idx))
+                    .group_by("__idx", maintain_order=True)
+                    .agg("__key")
+                )
+                removed_keys_by_col[cache_key] = dict(zip(grouped["__idx"].to_list(), grouped["__key"].to_list()))
+            return removed_keys_by_col[cache_key]
+
+        removed_idx = removed_idx.tolist()
         detail_by_row_id: dict[int, dict[str, Any]] = {}
+        matched_refs_by_class: dict[str, set[str]] = {}
 
-        def _build_row_match_detail(row: dict, key_class: str) -> Optional[dict]:
+        def _build_row_match_detail(pos: int, key_class: str) -> Optional[dict]:
             refs = reference_keys_by_class.get(key_class) or set()
             if not refs:
                 return None
             source_cols = source_cols_by_class.get(key_class) or []
             use_fuzzy = bool(use_fuzzy_by_class.get(key_class))
-            origins = reference_origin_by_class.get(key_class) or {}
+            fuzzy_refs = fuzzy_ref_by_class.get(key_class) or {}
             for source_col in source_cols:
-                raw_value = row.get(source_col, "")
-                keys = _extract_normalized_keys(raw_value, key_class)
-                if not keys:
-                    continue
+                keys = _removed_row_keys(key_class, source_col).get(removed_idx[pos], [])
                 for key in keys:
-                    matched_ref = key if key in refs else (_first_fuzzy_match(key, refs, 90.0) if use_fuzzy else "")
+                    matched_ref = key if key in refs else (fuzzy_refs.get(key, "") if use_fuzzy else "")
                     if not matched_ref:
                         continue
-                    origin = origins.get(matched_ref, {})
+                    matched_refs_by_class.setdefault(key_class, set()).add(matched_ref)
                     return {
                         "keyType": key_class,
                         "sourceColumn": source_col,
-                        "sourceValue": str(raw_value or "")[:240],
+                        "sourceValue": str(removed_values[source_col][pos] or "")[:240],
                         "normalizedKey": key,
                         "matchMode": "exact" if matched_ref == key else "fuzzy",
-                        "hubspotColumn": origin.get("hubspotColumn", ""),
-                        "hubspotValue": origin.get("hubspotValue", ""),
+                        "hubspotColumn": "",
+                        "hubspotValue": "",
+                        "__matchedRef": matched_ref,
                     }
             return None
 
-        for row in removed_rows:
-            row_id_raw = row.get("__row_id")
-            if row_id_raw is None:
-                continue
-            try:
-                row_id = int(row_id_raw)
-            except Exception:
-                continue
-            idx = int(row.get("__dedupe_idx", -1))
-            if idx < 0:
-                continue
-
+        for pos, row_id in enumerate(removed_row_ids):
             detail: Optional[dict] = None
-            if bool(strong_hit_mask[idx]):
+            if removed_strong_hits[pos]:
                 for key_class in ("domain", "linkedin", "email"):
-                    detail = _build_row_match_detail(row, key_class)
+                    detail = _build_row_match_detail(pos, key_class)
                     if detail:
                         break
             else:
-                detail = _build_row_match_detail(row, "company")
+                detail = _build_row_match_detail(pos, "company")
 
             if detail:
-                detail_by_row_id[row_id] = detail
+                detail_by_row_id[int(row_id)] = detail
+
+        origins_by_class: dict[str, dict[str, tuple[str, str]]] = {}
+        for key_class, matched_refs in matched_refs_by_class.items():
+            origin_rows = (
+                reference_origin_by_class[key_class]
+                .filter(pl.col("__key").is_in(list(matched_refs)))
+                .join(reference_values_by_class[key_class], on="__value", how="left", maintain_order="left")
+            )
+            origins_by_class[key_class] = {
+                key: (hubspot_col, value[:240])
+                for value, key, hubspot_col in origin_rows.select(["__value", "__key", "__column"]).iter_rows()
+            }
+        for detail in detail_by_row_id.values():
+            hubspot_col, hubspot_value = origins_by_class[detail["keyType"]].get(detail.pop("__matchedRef"), ("", ""))
+            detail["hubspotColumn"] = hubspot_col
+            detail["hubspotValue"] = hubspot_value
         info["removedDetailsByRowId"] = detail_by_row_id
 
     if active_matches:
@@ -2627,39 +3748,51 @@ def apply_intra_dedupe(
 
     df_with_id = df.with_row_index("__intra_row_id")
 
-    normalized = df_with_id[key_col].cast(pl.Utf8, strict=False).fill_null("").map_elements(
-        lambda v: "|".join(_extract_normalized_keys(v, key_class_for_col)) if v else "",
-        return_dtype=pl.Utf8,
+    # Per-row keys come from the column-wise extractor, deduped in first-seen
+    # order and joined back by row position; rows without keys get "".
+    row_keys = (
+        _extract_normalized_key_frame(df_with_id[key_col], key_class_for_col)
+        .unique(subset=["__idx", "__key"], keep="first", maintain_order=True)
+        .group_by("__idx", maintain_order=True)
+        .agg(pl.col("__key").str.join("|").alias("__dedupe_key"))
+        .rename({"__idx": "__intra_row_id"})
     )
-    df_keyed = df_with_id.with_columns(normalized.alias("__dedupe_key"))
+    df_keyed = df_with_id.join(row_keys, on="__intra_row_id", how="left", maintain_order="left").with_columns(
+        pl.col("__dedupe_key").fill_null("")
+    )
+
+    if strategy != "merge":
+        # Rows stay in __intra_row_id order, so first/last occurrence per key is a
+        # single mask over the frame; rows without a key are always kept.
+        is_kept = pl.col("__dedupe_key").is_first_distinct() if strategy == "first" else pl.col("__dedupe_key").is_last_distinct()
+        result = df_keyed.filter((pl.col("__dedupe_key") == "") | is_kept).drop(["__intra_row_id", "__dedupe_key"])
+        info["removedCount"] = df.height - result.height
+        return result, info
 
     has_key = df_keyed.filter(pl.col("__dedupe_key").str.len_chars() > 0)
     no_key = df_keyed.filter(pl.col("__dedupe_key").str.len_chars() == 0)
 
-    if strategy == "merge":
-        mv_cols = detect_multivalue_columns(df)
-        agg_exprs = [pl.col("__intra_row_id").first()]
-        for c in has_key.columns:
-            if c in ("__intra_row_id", "__dedupe_key"):
-                continue
-            if c in mv_cols:
-                sep = mv_cols[c]
-                agg_exprs.append(
-                    pl.col(c).cast(pl.Utf8, strict=False).fill_null("")
-                    .map_elements(lambda v, s=sep: [p.strip() for p in v.split(s) if p.strip()] if v else [], return_dtype=pl.List(pl.Utf8))
-                    .explode().drop_nulls().unique().sort()
-                    .str.concat(sep).alias(c)
-                )
-            else:
-                agg_exprs.append(pl.col(c).first())
-        deduped = has_key.group_by("__dedupe_key").agg(agg_exprs)
-        merged_count = has_key.n_unique(subset=["__dedupe_key"])
-        info["mergedDomains"] = has_key.height - merged_count if merged_count else 0
-    else:
-        keep = "first" if strategy == "first" else "last"
-        deduped = has_key.unique(subset=["__dedupe_key"], keep=keep)
+    mv_cols = detect_multivalue_columns(df)
+    agg_exprs = [pl.col("__intra_row_id").first()]
+    for c in has_key.columns:
+        if c in ("__intra_row_id", "__dedupe_key"):
+            continue
+        if c in mv_cols:
+            sep = mv_cols[c]
+            agg_exprs.append(
+                pl.col(c).cast(pl.Utf8, strict=False).fill_null("")
+                .map_elements(lambda v, s=sep: [p.strip() for p in v.split(s) if p.strip()] if v else [], return_dtype=pl.List(pl.Utf8))
+                .explode().drop_nulls().unique().sort()
+                .str.concat(sep).alias(c)
+            )
+        else:
+            agg_exprs.append(pl.col(c).first())
+    deduped = has_key.group_by("__dedupe_key").agg(agg_exprs)
+    merged_count = has_key.n_unique(subset=["__dedupe_key"])
+    info["mergedDomains"] = has_key.height - merged_count if merged_count else 0
 
-    result = pl.concat([deduped, no_key]).sort("__intra_row_id")
+    # group_by leads with the key column; align to no_key's layout before stacking.
+    result = pl.concat([deduped.select(no_key.columns), no_key]).sort("__intra_row_id")
     result = result.drop(["__intra_row_id", "__dedupe_key"])
 
     info["removedCount"] = df.height - result.height
@@ -2707,125 +3840,194 @@ def compute_lead_scores(df: pl.DataFrame, config: dict) -> pl.DataFrame:
     signal_values = [str(v).strip().lower() for v in (signal_config.get("values") or []) if str(v).strip()]
     has_signal = signal_col and signal_col in df.columns and signal_values
 
-    scores = []
-    breakdowns = []
-
-    for row in df.iter_rows(named=True):
-        # 1. Data richness: % of non-null, non-empty fields
-        filled = sum(1 for c in data_cols if row.get(c) is not None and str(row.get(c, "")).strip())
-        richness_pct = filled / num_cols
-        richness_pts = richness_pct * w_richness
-
-        # 2. Multi-value diversity: total distinct values across MV columns
-        mv_count = 0
-        for mc, sep in mv_cols.items():
-            val = row.get(mc)
-            if val:
-                parts = [p.strip() for p in str(val).split(sep) if p.strip()]
-                mv_count += len(parts)
-        # Cap at 20 distinct values for max score
-        diversity_pct = min(mv_count / 20, 1.0) if mv_cols else 0
-        diversity_pts = diversity_pct * w_diversity
-
-        # 3. Recency: newer dates score higher
-        recency_pts = 0.0
-        if has_date_field:
-            date_val = row.get(date_field)
-            if date_val:
-                parsed = _safe_parse_iso_datetime(str(date_val))
-                if parsed:
-                    now = datetime.now(timezone.utc)
-                    if parsed.tzinfo is None:
-                        parsed = parsed.replace(tzinfo=timezone.utc)
-                    days_ago = max((now - parsed).days, 0)
-                    # Decay: 0 days = 100%, 730 days (2yr) = 0%
-                    recency_pct = max(1.0 - (days_ago / 730), 0)
-                    recency_pts = recency_pct * w_recency
-
-        # 4. Domain quality: check if domain-related status fields exist
-        domain_pts = 0.0
-        domain_status = row.get("_domain_status") or row.get("__domain_live")
-        if domain_status:
-            domain_pts = w_domain  # Full points if domain verified
-        elif not has_date_field:
-            # Give partial credit if we have no domain data at all
-            domain_pts = w_domain * 0.5
-
-        # 5. High-signal indicators
-        signal_pts = 0.0
-        if has_signal:
-            cell_val = str(row.get(signal_col) or "").lower()
-            matched = sum(1 for sv in signal_values if sv in cell_val)
-            signal_pct = min(matched / max(len(signal_values), 1), 1.0)
-            signal_pts = signal_pct * w_signal
-
-        raw_score = richness_pts + diversity_pts + recency_pts + domain_pts + signal_pts
-        normalized = round(min(raw_score / total_w * 100, 100))
-        scores.append(normalized)
-        breakdowns.append(json.dumps({
-            "richness": round(richness_pts / max(w_richness, 0.01) * 100),
-            "diversity": round(diversity_pts / max(w_diversity, 0.01) * 100),
-            "recency": round(recency_pts / max(w_recency, 0.01) * 100),
-            "domain": round(domain_pts / max(w_domain, 0.01) * 100),
-            "signal": round(signal_pts / max(w_signal, 0.01) * 100),
-        }))
+    schema = df.schema
+
+    # Per-row counts are gathered with Polars expressions; the point arithmetic
+    # below runs in NumPy because Polars divides by a scalar via its reciprocal,
+    # which drifts by an ulp and flips .5 totals under round().
+
+    # 1. Data richness: % of non-null, non-empty fields
+    filled = pl.sum_horizontal([_filled_expr(c, schema[c]) for c in data_cols]) if data_cols else pl.lit(0)
+
+    # 2. Multi-value diversity: total distinct values across MV columns
+    mv_count = pl.lit(0)
+    if mv_cols:
+        mv_count = pl.sum_horizontal([
+            pl.when(_truthy_expr(mc, schema[mc]))
+            .then(
+                pl.col(mc).cast(pl.Utf8, strict=False).str.split(sep)
+                .list.eval(pl.element().str.strip_chars() != "").list.sum()
+            )
+            .otherwise(0)
+            for mc, sep in mv_cols.items()
+        ])
+
+    # 3. Recency: newer dates score higher. Dates are parsed once per distinct value.
+    recency_pct = pl.lit(0.0)
+    if has_date_field:
+        now = datetime.now(timezone.utc)
+        date_values = df[date_field].drop_nulls().unique()
+        recency_pcts = []
+        for date_val in date_values.to_list():
+            parsed = _safe_parse_iso_datetime(str(date_val)) if date_val else None
+            if not parsed:
+                recency_pcts.append(0.0)
+                continue
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            days_ago = max((now - parsed).days, 0)
+            # Decay: 0 days = 100%, 730 days (2yr) = 0%
+            recency_pcts.append(max(1.0 - (days_ago / 730), 0.0))
+        if date_values.len():
+            recency_pct = pl.col(date_field).replace_strict(
+                date_values, recency_pcts, default=0.0, return_dtype=pl.Float64
+            )
+
+    # 4. Domain quality: check if domain-related status fields exist
+    domain_verified = pl.lit(False)
+    for status_col in ("_domain_status", "__domain_live"):
+        if status_col in schema:
+            domain_verified = domain_verified | _truthy_expr(status_col, schema[status_col])
+    # Give partial credit if we have no domain data at all
+    domain_pts = pl.when(domain_verified).then(w_domain).otherwise(0.0 if has_date_field else w_domain * 0.5)
+
+    # 5. High-signal indicators
+    matched = pl.lit(0)
+    if has_signal:
+        cell_val = (
+            pl.when(_truthy_expr(signal_col, schema[signal_col]))
+            .then(pl.col(signal_col).cast(pl.Utf8, strict=False).str.to_lowercase())
+            .otherwise(pl.lit(""))
+        )
+        matched = pl.sum_horizontal([cell_val.str.contains(sv, literal=True) for sv in signal_values])
+
+    # with_columns (not select) so all-literal components still broadcast to df.height.
+    counts = df.with_columns(
+        filled.cast(pl.Int64).alias("filled"),
+        mv_count.cast(pl.Int64).alias("mv_count"),
+        recency_pct.cast(pl.Float64).alias("recency_pct"),
+        domain_pts.cast(pl.Float64).alias("domain_pts"),
+        matched.cast(pl.Int64).alias("matched"),
+    ).select("filled", "mv_count", "recency_pct", "domain_pts", "matched")
+
+    richness_pts = counts["filled"].to_numpy() / num_cols * w_richness
+    if mv_cols:
+        diversity_pts = np.minimum(counts["mv_count"].to_numpy() / 20, 1.0) * w_diversity
+    else:
+        diversity_pts = np.zeros(df.height, dtype=np.float64)
+    recency_pts = counts["recency_pct"].to_numpy() * w_recency
+    domain_pts = counts["domain_pts"].to_numpy()
+    if has_signal:
+        signal_pts = np.minimum(counts["matched"].to_numpy() / max(len(signal_values), 1), 1.0) * w_signal
+    else:
+        signal_pts = np.zeros(df.height, dtype=np.float64)
+
+    raw_score = richness_pts + diversity_pts + recency_pts + domain_pts + signal_pts
+    # np.round is half-to-even, like the builtin round().
+    scores = np.round(np.minimum(raw_score / total_w * 100, 100)).astype(np.int32)
+
+    # Breakdown JSON is assembled in the same layout json.dumps produced.
+    component_pts = {
+        "richness": (richness_pts, w_richness),
+        "diversity": (diversity_pts, w_diversity),
+        "recency": (recency_pts, w_recency),
+        "domain": (domain_pts, w_domain),
+        "signal": (signal_pts, w_signal),
+    }
+    component_pcts = pl.DataFrame({
+        name: np.round(pts / max(weight, 0.01) * 100).astype(np.int64)
+        for name, (pts, weight) in component_pts.items()
+    })
+    breakdown_parts: list[pl.Expr] = []
+    for idx, name in enumerate(component_pts):
+        breakdown_parts.append(pl.lit(("{" if idx == 0 else ", ") + f'"{name}": '))
+        breakdown_parts.append(pl.col(name).cast(pl.Utf8))
+    breakdown_parts.append(pl.lit("}"))
+    breakdowns = component_pcts.select(pl.concat_str(breakdown_parts)).to_series()
 
     return df.with_columns([
         pl.Series("_lead_score", scores, dtype=pl.Int32),
-        pl.Series("_score_breakdown", breakdowns, dtype=pl.Utf8),
+        breakdowns.alias("_score_breakdown"),
     ])
 
 
-def _build_row_taxonomy(
+def _row_id_array(ids: "set[int] | np.ndarray") -> np.ndarray:
+    if isinstance(ids, np.ndarray):
+        return ids.astype(np.int64, copy=False)
+    return np.fromiter(ids, dtype=np.int64, count=len(ids))
+
+
+def _build_row_status_frame(
     df_with_id: pl.DataFrame,
-    qualified_ids: set[int],
-    removed_filter_ids: set[int],
+    qualified_ids: "set[int] | np.ndarray",
+    removed_filter_ids: "set[int] | np.ndarray",
     removed_filter_reason_by_id: dict[int, str],
-    removed_domain_ids: set[int],
+    removed_domain_ids: "set[int] | np.ndarray",
     removed_domain_reason_by_id: dict[int, str],
-    removed_hubspot_ids: set[int],
-    removed_hubspot_detail_by_id: Optional[dict[int, dict]] = None,
-) -> list[dict]:
-    """Build row-level status taxonomy using vectorized Polars + batch conversion."""
+    removed_hubspot_ids: "set[int] | np.ndarray",
+) -> pl.DataFrame:
+    """Attach `_rowId`/`_rowStatus`/`_rowReasons` columns and drop internal ones.
+
+    Id collections may be sets (job state) or int arrays (pipeline); statuses
+    and reasons are resolved with is_in/replace_strict over the row-id column.
+    """
     _internal_cols = {"__row_id", "__domain_key"}
-    row_ids = df_with_id["__row_id"].to_list()
-
-    # Build status and reason arrays in bulk using Python lists (faster than per-row dict ops)
-    statuses = []
-    reasons = []
-    for rid in row_ids:
-        rid_int = int(rid)
-        if rid_int in qualified_ids:
-            statuses.append("qualified")
-            reasons.append("qualified_passed_all_checks")
-        elif rid_int in removed_filter_ids:
-            statuses.append("removed_filter")
-            reasons.append(str(removed_filter_reason_by_id.get(rid_int, "rule_filter_mismatch")))
-        elif rid_int in removed_domain_ids:
-            statuses.append("removed_domain")
-            detail = removed_domain_reason_by_id.get(rid_int, "unreachable")
-            reasons.append(f"domain_{detail}".replace("/", "_").replace(" ", "_").replace(":", "_"))
-        elif rid_int in removed_hubspot_ids:
-            statuses.append("removed_hubspot")
-            reasons.append("hubspot_duplicate_match")
-        else:
-            statuses.append("removed_filter")
-            reasons.append(str(removed_filter_reason_by_id.get(rid_int, "rule_filter_mismatch")))
+    row_id = pl.col("__row_id").cast(pl.Int64)
+
+    def _reason_by_id(reason_by_id: dict[int, str], default: str) -> pl.Expr:
+        return row_id.replace_strict(
+            list(reason_by_id.keys()),
+            [str(reason) for reason in reason_by_id.values()],
+            default=default,
+            return_dtype=pl.Utf8,
+        )
+
+    filter_reason = _reason_by_id(removed_filter_reason_by_id, "rule_filter_mismatch")
+    domain_reason = pl.concat_str(
+        pl.lit("domain_"), _reason_by_id(removed_domain_reason_by_id, "unreachable")
+    ).str.replace_all(r"[/ :]", "_")
+    status_reason = (
+        pl.when(row_id.is_in(_row_id_array(qualified_ids)))
+        .then(pl.struct(status=pl.lit("qualified"), reason=pl.lit("qualified_passed_all_checks")))
+        .when(row_id.is_in(_row_id_array(removed_filter_ids)))
+        .then(pl.struct(status=pl.lit("removed_filter"), reason=filter_reason))
+        .when(row_id.is_in(_row_id_array(removed_domain_ids)))
+        .then(pl.struct(status=pl.lit("removed_domain"), reason=domain_reason))
+        .when(row_id.is_in(_row_id_array(removed_hubspot_ids)))
+        .then(pl.struct(status=pl.lit("removed_hubspot"), reason=pl.lit("hubspot_duplicate_match")))
+        .otherwise(pl.struct(status=pl.lit("removed_filter"), reason=filter_reason))
+        .alias("__status_reason")
+    )
+
+    # Add status/reason columns and drop internals in one lazy plan, so the
+    # temporary struct column and internals are never materialized on the frame.
+    drop_cols = [c for c in _internal_cols if c in df_with_id.columns] + ["__status_reason"]
+    return (
+        df_with_id.lazy()
+        .with_columns(status_reason)
+        .with_columns([
+            row_id.alias("_rowId"),
+            pl.col("__status_reason").struct.field("status").alias("_rowStatus"),
+            pl.concat_list(pl.col("__status_reason").struct.field("reason")).alias("_rowReasons"),
+        ])
+        .drop(drop_cols)
+        .collect()
+    )
 
-    # Add status/reason columns, drop internals, then convert to dicts once
-    output_df = df_with_id.with_columns([
-        pl.Series("_rowId", row_ids).cast(pl.Int64),
-        pl.Series("_rowStatus", statuses),
-        pl.Series("_rowReasons", [[r] for r in reasons]),
-    ]).drop([c for c in _internal_cols if c in df_with_id.columns])
 
+def _build_row_taxonomy(
+    output_df: pl.DataFrame,
+    removed_hubspot_detail_by_id: Optional[dict[int, dict]] = None,
+) -> list[dict]:
+    """Convert a row status frame to dicts once, attaching dedupe match details."""
     rows = output_df.to_dicts()
     detail_map = removed_hubspot_detail_by_id or {}
     if detail_map:
-        for row in rows:
-            rid = int(row.get("_rowId", -1))
-            if rid in detail_map:
-                row["_dedupeMatch"] = detail_map[rid]
+        detail_ids = np.fromiter((int(rid) for rid in detail_map), dtype=np.int64, count=len(detail_map))
+        for pos in output_df["_rowId"].cast(pl.Int64).is_in(detail_ids).arg_true().to_list():
+            row = rows[pos]
+            if row["_rowId"] in detail_map:
+                row["_dedupeMatch"] = detail_map[row["_rowId"]]
     return rows
 
 
@@ -2866,27 +4068,16 @@ async def run_qualification_pipeline(
     blocklist_removed_ids: set[int] = set()
     blocklist_reason_by_id: dict[int, str] = {}
     if blocked_domain_suffixes and domain_field and domain_field in df.columns:
-        df_temp = df.with_row_count("__bl_row_id")
-        domain_vals = df_temp[domain_field].cast(pl.Utf8).to_list()
-        keep_mask = []
-        for idx, raw_val in enumerate(domain_vals):
-            host = normalize_domain_key(str(raw_val or ""))
-            match = is_blocked_domain(host, blocked_domain_suffixes)
-            if match:
-                blocklist_removed_count += 1
-                row_id = int(df_temp["__bl_row_id"][idx])
-                blocklist_removed_ids.add(row_id)
-                # Find which category the match belongs to
-                cat_label = "custom"
-                for cat_name, cat_domains in BLOCKED_DOMAIN_CATEGORIES.items():
-                    if match in cat_domains:
-                        cat_label = cat_name
-                        break
-                blocklist_reason_by_id[row_id] = f"blocked_domain_{cat_label}"
-                keep_mask.append(False)
-            else:
-                keep_mask.append(True)
-        df = df_temp.filter(pl.Series(keep_mask)).drop("__bl_row_id")
+        blocked_matches = match_blocked_domain_series(df[domain_field], blocked_domain_suffixes)
+        blocked_mask = blocked_matches.is_not_null()
+        blocked_row_ids = blocked_mask.arg_true().to_list()
+        blocklist_removed_count = len(blocked_row_ids)
+        blocklist_removed_ids = set(blocked_row_ids)
+        blocklist_reason_by_id = {
+            row_id: f"blocked_domain_{BLOCKED_DOMAIN_CATEGORY_BY_SUFFIX.get(match, 'custom')}"
+            for row_id, match in zip(blocked_row_ids, blocked_matches.filter(blocked_mask).to_list())
+        }
+        df = df.filter(~blocked_mask)
 
     df_with_id = df.with_row_count("__row_id")
     warnings = []
@@ -2894,11 +4085,13 @@ async def run_qualification_pipeline(
     # Rule filtering stage
     after_filters, removed_filter_reason_by_id = apply_rules_with_trace(df_with_id, parsed_rules)
     removed_filter_count = df_with_id.height - after_filters.height
-    removed_filter_ids: set[int] = set()
+    # Row-id bookkeeping for the status frame stays in int arrays; removed ids
+    # come from the rows each stage filtered out.
+    removed_filter_ids = np.empty(0, dtype=np.int64)
     if include_rows:
-        all_ids = set(df_with_id["__row_id"].to_list())
-        after_filter_ids = set(after_filters["__row_id"].to_list())
-        removed_filter_ids = all_ids - after_filter_ids
+        removed_filter_ids = np.setdiff1d(
+            df_with_id["__row_id"].to_numpy(), after_filters["__row_id"].to_numpy(), assume_unique=True
+        )
 
     # Domain + homepage stage
     working = after_filters
@@ -2908,7 +4101,7 @@ async def run_qualification_pipeline(
     domain_checked_count = 0
     homepage_checked_count = 0
     removed_domain_count = 0
-    removed_domain_ids = set()
+    removed_domain_id_chunks: list[np.ndarray] = []
     removed_domain_reason_by_id: dict[int, str] = {}
     tld_filter_enabled = bool(exclude_country_tlds or disallowed_tlds)
     should_run_dns = bool(domain_check and not skip_network_checks)
@@ -2939,12 +4132,20 @@ async def run_qualification_pipeline(
             domain_checked_count += tld_checked_count
             dead_domains.extend(tld_dead_domains)
             if include_rows and tld_removed_count > 0:
-                removed_domain_ids.update(tld_reason_by_row_id.keys())
+                removed_domain_id_chunks.append(_row_id_array(tld_reason_by_row_id.keys()))
                 removed_domain_reason_by_id.update(tld_reason_by_row_id)
 
+        unique_domains: list[str] = []
+        if should_run_dns or should_run_homepage:
+            df_with_id, working = _attach_domain_keys(df_with_id, working, domain_field)
+            unique_domains = _collect_unique_normalized_domains(working[domain_field], working["__domain_key"])
+            if not include_rows:
+                # Without row statuses the full frame only supplies output column
+                # names, so the DNS/homepage annotation joins run on an empty frame.
+                df_with_id = df_with_id.head(0)
+
+        homepage_domains = unique_domains
         if should_run_dns:
-            domains = working[domain_field].cast(pl.Utf8).to_list()
-            unique_domains = _collect_unique_normalized_domains(domains)
             if tld_filter_enabled:
                 domain_checked_count = max(domain_checked_count, len(unique_domains))
             else:
@@ -2955,13 +4156,12 @@ async def run_qualification_pipeline(
             pre_domain = _build_resolved_ips_columns(working, domain_field, domain_results)
             df_with_id = _build_resolved_ips_columns(df_with_id, domain_field, domain_results)
 
-            alive_mask = _build_domain_alive_mask(pre_domain, domain_field, domain_results)
+            alive_mask = _build_domain_alive_mask(pre_domain, domain_results)
             working = pre_domain.filter(alive_mask)
+            homepage_domains = _live_domain_keys(unique_domains, domain_results)
             removed_domain_count += pre_domain.height - working.height
             if include_rows:
-                post_domain_ids = set(working["__row_id"].to_list())
-                dns_removed_ids = set(pre_domain["__row_id"].to_list()) - post_domain_ids
-                removed_domain_ids.update(dns_removed_ids)
+                removed_domain_id_chunks.append(pre_domain["__row_id"].filter(~alive_mask).to_numpy())
 
             dead_domains.extend([
                 {"domain": d, "status": domain_results.get(d, {}).get("status", "unknown")}
@@ -2971,13 +4171,11 @@ async def run_qualification_pipeline(
 
             if include_rows:
                 # Row-id -> reason detail mapping for inspector UX
-                removed_df = _normalize_domain_col(pre_domain.filter(~alive_mask), domain_field)
-                for item in removed_df.select(["__row_id", "__domain_key"]).to_dicts():
-                    status = domain_results.get(item["__domain_key"] or "", {}).get("status", "unreachable")
-                    removed_domain_reason_by_id[int(item["__row_id"])] = status
+                removed_domain_reason_by_id.update(_removed_reason_by_row_id(
+                    pre_domain.filter(~alive_mask), domain_results, "status", "unreachable"
+                ))
 
         if should_run_homepage:
-            homepage_domains = _collect_unique_normalized_domains(working[domain_field].cast(pl.Utf8).to_list())
             homepage_checked_count = len(homepage_domains)
             if homepage_domains:
                 homepage_results = await collect_homepage_signals_batch(
@@ -2989,19 +4187,15 @@ async def run_qualification_pipeline(
             pre_homepage = _build_homepage_signal_columns(working, domain_field, homepage_results)
             df_with_id = _build_homepage_signal_columns(df_with_id, domain_field, homepage_results)
 
-            homepage_mask = _build_homepage_alive_mask(pre_homepage, domain_field, homepage_results)
+            homepage_mask = _build_homepage_alive_mask(pre_homepage, homepage_results)
             working = pre_homepage.filter(homepage_mask)
             removed_domain_count += pre_homepage.height - working.height
             if include_rows:
-                post_homepage_ids = set(working["__row_id"].to_list())
-                homepage_removed_ids = set(pre_homepage["__row_id"].to_list()) - post_homepage_ids
-                removed_domain_ids.update(homepage_removed_ids)
+                removed_domain_id_chunks.append(pre_homepage["__row_id"].filter(~homepage_mask).to_numpy())
 
-                removed_hp_df = _normalize_domain_col(pre_homepage.filter(~homepage_mask), domain_field)
-                for item in removed_hp_df.select(["__row_id", "__domain_key"]).to_dicts():
-                    lookup_key = item["__domain_key"] or ""
-                    status = homepage_results.get(lookup_key, {}).get("homepage_status", "homepage_disqualified")
-                    removed_domain_reason_by_id[int(item["__row_id"])] = status
+                removed_domain_reason_by_id.update(_removed_reason_by_row_id(
+                    pre_homepage.filter(~homepage_mask), homepage_results, "homepage_status", "homepage_disqualified"
+                ))
 
             dead_domains.extend([
                 {"domain": d, "status": homepage_results.get(d, {}).get("homepage_status", "homepage_disqualified")}
@@ -3015,30 +4209,36 @@ async def run_qualification_pipeline(
 
     # HubSpot dedupe stage
     pre_dedupe_count = working.height
-    deduped, dedupe_info = apply_hubspot_dedupe(working, dedupe_raw=dedupe_raw, dedupe_df=dedupe_df)
+    deduped, dedupe_info = apply_hubspot_dedupe(
+        working, dedupe_raw=dedupe_raw, dedupe_df=dedupe_df, collect_details=include_rows
+    )
     warnings.extend(dedupe_info.get("warnings", []))
     removed_hubspot_count = pre_dedupe_count - deduped.height
-    qualified_ids: set[int] = set()
-    removed_hubspot_ids: set[int] = set()
+    qualified_ids = np.empty(0, dtype=np.int64)
+    removed_hubspot_ids = np.empty(0, dtype=np.int64)
     if include_rows:
-        pre_dedupe_ids = set(working["__row_id"].to_list())
-        qualified_ids = set(deduped["__row_id"].to_list())
-        removed_hubspot_ids = pre_dedupe_ids - qualified_ids
+        qualified_ids = deduped["__row_id"].to_numpy()
+        removed_hubspot_ids = np.setdiff1d(working["__row_id"].to_numpy(), qualified_ids, assume_unique=True)
 
     # Build row-level status taxonomy and reasons
     rows = []
+    row_status_df = None
+    removed_hubspot_detail_by_id: dict[int, dict] = {}
     if include_rows:
-        rows = _build_row_taxonomy(
+        row_status_df = _build_row_status_frame(
             df_with_id, qualified_ids, removed_filter_ids, removed_filter_reason_by_id,
-            removed_domain_ids, removed_domain_reason_by_id, removed_hubspot_ids,
-            {int(k): v for k, v in dict(dedupe_info.get("removedDetailsByRowId") or {}).items() if str(k).isdigit()},
+            np.concatenate(removed_domain_id_chunks) if removed_domain_id_chunks else np.empty(0, dtype=np.int64),
+            removed_domain_reason_by_id, removed_hubspot_ids,
         )
+        removed_hubspot_detail_by_id = dict(dedupe_info.get("removedDetailsByRowId") or {})
+        rows = _build_row_taxonomy(row_status_df, removed_hubspot_detail_by_id)
 
     _internal_cols = {"__row_id", "__domain_key"}
     qualified_for_return = deduped.drop([c for c in _internal_cols if c in deduped.columns])
 
-    # Lead scoring (post-qualification)
-    if score_config and score_config.get("scoreEnabled"):
+    # Lead scoring (post-qualification); skipped when neither leads nor the
+    # frame are returned, since counts don't depend on it.
+    if score_config and score_config.get("scoreEnabled") and (include_leads or include_dataframe):
         qualified_for_return = compute_lead_scores(qualified_for_return, score_config)
 
     output_columns = [col for col in df_with_id.columns if col not in _internal_cols]
@@ -3052,6 +4252,8 @@ async def run_qualification_pipeline(
 
     return {
         "rows": rows,
+        "rowStatusDf": row_status_df.select(["_rowId", "_rowStatus", "_rowReasons"]) if row_status_df is not None else None,
+        "removedHubspotDetailById": removed_hubspot_detail_by_id,
         "leads": qualified_for_return.to_dicts() if include_leads else [],
         "qualifiedDf": qualified_for_return if include_dataframe else None,
         "columns": output_columns,
@@ -3128,8 +4330,6 @@ async def _finalize_paused_run(
             removed_filter_ids.add(row_id)
             removed_filter_reason_by_id.setdefault(row_id, "paused_unprocessed")
         warnings.append("Qualification was finished from paused state. Unprocessed rows were auto-disqualified.")
-    else:
-        unresolved_ids = set()
 
     if qualified_ids:
         working = df_with_id.filter(pl.col("__row_id").is_in(sorted(qualified_ids)))
@@ -3138,49 +4338,21 @@ async def _finalize_paused_run(
 
     deduped, dedupe_info = apply_hubspot_dedupe(working, dedupe_raw=session.get("dedupeRaw"), dedupe_df=dedupe_df)
     warnings.extend(dedupe_info.get("warnings", []))
-    removed_hubspot_detail_by_id = {
-        int(k): v
-        for k, v in dict(dedupe_info.get("removedDetailsByRowId") or {}).items()
-        if str(k).isdigit() and isinstance(v, dict)
-    }
+    removed_hubspot_detail_by_id = dict(dedupe_info.get("removedDetailsByRowId") or {})
 
     pre_dedupe_ids = set(working["__row_id"].to_list())
     qualified_ids = set(deduped["__row_id"].to_list())
     removed_hubspot_ids.update(pre_dedupe_ids - qualified_ids)
 
-    rows = []
-    for row in df_with_id.to_dicts():
-        row_id = int(row.pop("__row_id"))
-        if row_id in qualified_ids:
-            row_status = "qualified"
-            row_reasons = ["qualified_passed_all_checks"]
-        elif row_id in removed_filter_ids:
-            row_status = "removed_filter"
-            row_reasons = [str(removed_filter_reason_by_id.get(row_id, "rule_filter_mismatch"))]
-        elif row_id in removed_domain_ids:
-            row_status = "removed_domain"
-            domain_detail = removed_domain_reason_by_id.get(row_id, "unreachable")
-            row_reasons = [f"domain_{domain_detail}".replace("/", "_").replace(" ", "_").replace(":", "_")]
-        elif row_id in removed_hubspot_ids:
-            row_status = "removed_hubspot"
-            row_reasons = ["hubspot_duplicate_match"]
-        elif row_id in unresolved_ids:
-            row_status = "removed_filter"
-            row_reasons = ["paused_unprocessed"]
-        else:
-            row_status = "removed_filter"
-            row_reasons = [str(removed_filter_reason_by_id.get(row_id, "rule_filter_mismatch"))]
-
-        row_payload = {
-            **row,
-            "_rowId": row_id,
-            "_rowStatus": row_status,
-            "_rowReasons": row_reasons,
-        }
-        dedupe_match = removed_hubspot_detail_by_id.get(row_id)
-        if isinstance(dedupe_match, dict):
-            row_payload["_dedupeMatch"] = dedupe_match
-        rows.append(row_payload)
+    # Unresolved rows were folded into removed_filter_ids above (reason
+    # "paused_unprocessed"), so the standard status precedence applies.
+    rows = _build_row_taxonomy(
+        _build_row_status_frame(
+            df_with_id, qualified_ids, removed_filter_ids, removed_filter_reason_by_id,
+            removed_domain_ids, removed_domain_reason_by_id, removed_hubspot_ids,
+        ),
+        removed_hubspot_detail_by_id,
+    )
 
     _internal_cols_bg = {"__row_id", "__domain_key"}
     qualified_for_return = deduped.drop([c for c in _internal_cols_bg if c in deduped.columns])
@@ -3249,7 +4421,7 @@ async def _finalize_paused_run(
         "totalRows": total_rows,
         "qualifiedCount": result["qualifiedCount"],
         "removedCount": result["removedCount"],
-        "removedBreakdown": removed_breakdown,
+        "removedBreakdown": dict(removed_breakdown),
         "warnings": warnings,
         "domainResults": domain_results,
         "error": "",
@@ -3355,7 +4527,7 @@ async def _run_session_qualification_job(
             "removedDomainReasonById": dict(removed_domain_reason_by_id),
             "qualifiedCount": len(current_qualified_ids),
             "removedCount": removed_filter_count + len(removed_domain_ids) + removed_intra_dedupe_count,
-            "removedBreakdown": removed_breakdown,
+            "removedBreakdown": dict(removed_breakdown),
             "domainResults": {
                 "checked": int(domain_checked_count),
                 "homepageChecked": int(homepage_checked_count),
@@ -3426,16 +4598,10 @@ async def _run_session_qualification_job(
                 processedRows=0,
                 totalRows=total_rows,
             )
-            df_bl = df.with_row_count("__bl_row_id")
-            domain_vals = df_bl[domain_field].cast(pl.Utf8).to_list()
-            keep_mask = []
-            for raw_val in domain_vals:
-                host = normalize_domain_key(str(raw_val or ""))
-                match = is_blocked_domain(host, blocked_domain_suffixes)
-                keep_mask.append(match is None)
-            blocklist_removed_count = sum(1 for k in keep_mask if not k)
+            blocked_mask = match_blocked_domain_series(df[domain_field], blocked_domain_suffixes).is_not_null()
+            blocklist_removed_count = int(blocked_mask.sum())
             if blocklist_removed_count > 0:
-                df = df_bl.filter(pl.Series(keep_mask)).drop("__bl_row_id")
+                df = df.filter(~blocked_mask)
                 total_rows = df.height
                 _update_run(
                     stage="blocklist",
@@ -3580,8 +4746,13 @@ async def _run_session_qualification_job(
                 ):
                     return
 
+            unique_domains: list[str] = []
+            if domain_check or homepage_check:
+                df_with_id, working = _attach_domain_keys(df_with_id, working, domain_field)
+                unique_domains = _collect_unique_normalized_domains(working[domain_field], working["__domain_key"])
+
+            homepage_domains = unique_domains
             if domain_check:
-                unique_domains = _collect_unique_normalized_domains(working[domain_field].cast(pl.Utf8).to_list())
                 if tld_filter_enabled:
                     domain_checked_count = max(domain_checked_count, len(unique_domains))
                 else:
@@ -3594,11 +4765,10 @@ async def _run_session_qualification_job(
                 )
 
                 domain_rows_by_key: dict[str, set[int]] = {}
-                for item in working.select(["__row_id", domain_field]).to_dicts():
-                    key = normalize_domain_key(str(item.get(domain_field) or ""))
+                for row_id, key in working.select(["__row_id", "__domain_key"]).iter_rows():
                     if not key:
                         continue
-                    domain_rows_by_key.setdefault(key, set()).add(int(item["__row_id"]))
+                    domain_rows_by_key.setdefault(key, set()).add(int(row_id))
                 await asyncio.sleep(0)  # yield to serve progress polling
 
                 domain_live_removed = set(removed_domain_ids)
@@ -3694,8 +4864,9 @@ async def _run_session_qualification_job(
                 pre_domain = _build_resolved_ips_columns(working, domain_field, domain_results)
                 df_with_id = _build_resolved_ips_columns(df_with_id, domain_field, domain_results)
 
-                alive_mask = _build_domain_alive_mask(pre_domain, domain_field, domain_results)
+                alive_mask = _build_domain_alive_mask(pre_domain, domain_results)
                 working = pre_domain.filter(alive_mask)
+                homepage_domains = _live_domain_keys(unique_domains, domain_results)
                 removed_domain_count = len(removed_domain_ids)
 
                 post_domain_ids = set(working["__row_id"].to_list())
@@ -3703,13 +4874,11 @@ async def _run_session_qualification_job(
                 removed_domain_ids.update(dns_removed_ids)
                 removed_domain_count = len(removed_domain_ids)
 
-                removed_dns_df = _normalize_domain_col(pre_domain.filter(~alive_mask), domain_field)
-                for item in removed_dns_df.select(["__row_id", "__domain_key"]).to_dicts():
-                    status = domain_results.get(item["__domain_key"] or "", {}).get("status", "unreachable")
-                    removed_domain_reason_by_id[int(item["__row_id"])] = status
+                removed_domain_reason_by_id.update(_removed_reason_by_row_id(
+                    pre_domain.filter(~alive_mask), domain_results, "status", "unreachable"
+                ))
 
             if homepage_check:
-                homepage_domains = _collect_unique_normalized_domains(working[domain_field].cast(pl.Utf8).to_list())
                 homepage_checked_count = len(homepage_domains)
 
                 _update_run(
@@ -3728,11 +4897,10 @@ async def _run_session_qualification_job(
                     )
 
                 homepage_rows_by_key: dict[str, set[int]] = {}
-                for item in working.select(["__row_id", domain_field]).to_dicts():
-                    key = normalize_domain_key(str(item.get(domain_field) or ""))
+                for row_id, key in working.select(["__row_id", "__domain_key"]).iter_rows():
                     if not key:
                         continue
-                    homepage_rows_by_key.setdefault(key, set()).add(int(item["__row_id"]))
+                    homepage_rows_by_key.setdefault(key, set()).add(int(row_id))
 
                 homepage_live_removed = set(removed_domain_ids)
                 homepage_live_reason = dict(removed_domain_reason_by_id)
@@ -3821,7 +4989,7 @@ async def _run_session_qualification_job(
                 pre_homepage = _build_homepage_signal_columns(working, domain_field, homepage_results)
                 df_with_id = _build_homepage_signal_columns(df_with_id, domain_field, homepage_results)
 
-                homepage_mask = _build_homepage_alive_mask(pre_homepage, domain_field, homepage_results)
+                homepage_mask = _build_homepage_alive_mask(pre_homepage, homepage_results)
                 working = pre_homepage.filter(homepage_mask)
                 removed_domain_count = len(removed_domain_ids)
 
@@ -3830,10 +4998,9 @@ async def _run_session_qualification_job(
                 removed_domain_ids.update(homepage_removed_ids)
                 removed_domain_count = len(removed_domain_ids)
 
-                removed_hp_df = _normalize_domain_col(pre_homepage.filter(~homepage_mask), domain_field)
-                for item in removed_hp_df.select(["__row_id", "__domain_key"]).to_dicts():
-                    status = homepage_results.get(item["__domain_key"] or "", {}).get("homepage_status", "homepage_disqualified")
-                    removed_domain_reason_by_id[int(item["__row_id"])] = status
+                removed_domain_reason_by_id.update(_removed_reason_by_row_id(
+                    pre_homepage.filter(~homepage_mask), homepage_results, "homepage_status", "homepage_disqualified"
+                ))
         elif domain_check or homepage_check or tld_filter_enabled:
             warnings.append(
                 "Domain verification, homepage checks, or TLD filtering was enabled, but the selected website column was unavailable."
@@ -3869,11 +5036,7 @@ async def _run_session_qualification_job(
         pre_dedupe_ids = set(working["__row_id"].to_list())
         qualified_ids = set(deduped["__row_id"].to_list())
         removed_hubspot_ids = pre_dedupe_ids - qualified_ids
-        removed_hubspot_detail_by_id = {
-            int(k): v
-            for k, v in dict(dedupe_info.get("removedDetailsByRowId") or {}).items()
-            if str(k).isdigit() and isinstance(v, dict)
-        }
+        removed_hubspot_detail_by_id = dict(dedupe_info.get("removedDetailsByRowId") or {})
 
         _update_run(
             stage="finalizing",
@@ -3894,9 +5057,11 @@ async def _run_session_qualification_job(
 
         rows = []
         rows = _build_row_taxonomy(
-            df_with_id, qualified_ids, removed_filter_ids, removed_filter_reason_by_id,
-            removed_domain_ids, removed_domain_reason_by_id, removed_hubspot_ids,
-            {int(k): v for k, v in dict(dedupe_info.get("removedDetailsByRowId") or {}).items() if str(k).isdigit()},
+            _build_row_status_frame(
+                df_with_id, qualified_ids, removed_filter_ids, removed_filter_reason_by_id,
+                removed_domain_ids, removed_domain_reason_by_id, removed_hubspot_ids,
+            ),
+            dict(dedupe_info.get("removedDetailsByRowId") or {}),
         )
 
         _internal_cols_job = {"__row_id", "__domain_key"}
@@ -3956,11 +5121,7 @@ async def _run_session_qualification_job(
                 "removedDomainIds": removed_domain_ids,
                 "removedHubspotIds": removed_hubspot_ids,
                 "removedDomainReasonById": removed_domain_reason_by_id,
-                "removedHubspotDetailById": {
-                    int(k): v
-                    for k, v in dict(dedupe_info.get("removedDetailsByRowId") or {}).items()
-                    if str(k).isdigit() and isinstance(v, dict)
-                },
+                "removedHubspotDetailById": dict(dedupe_info.get("removedDetailsByRowId") or {}),
                 "removedIntraDedupeIds": removed_intra_dedupe_ids,
                 "removedIntraDedupeReasonById": removed_intra_dedupe_reason_by_id,
             }
@@ -3976,7 +5137,7 @@ async def _run_session_qualification_job(
                 "totalRows": total_rows,
                 "qualifiedCount": result["qualifiedCount"],
                 "removedCount": result["removedCount"],
-                "removedBreakdown": removed_breakdown,
+                "removedBreakdown": dict(removed_breakdown),
                 "warnings": warnings,
                 "domainResults": result["domainResults"],
                 "error": "",
@@ -4240,11 +5401,7 @@ async def _run_session_scrape_job(
         normalized_scrape = (
             enriched_df
             .with_columns(
-                pl.col("domain")
-                .cast(pl.Utf8, strict=False)
-                .fill_null("")
-                .map_elements(normalize_domain_key, return_dtype=pl.Utf8)
-                .alias("__scrape_key")
+                normalize_domain_key_series(enriched_df["domain"]).fill_null("").alias("__scrape_key")
             )
             .filter(pl.col("__scrape_key").str.len_chars() > 0)
             .select(["__scrape_key"] + available_source_cols)
@@ -4252,15 +5409,8 @@ async def _run_session_scrape_job(
             .unique(subset=["__scrape_key"], keep="first")
         )
 
-        source_with_key = (
-            df
-            .with_columns(
-                pl.col(resolved_domain_field)
-                .cast(pl.Utf8, strict=False)
-                .fill_null("")
-                .map_elements(normalize_domain_key, return_dtype=pl.Utf8)
-                .alias("__scrape_key")
-            )
+        source_with_key = df.with_columns(
+            normalize_domain_key_series(df[resolved_domain_field]).fill_null("").alias("__scrape_key")
         )
         existing_scrape_cols = [col for col in SCRAPE_ENRICH_COLUMNS if col in source_with_key.columns]
         if existing_scrape_cols:
@@ -4271,7 +5421,7 @@ async def _run_session_scrape_job(
         if not session or not scrape:
             return
 
-        _replace_session_dataframe(session, merged_df)
+        await asyncio.to_thread(_replace_session_dataframe, session_id, session, merged_df)
 
         ok_count = int(
             enriched_df
@@ -4351,21 +5501,59 @@ PARKED_INDICATORS = [
     "coming soon", "under construction", "page not found",
 ]
 
+@lru_cache(maxsize=1)
+def _insecure_ssl_context() -> ssl.SSLContext:
+    ssl_ctx = ssl.create_default_context()
+    ssl_ctx.check_hostname = False
+    ssl_ctx.verify_mode = ssl.CERT_NONE
+    return ssl_ctx
+
+
+# Shared c-ares resolver for domain checks. Connectors don't close resolvers
+# they were handed, so it lives until close_domain_check_resolver() at shutdown.
+_DOMAIN_CHECK_RESOLVER: Optional[aiohttp.AsyncResolver] = None
+
+
+def _get_domain_check_resolver() -> Optional[aiohttp.AsyncResolver]:
+    global _DOMAIN_CHECK_RESOLVER
+    if _DOMAIN_CHECK_RESOLVER is None:
+        try:
+            _DOMAIN_CHECK_RESOLVER = aiohttp.AsyncResolver()
+        except Exception:
+            return None
+    return _DOMAIN_CHECK_RESOLVER
+
+
+async def close_domain_check_resolver() -> None:
+    global _DOMAIN_CHECK_RESOLVER
+    resolver, _DOMAIN_CHECK_RESOLVER = _DOMAIN_CHECK_RESOLVER, None
+    if resolver is not None:
+        await resolver.close()
+
+
+def _build_domain_check_connector(concurrency: int) -> aiohttp.TCPConnector:
+    """TCP connector with c-ares DNS when aiodns is installed, threaded getaddrinfo otherwise."""
+    return aiohttp.TCPConnector(
+        limit=concurrency,
+        use_dns_cache=True,
+        ttl_dns_cache=300,
+        resolver=_get_domain_check_resolver(),
+    )
+
+
 async def check_single_domain(session: aiohttp.ClientSession, domain: str, timeout: int = 6) -> dict:
     """
     Check if a single domain is alive. Uses HEAD first (fast), falls back to GET.
     Returns {domain, alive: bool, status: str}.
     """
-    if not domain or domain.lower() in ("unknown", "n/a", "none", ""):
+    if not domain or domain.lower() in _NO_DOMAIN_VALUES:
         return {"domain": domain, "alive": False, "status": "no domain"}
 
     clean = normalize_domain(domain)
     if not clean or "." not in clean:
         return {"domain": domain, "alive": False, "status": "invalid"}
 
-    ssl_ctx = ssl.create_default_context()
-    ssl_ctx.check_hostname = False
-    ssl_ctx.verify_mode = ssl.CERT_NONE
+    ssl_ctx = _insecure_ssl_context()
 
     for proto in ["https", "http"]:
         url = f"{proto}://{clean}"
@@ -4404,14 +5592,15 @@ async def check_domains_batch(domains: list[str], concurrency: int = 20, timeout
     Uses a semaphore to limit concurrency and avoid overwhelming the network.
     """
     sem = asyncio.Semaphore(concurrency)
-    connector = aiohttp.TCPConnector(limit=concurrency, ttl_dns_cache=300)
+    connector = _build_domain_check_connector(concurrency)
 
     async def bounded_check(session, domain):
         async with sem:
             return await check_single_domain(session, domain, timeout)
 
     async with aiohttp.ClientSession(connector=connector, headers=HEADERS) as session:
-        tasks = [bounded_check(session, d) for d in domains]
+        # Results are keyed by domain, so repeated domains are only checked once.
+        tasks = [bounded_check(session, d) for d in dict.fromkeys(domains)]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
     out = {}
@@ -4781,11 +5970,9 @@ def apply_rules(df: pl.DataFrame, rules: list[dict]) -> pl.DataFrame:
             if not values:
                 continue
             normalized_targets = {normalize_country(v) for v in values}
-            mask = df[field].cast(pl.Utf8, strict=False).fill_null("").map_elements(
-                lambda x, targets=normalized_targets: normalize_country(x) in targets,
-                return_dtype=pl.Boolean,
+            df = df.filter(
+                normalize_country_expr(pl.col(field).cast(pl.Utf8, strict=False)).is_in(list(normalized_targets))
             )
-            df = df.filter(mask)
 
     return df
 
@@ -4941,12 +6128,12 @@ async def create_blank_session(name: str = Form("Untitled")):
     """Create a new blank session with a name."""
     clean_name = str(name or "Untitled").strip() or "Untitled"
     _clean_stale_sessions()
-    sid = uuid4().hex
+    sid = secrets.token_hex(16)
     now = time.time()
     empty_df = pl.DataFrame()
     SESSION_STORE[sid] = {
         "csvRaw": None,
-        "dfParquet": None,
+        "dfParquetPath": None,
         "df": empty_df,
         "fileName": clean_name,
         "sourceFileNames": [],
@@ -4972,6 +6159,7 @@ async def create_blank_session(name: str = Form("Untitled")):
         "createdAt": now,
         "updatedAt": now,
     }
+    _schedule_session_expiry(sid, now)
     _persist_session(sid, SESSION_STORE[sid])
     payload = _build_session_payload(sid, SESSION_STORE[sid])
     return payload
@@ -4992,11 +6180,9 @@ async def rename_session(sessionId: str = Form(...), name: str = Form(...)):
 
 @app.delete("/api/session/{sessionId}")
 async def delete_session(sessionId: str):
-    """Delete a session and its persisted pickle."""
+    """Delete a session and its persisted snapshot."""
     SESSION_STORE.pop(sessionId, None)
-    persist_path = _session_persist_path(sessionId)
-    if persist_path.exists():
-        persist_path.unlink(missing_ok=True)
+    _delete_persisted_session(sessionId)
     return {"sessionId": sessionId, "deleted": True}
 
 
@@ -5097,7 +6283,7 @@ async def session_set_dedupe(
 ):
     """Attach (append) or clear HubSpot dedupe files for an existing session."""
     session = _touch_session(sessionId)
-    source_df = _get_session_df(session)
+    source_columns = _session_df_columns(session)
     dedupe_uploads = _resolve_upload_files(dedupeFiles, dedupeFile)
     if not dedupe_uploads:
         _set_session_dedupe(sessionId, None, None, None, dedupe_raws=[], dedupe_file_names=[], dedupe_mapping=[], dedupe_source_rows=0)
@@ -5124,7 +6310,7 @@ async def session_set_dedupe(
         dedupe_mapping=dedupe_mapping,
         dedupe_source_rows=dedupe_input_rows,
     )
-    inferred_matches = infer_dedupe_matches(source_df.columns, dedupe_df.columns)
+    inferred_matches = infer_dedupe_matches(source_columns, dedupe_df.columns)
     primary_match = inferred_matches[0] if inferred_matches else {"sourceColumn": None, "hubspotColumn": None, "keyType": None}
     return {
         "sessionId": sessionId,
@@ -5156,11 +6342,10 @@ async def session_column_values(
 ):
     """Return distinct individual values from a multi-value column, with occurrence counts."""
     session = _touch_session(sessionId)
-    df = _get_session_df(session)
-    if column not in df.columns:
+    if column not in _session_df_columns(session):
         raise HTTPException(status_code=400, detail=f"Column '{column}' not found")
 
-    utf = df[column].cast(pl.Utf8, strict=False).drop_nulls()
+    utf = _get_session_column(session, column).cast(pl.Utf8, strict=False).drop_nulls()
     # Split each cell by separator, explode, trim, and count
     counts: dict[str, int] = {}
     for cell in utf.to_list():
@@ -5283,6 +6468,7 @@ async def session_dedupe_preview(
         _, hubspot_info = apply_hubspot_dedupe(
             df,
             dedupe_df=dedupe_df,
+            collect_details=False,
         )
         hubspot_result["enabled"] = hubspot_info.get("enabled", False)
         hubspot_result["wouldRemove"] = hubspot_info.get("removedCount", 0)
@@ -5472,10 +6658,22 @@ async def session_rows(
         else None
     )
     status_source = running_run or session.get("lastRunStatus")
+    # Finished runs resolve through a cached per-row table; in-flight runs keep
+    # changing, so they are resolved row by row.
+    finished_lookup = (
+        _session_run_lookup(session, status_source)
+        if running_run is None and isinstance(status_source, dict)
+        else None
+    )
 
     for item in page_df.to_dicts():
         row_id = int(item.pop("__row_id"))
-        row_status, row_reasons, dedupe_match = _resolve_row_annotation(row_id, status_source)
+        if finished_lookup is not None:
+            row_status, row_reasons, dedupe_match = (
+                _annotation_from_lookup(finished_lookup, row_id) or _resolve_row_annotation(row_id, status_source)
+            )
+        else:
+            row_status, row_reasons, dedupe_match = _resolve_row_annotation(row_id, status_source)
         row_payload = {
             **item,
             "_rowId": row_id,
@@ -5520,7 +6718,7 @@ async def session_scrape_start(
     if not resolved_domain_field:
         raise HTTPException(status_code=400, detail="Select a valid domain/website column before starting scraper enrichment.")
 
-    scrape_id = uuid4().hex
+    scrape_id = secrets.token_hex(16)
     now = time.time()
     output_dir = SCRAPE_JOB_DIR / sessionId / scrape_id
     session["activeScrape"] = {
@@ -5658,7 +6856,7 @@ async def session_qualify_start(
         payload["alreadyRunning"] = True
         return payload
 
-    run_id = uuid4().hex
+    run_id = secrets.token_hex(16)
     now = time.time()
     session["activeRun"] = {
         "runId": run_id,
@@ -5854,7 +7052,7 @@ async def session_qualify_resume(sessionId: str = Form(...)):
     custom_blocked = run_config.get("customBlockedDomains") or []
     df = _get_session_df(session)
 
-    run_id = uuid4().hex
+    run_id = secrets.token_hex(16)
     now = time.time()
     session["activeRun"] = {
         "runId": run_id,
@@ -6028,11 +7226,11 @@ async def session_qualify(
             },
         }
 
-        status_sets = _build_status_sets_from_rows(pipeline["rows"])
+        status_sets = _build_status_sets_from_df(pipeline["rowStatusDf"], pipeline["removedHubspotDetailById"])
         session["lastRunResult"] = result
         session["lastRunStatus"] = status_sets
         session["activeRun"] = {
-            "runId": uuid4().hex,
+            "runId": secrets.token_hex(16),
             "status": "done",
             "stage": "complete",
             "progress": 1.0,
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Parity tests for compute_lead_scores.
+Compares the vectorized scorer against the original per-row formula,
+including totals that land exactly on .5 before rounding.
+"""
+
+import json
+import random
+from datetime import datetime, timezone
+
+import polars as pl
+
+from server import _safe_parse_iso_datetime, compute_lead_scores, detect_multivalue_columns
+
+
+def _reference_lead_scores(df: pl.DataFrame, config: dict) -> tuple[list[int], list[str]]:
+    """The original row-at-a-time scoring loop."""
+    weights = config.get("scoreWeights") or {}
+    w_richness = float(weights.get("richness", 25))
+    w_diversity = float(weights.get("diversity", 25))
+    w_recency = float(weights.get("recency", 20))
+    w_domain = float(weights.get("domain", 15))
+    w_signal = float(weights.get("signal", 15))
+    total_w = max(w_richness + w_diversity + w_recency + w_domain + w_signal, 1)
+
+    data_cols = [c for c in df.columns if not c.startswith("_")]
+    num_cols = max(len(data_cols), 1)
+    mv_cols = detect_multivalue_columns(df)
+    date_field = str(config.get("scoreDateField") or "").strip()
+    has_date_field = date_field and date_field in df.columns
+    signal_config = config.get("scoreHighSignalConfig") or {}
+    signal_col = str(signal_config.get("column") or "").strip()
+    signal_values = [str(v).strip().lower() for v in (signal_config.get("values") or []) if str(v).strip()]
+    has_signal = signal_col and signal_col in df.columns and signal_values
+
+    scores = []
+    breakdowns = []
+    for row in df.iter_rows(named=True):
+        filled = sum(1 for c in data_cols if row.get(c) is not None and str(row.get(c, "")).strip())
+        richness_pts = filled / num_cols * w_richness
+
+        mv_count = 0
+        for mc, sep in mv_cols.items():
+            val = row.get(mc)
+            if val:
+                mv_count += len([p.strip() for p in str(val).split(sep) if p.strip()])
+        diversity_pts = (min(mv_count / 20, 1.0) if mv_cols else 0) * w_diversity
+
+        recency_pts = 0.0
+        if has_date_field:
+            date_val = row.get(date_field)
+            parsed = _safe_parse_iso_datetime(str(date_val)) if date_val else None
+            if parsed:
+                if parsed.tzinfo is None:
+                    parsed = parsed.replace(tzinfo=timezone.utc)
+                days_ago = max((datetime.now(timezone.utc) - parsed).days, 0)
+                recency_pts = max(1.0 - (days_ago / 730), 0) * w_recency
+
+        domain_pts = 0.0
+        if row.get("_domain_status") or row.get("__domain_live"):
+            domain_pts = w_domain
+        elif not has_date_field:
+            domain_pts = w_domain * 0.5
+
+        signal_pts = 0.0
+        if has_signal:
+            cell_val = str(row.get(signal_col) or "").lower()
+            matched = sum(1 for sv in signal_values if sv in cell_val)
+            signal_pts = min(matched / max(len(signal_values), 1), 1.0) * w_signal
+
+        raw_score = richness_pts + diversity_pts + recency_pts + domain_pts + signal_pts
+        scores.append(round(min(raw_score / total_w * 100, 100)))
+        breakdowns.append(json.dumps({
+            "richness": round(richness_pts / max(w_richness, 0.01) * 100),
+            "diversity": round(diversity_pts / max(w_diversity, 0.01) * 100),
+            "recency": round(recency_pts / max(w_recency, 0.01) * 100),
+            "domain": round(domain_pts / max(w_domain, 0.01) * 100),
+            "signal": round(signal_pts / max(w_signal, 0.01) * 100),
+        }))
+    return scores, breakdowns
+
+
+def _assert_parity(df: pl.DataFrame, config: dict) -> None:
+    scored = compute_lead_scores(df, config)
+    expected_scores, expected_breakdowns = _reference_lead_scores(df, config)
+    assert scored["_lead_score"].to_list() == expected_scores
+    assert scored["_score_breakdown"].to_list() == expected_breakdowns
+
+
+def test_half_point_totals():
+    """Totals that land exactly on .5 round half-to-even like the row loop."""
+    # 8.5 / 20 * 100 == 42.5 -> 42
+    df = pl.DataFrame({"Company": ["Acme", "Beta"], "_domain_status": [None, None]})
+    config = {"scoreWeights": {"richness": 5, "diversity": 5, "recency": 0, "domain": 7, "signal": 3}}
+    _assert_parity(df, config)
+    assert compute_lead_scores(df, config)["_lead_score"].to_list() == [42, 42]
+
+    # 5 data columns, 3 filled
+    df = pl.DataFrame({
+        "a": ["x"], "b": ["y"], "c": ["z"], "d": [None], "e": [""],
+        "_domain_status": [None],
+    })
+    _assert_parity(df, {"scoreWeights": {"richness": 15, "recency": 15, "diversity": 5}})
+
+
+def test_randomized_parity():
+    """Random frames and weights score identically to the row loop."""
+    rng = random.Random(7)
+    cells = [None, "", " ", "x", " y ", "a; b; c", "Acme Corp"]
+    weight_choices = [0, 3, 5, 7, 10, 15, 20, 25]
+    for _ in range(400):
+        n = rng.randint(1, 25)
+        data = {f"c{i}": [rng.choice(cells) for _ in range(n)] for i in range(rng.randint(1, 7))}
+        data["_domain_status"] = [rng.choice([None, "", "live"]) for _ in range(n)]
+        if rng.random() < 0.5:
+            data["Last Activity"] = [
+                rng.choice([None, "", "bad", "2025-06-30", "2024-12-12T10:00:00", "2019-01-01"])
+                for _ in range(n)
+            ]
+        config = {
+            "scoreWeights": {
+                key: rng.choice(weight_choices)
+                for key in ("richness", "diversity", "recency", "domain", "signal")
+            },
+            "scoreDateField": "Last Activity" if "Last Activity" in data else "",
+            "scoreHighSignalConfig": {
+                "column": "c0",
+                "values": rng.sample(["x", "y", "a", "acme"], rng.randint(0, 3)),
+            },
+        }
+        _assert_parity(pl.DataFrame(data), config)
+
+
+if __name__ == "__main__":
+    test_half_point_totals()
+    test_randomized_parity()
+    print("✓ Lead score parity tests passed!")
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Parity tests for the column-wise domain/dedupe helpers.
+Each vectorized path is checked against the scalar helper or the original
+row-at-a-time logic it replaced.
+"""
+
+import random
+
+import numpy as np
+import polars as pl
+from rapidfuzz import fuzz
+
+from server import (
+    _TLD_BLANK_VALUES,
+    _apply_domain_tld_filter,
+    _build_row_status_frame,
+    _evaluate_tld_filter,
+    _extract_normalized_keys,
+    apply_hubspot_dedupe,
+    apply_intra_dedupe,
+    is_blocked_domain,
+    match_blocked_domain_series,
+    normalize_domain_key,
+    normalize_domain_key_series,
+)
+
+DOMAIN_VALUES = [
+    None,
+    "",
+    "   ",
+    "acme.com",
+    "ACME.com",
+    " acme.com ",
+    "www.acme.com",
+    "https://www.acme.com/about?x=1#top",
+    "http://app.acme.com:8080/login",
+    "ftp://files.acme.co.uk",
+    "HTTPS://Blog.Acme.IO/",
+    "user:pass@mail.acme.com",
+    "https://user@portal.acme.de:443",
+    "ww2.beta.org",
+    "www2.beta.org.",
+    ".gamma.net.",
+    "m.delta.co",
+    "web.delta.co?ref=1",
+    "acme .com",
+    "acme.com/a b",
+    "no-tld",
+    "localhost:3000",
+    "[::1]",
+    "http://[2001:db8::1]/x",
+    "bücher.de",
+    "https://www.bücher.de/shop",
+    "acme .com",
+    "tab\tacme.com",
+    "unknown",
+    "N/A",
+    "shop.example.ca",
+    "example.com.au",
+    "news.gov.uk",
+    "sub.blocked.example",
+    "notblocked.example.org",
+]
+
+
+def test_normalize_domain_key_series_parity():
+    """Column-wise normalization matches normalize_domain_key row by row."""
+    values = pl.Series("Website", DOMAIN_VALUES, dtype=pl.Utf8)
+    keys = normalize_domain_key_series(values)
+    assert keys.name == "Website"
+    for raw, key in zip(DOMAIN_VALUES, keys.to_list()):
+        if raw is None:
+            assert key is None
+        else:
+            assert key == normalize_domain_key(raw), raw
+
+
+def test_match_blocked_domain_series_parity():
+    """Blocked-suffix matches agree with is_blocked_domain, first-listed suffix winning."""
+    blocked = ["example", "blocked.example", "acme.com", "co.uk", "acme.com", "de"]
+    values = pl.Series("Website", DOMAIN_VALUES, dtype=pl.Utf8)
+    matches = match_blocked_domain_series(values, blocked).to_list()
+    for raw, match in zip(DOMAIN_VALUES, matches):
+        expected = is_blocked_domain(normalize_domain_key(raw), blocked) if raw is not None else None
+        assert match == expected, raw
+    assert match_blocked_domain_series(values, []).null_count() == values.len()
+
+
+def test_apply_domain_tld_filter_parity():
+    """TLD filtering keeps/removes the same rows with the same reasons as _evaluate_tld_filter."""
+    rng = random.Random(11)
+    cases = [
+        ({".uk", ".de"}, set(), False),
+        ({".co.uk", "uk"}, {".gov.uk"}, False),
+        (set(), {".ca"}, True),
+        ({".com"}, {".acme.com"}, True),
+    ]
+    for disallowed, allowed, exclude_cc in cases:
+        column = [rng.choice(DOMAIN_VALUES) for _ in range(200)]
+        df = pl.DataFrame({"Website": column}, schema={"Website": pl.Utf8}).with_row_index("__row_id")
+        filtered, removed, checked, dead, reasons = _apply_domain_tld_filter(
+            df, "Website", disallowed, allowed, exclude_cc
+        )
+
+        expected_keep: list[int] = []
+        expected_reasons: dict[int, str] = {}
+        expected_dead: set[tuple[str, str]] = set()
+        checked_values: set[str] = set()
+        for row_id, value in enumerate(column):
+            if value is None or value.strip().lower() in _TLD_BLANK_VALUES:
+                expected_keep.append(row_id)
+                continue
+            checked_values.add(value)
+            keep, code, status = _evaluate_tld_filter(value, disallowed, allowed, exclude_cc)
+            if keep:
+                expected_keep.append(row_id)
+            else:
+                expected_reasons[row_id] = code
+                expected_dead.add((value, status))
+
+        assert filtered["__row_id"].to_list() == expected_keep
+        assert removed == len(column) - len(expected_keep)
+        assert checked == len(checked_values)
+        assert reasons == expected_reasons
+        assert {(item["domain"], item["status"]) for item in dead} == expected_dead
+
+
+def _reference_row_status(row_ids, qualified, removed_filter, filter_reasons, removed_domain, domain_reasons, removed_hubspot):
+    """The original per-row status/reason loop."""
+    out = []
+    for rid in row_ids:
+        if rid in qualified:
+            out.append(("qualified", "qualified_passed_all_checks"))
+        elif rid in removed_filter:
+            out.append(("removed_filter", str(filter_reasons.get(rid, "rule_filter_mismatch"))))
+        elif rid in removed_domain:
+            detail = domain_reasons.get(rid, "unreachable")
+            out.append(("removed_domain", f"domain_{detail}".replace("/", "_").replace(" ", "_").replace(":", "_")))
+        elif rid in removed_hubspot:
+            out.append(("removed_hubspot", "hubspot_duplicate_match"))
+        else:
+            out.append(("removed_filter", str(filter_reasons.get(rid, "rule_filter_mismatch"))))
+    return out
+
+
+def test_build_row_status_frame_parity():
+    """Status/reason columns match the original precedence for set and array id inputs."""
+    rng = random.Random(5)
+    n = 300
+    df = pl.DataFrame({
+        "Company": [f"c{i}" for i in range(n)],
+        "__domain_key": ["k"] * n,
+    }).with_row_index("__row_id")
+    row_ids = list(range(n))
+    qualified = set(rng.sample(row_ids, 80))
+    removed_filter = set(rng.sample(row_ids, 60))
+    removed_domain = set(rng.sample(row_ids, 60))
+    removed_hubspot = set(rng.sample(row_ids, 60))
+    filter_reasons = {rid: rng.choice(["missing_value", "rule_a"]) for rid in rng.sample(row_ids, 40)}
+    domain_reasons = {rid: rng.choice(["dns: timeout", "http/403", "parked page"]) for rid in rng.sample(row_ids, 40)}
+    expected = _reference_row_status(
+        row_ids, qualified, removed_filter, filter_reasons, removed_domain, domain_reasons, removed_hubspot
+    )
+
+    for as_array in (False, True):
+        ids = [qualified, removed_filter, removed_domain, removed_hubspot]
+        if as_array:
+            ids = [np.array(sorted(group), dtype=np.int64) for group in ids]
+        frame = _build_row_status_frame(df, ids[0], ids[1], filter_reasons, ids[2], domain_reasons, ids[3])
+        assert frame.columns == ["Company", "_rowId", "_rowStatus", "_rowReasons"]
+        assert frame["_rowId"].to_list() == row_ids
+        got = [(status, reasons[0]) for status, reasons in zip(frame["_rowStatus"], frame["_rowReasons"].to_list())]
+        assert got == expected
+
+
+def _reference_intra_keep(column: list, key_class: str, strategy: str) -> list[int]:
+    keys = ["|".join(_extract_normalized_keys(v, key_class)) if v else "" for v in column]
+    order = range(len(keys)) if strategy == "first" else range(len(keys) - 1, -1, -1)
+    seen: set[str] = set()
+    kept: set[int] = set()
+    for idx in order:
+        if not keys[idx]:
+            kept.add(idx)
+        elif keys[idx] not in seen:
+            seen.add(keys[idx])
+            kept.add(idx)
+    return sorted(kept)
+
+
+def test_apply_intra_dedupe_parity():
+    """first/last keep the rows the scalar key extractor picks; merge keeps one row per key."""
+    rng = random.Random(3)
+    emails = [None, "", "a@acme.com", "A@Acme.com", "b@beta.io; a@acme.com", "a@acme.com, b@beta.io", "bad"]
+    for key_col, pool, key_class in (
+        ("Website", DOMAIN_VALUES, "domain"),
+        ("Email", emails, "email"),
+        ("Company Name", [None, "", "Acme, Inc.", "acme inc", "Beta LLC", "Über GmbH"], "company"),
+    ):
+        column = [rng.choice(pool) for _ in range(150)]
+        df = pl.DataFrame({key_col: column, "Tags": [rng.choice(["x; y", "y; z", None]) for _ in column]},
+                          schema={key_col: pl.Utf8, "Tags": pl.Utf8}).with_row_index("pos")
+        for strategy in ("first", "last"):
+            result, info = apply_intra_dedupe(df, [key_col], strategy)
+            expected = _reference_intra_keep(column, key_class, strategy)
+            assert result["pos"].to_list() == expected
+            assert info["removedCount"] == len(column) - len(expected)
+
+        merged, info = apply_intra_dedupe(df, [key_col], "merge")
+        keys = ["|".join(_extract_normalized_keys(v, key_class)) if v else "" for v in column]
+        expected_height = len({k for k in keys if k}) + sum(1 for k in keys if not k)
+        assert merged.height == expected_height
+        assert merged.columns == df.columns
+        assert merged["pos"].to_list() == sorted(merged["pos"].to_list())
+
+
+def _reference_hubspot_removed(source: pl.DataFrame, hubspot: pl.DataFrame, matches: list[dict]) -> tuple[list[int], dict]:
+    """Original apply_hubspot_dedupe mask and detail logic, row at a time."""
+    strong_present = [False] * source.height
+    strong_hit = [False] * source.height
+    company_hit = [False] * source.height
+    refs_by_class: dict[str, dict[str, dict]] = {}
+    for match in matches:
+        key_class = match["keyType"]
+        origins: dict[str, dict] = {}
+        for col in match["hubspotColumns"]:
+            for value in hubspot[col].cast(pl.Utf8).drop_nulls().to_list():
+                for key in _extract_normalized_keys(value, key_class):
+                    origins.setdefault(key, {"hubspotColumn": col, "hubspotValue": value[:240]})
+        if not origins:
+            continue
+        refs_by_class[key_class] = origins
+        use_fuzzy = key_class == "company"
+        for idx, row in enumerate(source.iter_rows(named=True)):
+            for col in match["sourceColumns"]:
+                keys = _extract_normalized_keys(row[col], key_class)
+                hit = any(
+                    key in origins or (use_fuzzy and any(fuzz.ratio(key, ref) >= 90.0 for ref in origins))
+                    for key in keys
+                )
+                if key_class == "company":
+                    company_hit[idx] |= hit
+                else:
+                    strong_present[idx] |= bool(keys)
+                    strong_hit[idx] |= hit
+
+    removed = [
+        idx for idx in range(source.height)
+        if strong_hit[idx] or (not strong_present[idx] and company_hit[idx])
+    ]
+    details: dict[int, dict] = {}
+    source_cols = {m["keyType"]: m["sourceColumns"] for m in matches}
+    for idx in removed:
+        row = source.row(idx, named=True)
+        classes = ("domain", "linkedin", "email") if strong_hit[idx] else ("company",)
+        for key_class in classes:
+            origins = refs_by_class.get(key_class)
+            if not origins:
+                continue
+            detail = None
+            for col in source_cols[key_class]:
+                for key in _extract_normalized_keys(row[col], key_class):
+                    if key in origins:
+                        detail = {"keyType": key_class, "sourceColumn": col, "normalizedKey": key,
+                                  "matchMode": "exact", **origins[key]}
+                    elif key_class == "company" and any(fuzz.ratio(key, ref) >= 90.0 for ref in origins):
+                        detail = {"keyType": key_class, "sourceColumn": col, "normalizedKey": key,
+                                  "matchMode": "fuzzy"}
+                    if detail:
+                        break
+                if detail:
+                    break
+            if detail:
+                details[int(row["__row_id"])] = detail
+                break
+    return removed, details
+
+
+def test_apply_hubspot_dedupe_parity():
+    """Removed rows and match details agree with the original per-row matching."""
+    rng = random.Random(17)
+    companies = [None, "", "Acme Inc", "Acme Inc.", "Acme Incorporated", "Beta LLC", "Betta LLC", "Zeta"]
+    sites = [None, "", "acme.com", "www.beta.io", "https://gamma.org/x", "zeta.net", "bücher.de"]
+    emails = [None, "", "a@acme.com", "B@Beta.io", "z@zeta.net; a@acme.com"]
+    linkedins = [None, "", "linkedin.com/company/acme", "https://www.linkedin.com/company/beta/"]
+    for _ in range(10):
+        n = 120
+        source = pl.DataFrame({
+            "Company": [rng.choice(companies) for _ in range(n)],
+            "Website": [rng.choice(sites) for _ in range(n)],
+            "Email": [rng.choice(emails) for _ in range(n)],
+            "LinkedIn URL": [rng.choice(linkedins) for _ in range(n)],
+        }, schema={c: pl.Utf8 for c in ("Company", "Website", "Email", "LinkedIn URL")}).with_row_index("__row_id")
+        hubspot = pl.DataFrame({
+            "Company name": rng.sample(companies[2:], 3),
+            "Company Domain Name": rng.sample(["acme.com", "beta.io", "gamma.org", "q.com", "bücher.de"], 3),
+            "Email": rng.sample(["a@acme.com", "x@y.com", "z@zeta.net"], 2) + [None],
+            "LinkedIn Company Page": rng.sample(
+                ["https://linkedin.com/company/acme", "linkedin.com/company/zz", "linkedin.com/company/beta"], 3
+            ),
+        })
+
+        deduped, info = apply_hubspot_dedupe(source, dedupe_df=hubspot)
+        expected_removed, expected_details = _reference_hubspot_removed(source, hubspot, info["matches"])
+        kept = sorted(set(range(n)) - set(expected_removed))
+        assert deduped["__row_id"].to_list() == kept
+        assert info["removedCount"] == len(expected_removed)
+        assert set(info["removedDetailsByRowId"]) == set(expected_details)
+        for row_id, expected in expected_details.items():
+            detail = info["removedDetailsByRowId"][row_id]
+            for field, value in expected.items():
+                assert detail[field] == value, (row_id, field)
+
+
+if __name__ == "__main__":
+    test_normalize_domain_key_series_parity()
+    test_match_blocked_domain_series_parity()
+    test_apply_domain_tld_filter_parity()
+    test_build_row_status_frame_parity()
+    test_apply_intra_dedupe_parity()
+    test_apply_hubspot_dedupe_parity()
+    print("✓ Vectorized parity tests passed!")